@@ -0,0 +1,72 @@
+"""Compare the single-pass extractor against the previous per-category sweeps.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_extraction [--sizes 1MB 5MB] [--repeat 3]
+"""
+import argparse
+import time
+
+from bs4 import BeautifulSoup
+
+from benchmarks.synthetic import generate_page
+from src.scraping.extractor import extract_page
+
+
+def legacy_extract(soup):
+    """The original multi-sweep extraction, kept here as the baseline"""
+    data = {'title': soup.title.string if soup.title else 'No title', 'classes': {}}
+    for element in soup.find_all(class_=True):
+        for class_name in element.get('class'):
+            info = data['classes'].setdefault(
+                class_name, {'count': 0, 'tag_types': set(), 'sample_content': []})
+            info['count'] += 1
+            info['tag_types'].add(element.name)
+            if len(info['sample_content']) < 3:
+                content = element.get_text().strip()
+                if content:
+                    info['sample_content'].append(content)
+    data['headings'] = [{'level': int(h.name[1]), 'text': h.get_text().strip()}
+                        for h in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])]
+    data['paragraphs'] = [p.get_text().strip() for p in soup.find_all('p')]
+    data['links'] = [{'text': a.get_text().strip(), 'href': a.get('href')}
+                     for a in soup.find_all('a', href=True)]
+    data['images'] = [{'src': img.get('src'), 'alt': img.get('alt', '')}
+                      for img in soup.find_all('img', src=True)]
+    data['forms'] = [{'action': f.get('action', ''), 'method': f.get('method', 'get'),
+                      'inputs': [{'type': i.get('type', 'text'), 'name': i.get('name', ''),
+                                  'id': i.get('id', '')} for i in f.find_all('input')]}
+                     for f in soup.find_all('form')]
+    return data
+
+
+def best_of(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def parse_size(text):
+    units = {'KB': 1024, 'MB': 1024 * 1024}
+    return int(float(text[:-2]) * units[text[-2:].upper()])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['1MB', '2MB', '5MB'])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'size':>8} {'legacy (s)':>12} {'single-pass (s)':>16} {'speedup':>8}")
+    for size in args.sizes:
+        soup = BeautifulSoup(generate_page(parse_size(size)), 'html.parser')
+        legacy = best_of(lambda: legacy_extract(soup), args.repeat)
+        single = best_of(lambda: extract_page(soup), args.repeat)
+        print(f"{size:>8} {legacy:>12.3f} {single:>16.3f} {legacy / single:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
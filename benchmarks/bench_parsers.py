@@ -0,0 +1,30 @@
+"""Time every installed BeautifulSoup parser backend on synthetic pages.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parsers [--sizes 100KB 1MB] [--repeat 3]
+"""
+import argparse
+
+from benchmarks.bench_extraction import parse_size
+from benchmarks.synthetic import generate_page
+from src.scraping.parsers import available_backends, benchmark_backends
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['100KB', '1MB'])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"installed backends: {', '.join(available_backends())}")
+    for size in args.sizes:
+        timings = benchmark_backends(generate_page(parse_size(size)), args.repeat)
+        fastest = min(timings, key=timings.get)
+        for name, seconds in sorted(timings.items(), key=lambda kv: kv[1]):
+            marker = '  <- fastest' if name == fastest else ''
+            print(f"{size:>8} {name:>12} {seconds:8.3f}s{marker}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Measure parse + extract throughput of ParsePool over a pre-fetched corpus.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_process_pool [--pages 64] [--size 200KB] [--workers 1 2 4 8]
+
+Scaling is reported relative to the single-worker run; on an N-core machine
+it should stay close to linear up to N workers.
+"""
+import argparse
+import os
+import time
+
+from benchmarks.bench_extraction import parse_size
+from benchmarks.synthetic import generate_page
+from src.scraping.parsers import resolve_backend
+from src.scraping.process_pool import ParsePool
+
+
+def main():
+    cores = os.cpu_count() or 1
+    default_workers = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1))) or [1]
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=64)
+    parser.add_argument('--size', default='200KB')
+    parser.add_argument('--workers', type=int, nargs='+', default=default_workers)
+    parser.add_argument('--parser', default=None)
+    args = parser.parse_args()
+
+    size = parse_size(args.size)
+    corpus = [(generate_page(size, seed=i).encode('utf-8'), 'utf-8') for i in range(args.pages)]
+    backend = resolve_backend(args.parser)
+    print(f"{args.pages} pages of {args.size}, backend {backend}, {cores} CPU cores")
+
+    baseline = None
+    print(f"{'workers':>8} {'seconds':>9} {'pages/s':>9} {'scaling':>8}")
+    for workers in args.workers:
+        pool = ParsePool(workers)
+        list(pool.map(corpus[:workers], backend))  # start the worker processes first
+        start = time.perf_counter()
+        list(pool.map(corpus, backend))
+        elapsed = time.perf_counter() - start
+        pool.close()
+        rate = args.pages / elapsed
+        baseline = baseline or rate
+        print(f"{workers:>8} {elapsed:>9.2f} {rate:>9.1f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
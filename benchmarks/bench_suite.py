@@ -0,0 +1,228 @@
+"""Time every hot path over the synthetic corpus and write a JSON report.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_suite [--sizes 10KB 1MB 10MB] [--repeat 3] [--output bench_report.json]
+
+Everything runs offline: network throughput is measured against a local
+HTTP server serving the synthetic pages. The ContentArea benchmarks need
+PyQt6 and are reported as skipped when it can't be imported.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.bench_extraction import parse_size
+from benchmarks.synthetic import generate_page
+from src.scraping.core import ScrapeCore
+from src.scraping.parsers import resolve_backend
+from src.scraping.result_cache import ResultCache
+from src.utils.save_utils import save_as_csv, save_as_html
+from src.utils.scrape_storage import ScrapeStorage
+from src.utils.scrape_database import SQLiteScrapeStorage
+
+
+def measure(func, repeat, setup=None):
+    """Best and mean wall time of func() over repeat runs; setup() runs untimed before each"""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times), sum(times) / len(times)
+
+
+class PageServer:
+    """Serves pages from memory on a local port, standing in for the network"""
+
+    def __init__(self, pages):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = pages.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server.server_address[1]}{path}"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def make_content_area(backend):
+    """A real ContentArea on the offscreen platform, or (None, reason) when it can't be built"""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    try:
+        # content_area pulls in QtWebEngineWidgets, which must precede the QApplication
+        from src.gui.widgets.content_area import ContentArea
+        from PyQt6.QtWidgets import QApplication
+    except Exception as e:
+        # Not just ImportError: a GUI module can fail to even compile on an older Python
+        return None, f"skipped: {e}"
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    area = ContentArea()
+    area.parser_backend = backend
+    # Keep the application alive as long as the widget
+    area._bench_app = app
+    return area, None
+
+
+class Suite:
+    def __init__(self, repeat):
+        self.repeat = repeat
+        self.results = []
+
+    def record(self, name, size_name, size_bytes, func, setup=None, repeat=None):
+        best, mean = measure(func, repeat or self.repeat, setup)
+        result = {
+            'benchmark': name,
+            'size': size_name,
+            'bytes': size_bytes,
+            'best_s': round(best, 6),
+            'mean_s': round(mean, 6),
+            'mb_per_s': round(size_bytes / best / 1e6, 3) if best > 0 else None
+        }
+        self.results.append(result)
+        print(f"{name:<28} {size_name:>6} {best:>10.4f} s {result['mb_per_s'] or 0:>10.2f} MB/s")
+        return result
+
+    def skip(self, name, size_name, reason):
+        self.results.append({'benchmark': name, 'size': size_name, 'skipped': reason})
+        print(f"{name:<28} {size_name:>6} {reason}")
+
+
+def run(sizes, repeat, scrapes, backend):
+    backend = resolve_backend(backend)
+    suite = Suite(repeat)
+    pages = {name: generate_page(parse_size(name), seed=i) for i, name in enumerate(sizes)}
+    bodies = {f"/{name}.html": html.encode('utf-8') for name, html in pages.items()}
+    server = PageServer(bodies)
+    # No caches, pacing or breakers: every run does the full work
+    core = ScrapeCore(parser_backend=backend, http_cache=False, result_cache=False,
+                      politeness=False, circuit_breakers=False)
+    area, area_skipped = make_content_area(backend)
+    workdir = tempfile.mkdtemp(prefix='webscrape-bench-')
+    # ScrapeStorage keeps its files under ~/Documents; point home at the scratch dir
+    real_home = os.environ.get('HOME')
+    os.environ['HOME'] = workdir
+    storage = ScrapeStorage()
+    database = SQLiteScrapeStorage(os.path.join(workdir, 'scrapes.db'), import_json=False)
+
+    print(f"{'benchmark':<28} {'size':>6} {'best':>12} {'throughput':>15}")
+    try:
+        for name, html in pages.items():
+            content = bodies[f"/{name}.html"]
+            size = len(content)
+            url = server.url(f"/{name}.html")
+
+            suite.record('http_fetch', name, size, lambda: core._fetch(url))
+            suite.record('scrape_parse', name, size, lambda: core._extract(content, 'utf-8'))
+            suite.record('scrape_end_to_end', name, size, lambda: core.scrape(url))
+            data = core._extract(content, 'utf-8')
+
+            if area is None:
+                suite.skip('content_area_parse', name, area_skipped)
+                suite.skip('format_structure', name, area_skipped)
+            else:
+                def fresh_cache():
+                    area.result_cache = ResultCache()
+                suite.record('content_area_parse', name, size,
+                             lambda: area._parse_html_content(html), setup=fresh_cache)
+                suite.record('format_structure', name, size, lambda: area._format_structure(data))
+
+            suite.record('save_as_csv', name, size,
+                         lambda: save_as_csv(data, os.path.join(workdir, 'out.csv')))
+            suite.record('save_as_html', name, size,
+                         lambda: save_as_html(data, os.path.join(workdir, 'out.html')))
+
+            def clear_storage():
+                shutil.rmtree(storage.storage_dir, ignore_errors=True)
+                os.makedirs(storage.storage_dir, exist_ok=True)
+                storage.rebuild_manifest()
+
+            def save_many():
+                for _ in range(scrapes):
+                    storage.save_scrape(url, data)
+
+            suite.record('storage_save', name, size * scrapes, save_many, setup=clear_storage)
+            # Lay out a known set of files for loading, independent of the save runs
+            clear_storage()
+            for i in range(scrapes):
+                with open(os.path.join(storage.storage_dir, f"scrape_bench_{i:05d}.json"),
+                          'w', encoding='utf-8') as f:
+                    json.dump({'url': url, 'timestamp': datetime.now().isoformat(), 'data': data}, f)
+            # Files copied in by hand only show up in the manifest after a rebuild
+            storage.rebuild_manifest()
+            suite.record('storage_load', name, size * scrapes, storage.load_scrapes)
+            suite.record('storage_list', name, size * scrapes, storage.list_scrapes)
+
+            def clear_database():
+                with database.conn:
+                    database.conn.execute("DELETE FROM scrapes")
+            suite.record('sqlite_save', name, size * scrapes,
+                         lambda: database.save_many((url, data) for _ in range(scrapes)),
+                         setup=clear_database)
+            suite.record('sqlite_load', name, size * scrapes, database.load_scrapes)
+            suite.record('sqlite_list', name, size * scrapes, database.list_scrapes)
+    finally:
+        server.close()
+        core.close()
+        database.close()
+        if real_home is not None:
+            os.environ['HOME'] = real_home
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        'created': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'parser_backend': backend,
+        'repeat': repeat,
+        'scrapes_per_storage_run': scrapes,
+        'results': suite.results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['10KB', '1MB', '10MB'])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--scrapes', type=int, default=10,
+                        help="scrapes written and read per storage run")
+    parser.add_argument('--parser', default=None)
+    parser.add_argument('--output', default='bench_report.json')
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.repeat, args.scrapes, args.parser)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Synthetic HTML pages for the benchmarks.
+
+Pages are deterministic for a given size and seed so runs are comparable.
+"""
+import random
+
+WORDS = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+         "tempor incididunt ut labore et dolore magna aliqua").split()
+
+
+def _words(rng, n):
+    return ' '.join(rng.choice(WORDS) for _ in range(n))
+
+
+def _block(rng, i):
+    cls = f"c{rng.randrange(200)} item-{i % 37}"
+    return (
+        f'<div class="{cls}">'
+        f'<h{1 + i % 6} class="title">{_words(rng, 4)}</h{1 + i % 6}>'
+        f'<p class="text">{_words(rng, 30)}</p>'
+        f'<ul class="nav"><li><a class="link" href="/page/{i}">{_words(rng, 3)}</a></li>'
+        f'<li><a href="https://example.com/{i}?q={rng.randrange(10**6)}">{_words(rng, 2)}</a></li></ul>'
+        f'<img class="thumb" src="/img/{i}.png" alt="{_words(rng, 2)}">'
+        + (f'<form class="search" action="/search/{i}" method="post">'
+           f'<input type="text" name="q{i}" id="q{i}"><input type="submit" name="go"></form>'
+           if i % 10 == 0 else '')
+        + '</div>\n'
+    )
+
+
+def generate_page(size_bytes, seed=0):
+    """Return an HTML document of roughly size_bytes with many classes, links and forms"""
+    rng = random.Random(seed)
+    parts = ['<!DOCTYPE html><html><head><title>Synthetic page</title></head><body>\n']
+    total = len(parts[0])
+    i = 0
+    while total < size_bytes:
+        block = _block(rng, i)
+        parts.append(block)
+        total += len(block)
+        i += 1
+    parts.append('</body></html>\n')
+    return ''.join(parts)
+
+
+SIZES = {
+    '10KB': 10 * 1024,
+    '1MB': 1024 * 1024,
+    '10MB': 10 * 1024 * 1024,
+}
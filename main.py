@@ -1,15 +1,21 @@
 import os
 os.environ["QTWEBENGINE_REMOTE_DEBUGGING"] = "9222"
 
+# First so its clock covers the imports below
+from src.utils.startup_profiler import profiler
+
 import sys
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QObject, QEvent
 from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEngineSettings
+# QtWebEngineWidgets has to be imported before the QApplication is created
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from src.gui.main_window import MainWindow
 from src.utils.theme_manager import ThemeManager
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QPainterPath
 
+profiler.mark("imports")
+
 def create_rounded_icon(path, size=32):  # Reduced size from 64 to 32
     # Create source pixmap
     source = QPixmap(path)
@@ -132,13 +138,26 @@ def apply_theme(self, window):
 script_dir = os.path.dirname(os.path.abspath(__file__))
 icon_path = os.path.join(script_dir, "Icon", "AntieLogo.png")
 
-def main():
-    # Create temporary view to access settings
-    temp_view = QWebEngineView()
-    settings = temp_view.page().settings()
-    
+class FirstPaintWatcher(QObject):
+    """Marks the first paint event of the application and prints the startup report"""
+
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+        app.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            self.app.removeEventFilter(self)
+            profiler.mark("first paint")
+            profiler.report()
+        return False
+
+def configure_web_profile():
     # Enhanced browser emulation with better permissions handling
     profile = QWebEngineProfile.defaultProfile()
+    # Pages inherit these; no need for a throwaway view to reach them
+    settings = profile.settings()
     
     # Set modern browser user agent
     profile.setHttpUserAgent(
@@ -173,28 +192,30 @@ def main():
     storage_path = os.path.join(script_dir, "browser_data")
     profile.setPersistentStoragePath(storage_path)
     profile.setCachePath(os.path.join(storage_path, "cache"))
+
+def main():
+    # Set high DPI scaling BEFORE creating QApplication
+    QApplication.setHighDpiScaleFactorRoundingPolicy(
+        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+    )
+    app = QApplication(sys.argv)
+    profiler.mark("QApplication")
     
-    theme_manager = ThemeManager()
+    configure_web_profile()
+    profiler.mark("web engine profile")
     
-    app = QApplication(sys.argv)
+    theme_manager = ThemeManager()
     
     # Create and set rounded icon using relative path
     rounded_icon = create_rounded_icon(icon_path)
     app.setWindowIcon(rounded_icon)
+    profiler.mark("window icon")
     
     window = MainWindow(theme_manager)
+    profiler.mark("main window")
+    first_paint = FirstPaintWatcher(app)
     window.show()
     return app.exec()
 
 if __name__ == "__main__":
-    # Set high DPI scaling BEFORE creating QApplication
-    QApplication.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
-    )
-    app = QApplication(sys.argv)
-    
-    # Set the application icon here
-    rounded_icon = create_rounded_icon(icon_path)
-    app.setWindowIcon(rounded_icon)
-    
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
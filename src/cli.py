@@ -0,0 +1,215 @@
+"""Headless batch scraping: python -m src.cli urls.txt [options]
+
+Never imports Qt, so it runs in containers without a display, unless
+--render is given: then pages that look like unrendered JavaScript shells
+are re-rendered offscreen with QtWebEngine (see src/gui/hybrid_scraper.py).
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+
+from src.scraping.core import ScrapeCore, DEFAULT_TIMEOUT
+from src.scraping.parsers import AUTO, BACKENDS, available_backends
+from src.utils.metrics import MetricsServer, MetricsFileWriter
+from src.utils.tracing import Tracer, ENV_TRACE
+
+FORMATS = ['jsonl', 'json', 'csv']
+CSV_FIELDS = ['url', 'title', 'headings', 'paragraphs', 'links', 'images', 'forms', 'classes', 'error']
+
+
+def read_urls(path):
+    """URLs from a file (or stdin for '-'), one per line; blank lines and # comments are skipped"""
+    f = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    try:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def summary_row(url, data, error):
+    """One CSV row per URL: counts of what was found, or the error"""
+    if error is not None:
+        return {'url': url, 'error': str(error)}
+    return {
+        'url': url,
+        'title': data.get('title', ''),
+        'headings': len(data.get('headings', [])),
+        'paragraphs': len(data.get('paragraphs', [])),
+        'links': len(data.get('links', [])),
+        'images': len(data.get('images', [])),
+        'forms': len(data.get('forms', [])),
+        'classes': len(data.get('classes', {})),
+        'error': ''
+    }
+
+
+class ResultWriter:
+    """Writes results as they arrive; json buffers them since it is a single document"""
+
+    def __init__(self, out, fmt):
+        self.out = out
+        self.fmt = fmt
+        self.results = []
+        if fmt == 'csv':
+            self.csv = csv.DictWriter(out, fieldnames=CSV_FIELDS)
+            self.csv.writeheader()
+
+    def write(self, url, data, error):
+        if self.fmt == 'csv':
+            self.csv.writerow(summary_row(url, data, error))
+        elif error is not None:
+            # Failures are reported on stderr; json/jsonl only carry pages
+            return
+        elif self.fmt == 'jsonl':
+            self.out.write(json.dumps(data, ensure_ascii=False) + '\n')
+            self.out.flush()
+        else:
+            self.results.append(data)
+
+    def close(self):
+        if self.fmt == 'json':
+            json.dump(self.results, self.out, ensure_ascii=False, indent=2)
+            self.out.write('\n')
+
+
+def iter_hybrid(core, urls, render_workers=2):
+    """Like core.iter_scrape, but escalating JavaScript-only pages to offscreen rendering.
+
+    Qt is imported here only, and runs on the offscreen platform.
+    """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    # QtWebEngineWidgets has to be imported before the QApplication is created
+    from PyQt6.QtWebEngineWidgets import QWebEngineView  # noqa: F401
+    from PyQt6.QtCore import QEventLoop
+    from PyQt6.QtWidgets import QApplication
+    from src.gui.hybrid_scraper import HybridScraper
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    hybrid = HybridScraper(core, render_pool_size=render_workers)
+    results = deque()
+    finished = []
+
+    def on_result(url, data, route):
+        data['route'] = route
+        results.append((url, data, None))
+
+    hybrid.result_ready.connect(on_result)
+    hybrid.error_occurred.connect(lambda url, message: results.append((url, None, message)))
+    hybrid.finished.connect(lambda: finished.append(True))
+    hybrid.scrape_many(urls)
+    try:
+        while results or not finished:
+            while results:
+                yield results.popleft()
+            if not finished:
+                # Blocks until the HTTP threads or the render pool post something
+                app.processEvents(QEventLoop.ProcessEventsFlag.WaitForMoreEvents)
+    finally:
+        hybrid.shutdown()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m src.cli',
+                                     description='Scrape a list of URLs without the GUI.')
+    parser.add_argument('url_file', help="file with one URL per line, or '-' for stdin")
+    parser.add_argument('-o', '--output', default='-', help="output file (default: stdout)")
+    parser.add_argument('-f', '--format', choices=FORMATS, default='jsonl')
+    parser.add_argument('-w', '--workers', type=int, default=16, help="concurrent downloads")
+    parser.add_argument('--per-host', type=int, default=4, help="concurrent downloads per host")
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help="parse in this many processes (0: parse in the download threads)")
+    parser.add_argument('--parser', choices=[AUTO] + BACKENDS, default=None,
+                        help="parser backend (default: fastest installed; 'auto' benchmarks them)")
+    parser.add_argument('--stream', action='store_true', help="parse while downloading")
+    parser.add_argument('--render', action='store_true',
+                        help="re-render pages that need JavaScript in an offscreen browser "
+                             "(needs PyQt6-WebEngine; ignores --stream)")
+    parser.add_argument('--render-workers', type=int, default=2,
+                        help="offscreen pages rendering at once with --render")
+    parser.add_argument('--max-bytes', type=int, default=None, help="stop reading a page after this many bytes")
+    parser.add_argument('--timeout', type=float, default=None, metavar='SECONDS',
+                        help="connect and read timeout per request "
+                             f"(default: {DEFAULT_TIMEOUT[0]}s connect, {DEFAULT_TIMEOUT[1]}s read)")
+    parser.add_argument('--no-cache', action='store_true', help="disable the on-disk HTTP cache")
+    parser.add_argument('--no-politeness', action='store_true', help="disable per-host pacing and retries")
+    parser.add_argument('--timings', default=None,
+                        help="write per-stage timing histograms here (.csv or .json)")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="serve OpenMetrics at http://127.0.0.1:PORT/metrics while running")
+    parser.add_argument('--metrics-file', default=None,
+                        help="rewrite OpenMetrics text to this file while running")
+    parser.add_argument('--metrics-interval', type=float, default=15,
+                        help="seconds between --metrics-file rewrites")
+    parser.add_argument('--trace', default=os.environ.get(ENV_TRACE),
+                        help=f"append JSONL trace spans for every fetch and parse here (default: ${ENV_TRACE})")
+    parser.add_argument('-q', '--quiet', action='store_true', help="don't report progress on stderr")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.render:
+        try:
+            import PyQt6.QtWebEngineWidgets  # noqa: F401
+        except ImportError as e:
+            print(f"--render needs PyQt6 and PyQt6-WebEngine: {e}", file=sys.stderr)
+            return 2
+    urls = read_urls(args.url_file)
+    # BACKENDS is ordered fastest first, so skip the benchmark 'auto' would run
+    backend = args.parser or (available_backends() or [None])[0]
+    tracer = Tracer(args.trace) if args.trace else None
+    core = ScrapeCore(max_workers=args.workers, per_host=args.per_host, parser_backend=backend,
+                      http_cache=not args.no_cache, politeness=not args.no_politeness,
+                      parse_workers=args.parse_workers, tracer=tracer,
+                      timeout=args.timeout or DEFAULT_TIMEOUT)
+
+    exporters = []
+    if args.metrics_port is not None:
+        exporters.append(MetricsServer(core.metrics, args.metrics_port))
+    if args.metrics_file:
+        exporters.append(MetricsFileWriter(core.metrics, args.metrics_file, args.metrics_interval))
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+    writer = ResultWriter(out, args.format)
+    failed = 0
+    start = time.perf_counter()
+    if args.render:
+        results = iter_hybrid(core, urls, args.render_workers)
+    else:
+        results = core.iter_scrape(urls, stream=args.stream, max_bytes=args.max_bytes)
+    try:
+        for done, (url, data, error) in enumerate(results, 1):
+            if error is not None:
+                failed += 1
+                print(f"Error scraping {url}: {error}", file=sys.stderr)
+            writer.write(url, data, error)
+            if not args.quiet:
+                print(f"[{done}/{len(urls)}] {url}", file=sys.stderr)
+        writer.close()
+        if args.timings:
+            core.timing_stats.export(args.timings)
+    except KeyboardInterrupt:
+        print("Interrupted", file=sys.stderr)
+        return 130
+    finally:
+        core.close()
+        if tracer is not None:
+            tracer.close()
+        for exporter in exporters:
+            exporter.close()
+        if out is not sys.stdout:
+            out.close()
+
+    if not args.quiet:
+        elapsed = time.perf_counter() - start
+        print(f"{len(urls) - failed} scraped, {failed} failed in {elapsed:.2f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,74 @@
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class _TaskSignals(QObject):
+    done = pyqtSignal(int, object, object)  # generation, callback, result
+    failed = pyqtSignal(int, object, str)  # generation, error callback or None, message
+
+
+class _ParseTask(QRunnable):
+    def __init__(self, parser, generation, func, args, on_done, on_error=None):
+        super().__init__()
+        self.parser = parser
+        self.generation = generation
+        self.func = func
+        self.args = args
+        self.on_done = on_done
+        self.on_error = on_error
+
+    def run(self):
+        # A newer page load superseded this job before it got a thread
+        if self.generation != self.parser.generation:
+            return
+        try:
+            result = self.func(*self.args)
+        except Exception as e:
+            self.parser.signals.failed.emit(self.generation, self.on_error, str(e))
+            return
+        self.parser.signals.done.emit(self.generation, self.on_done, result)
+
+
+class BackgroundParser(QObject):
+    """Runs parsing/formatting jobs on a QThreadPool and hands results back on the GUI thread.
+
+    Every job is tagged with the current generation; cancel_stale() bumps it,
+    drops queued jobs and makes results of running ones get discarded.
+    """
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, parent=None, max_threads=2):
+        super().__init__(parent)
+        self.generation = 0
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self.signals = _TaskSignals()
+        # Queued connections: the slots run in this object's (the GUI) thread
+        self.signals.done.connect(self._deliver)
+        self.signals.failed.connect(self._fail)
+
+    def submit(self, func, *args, on_done, on_error=None):
+        """Run func(*args) in the background and call on_done(result) on the GUI thread.
+
+        A failure goes to on_error(message) if given, otherwise to error_occurred.
+        """
+        self.pool.start(_ParseTask(self, self.generation, func, args, on_done, on_error))
+
+    def cancel_stale(self):
+        self.generation += 1
+        self.pool.clear()
+
+    def _deliver(self, generation, callback, result):
+        if generation == self.generation:
+            callback(result)
+
+    def _fail(self, generation, callback, message):
+        if generation != self.generation:
+            return
+        if callback is not None:
+            callback(message)
+        else:
+            self.error_occurred.emit(message)
+
+    def shutdown(self):
+        self.cancel_stale()
+        self.pool.waitForDone()
@@ -0,0 +1,115 @@
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from src.gui.render_pool import RenderPool
+from src.scraping.batch import BatchRunner
+from src.scraping.core import ScrapeCore
+from src.scraping.router import FetchRouter, BROWSER
+
+
+class _FetchSignals(QObject):
+    fetched = pyqtSignal(str, object, object, object)  # url, data, reasons, error
+    finished = pyqtSignal()
+
+
+class _HttpBatch(QRunnable):
+    """Runs the plain HTTP batch off the GUI thread, checking each page against the router"""
+
+    def __init__(self, hybrid, urls):
+        super().__init__()
+        self.hybrid = hybrid
+        self.urls = urls
+
+    def run(self):
+        core = self.hybrid.core
+        router = self.hybrid.router
+        runner = BatchRunner(core.max_workers, core.per_host, core.scheduler)
+
+        def job(url):
+            if not core.validate_url(url):
+                raise ValueError("Invalid URL format")
+            content, data = core.fetch_and_extract(url)
+            data['url'] = url
+            return data, router.check(url, content, data)
+
+        for url, result, error in runner.run(self.urls, job):
+            data, reasons = result if error is None else (None, None)
+            self.hybrid.signals.fetched.emit(url, data, reasons, error)
+        self.hybrid.signals.finished.emit()
+
+
+class HybridScraper(QObject):
+    """Scrapes over plain HTTP and escalates to offscreen rendering only where needed.
+
+    Hosts the router already knows as browser hosts go straight to the
+    RenderPool; everything else is fetched with ScrapeCore first and only
+    re-rendered when the result looks like an unrendered JavaScript shell.
+    """
+    result_ready = pyqtSignal(str, object, str)  # url, data, 'http' or 'browser'
+    error_occurred = pyqtSignal(str, str)        # url, message
+    finished = pyqtSignal()
+
+    def __init__(self, core=None, router=None, parent=None, render_pool_size=2):
+        super().__init__(parent)
+        self.core = core or ScrapeCore()
+        self.router = router or FetchRouter()
+        self.render_pool_size = render_pool_size
+        self._render_pool = None
+        self._http_running = 0
+        self.thread_pool = QThreadPool(self)
+        self.signals = _FetchSignals()
+        self.signals.fetched.connect(self._on_fetched)
+        self.signals.finished.connect(self._on_http_finished)
+
+    @property
+    def render_pool(self):
+        # Most runs never need a browser, so only pay for one when something escalates
+        if self._render_pool is None:
+            self._render_pool = RenderPool(self, size=self.render_pool_size,
+                                           parser_backend=self.core.parser_backend)
+            self._render_pool.result_ready.connect(
+                lambda url, data: self.result_ready.emit(url, data, BROWSER))
+            self._render_pool.error_occurred.connect(self.error_occurred)
+            self._render_pool.queue_empty.connect(self._check_finished)
+        return self._render_pool
+
+    def scrape_many(self, urls):
+        http_urls = []
+        for url in urls:
+            if self.router.route_for(url) == BROWSER:
+                self.render_pool.enqueue(url)
+            else:
+                http_urls.append(url)
+        if http_urls:
+            self._http_running += 1
+            self.thread_pool.start(_HttpBatch(self, http_urls))
+        else:
+            self._check_finished()
+
+    def _on_fetched(self, url, data, reasons, error):
+        if error is not None:
+            self.error_occurred.emit(url, str(error))
+        elif reasons:
+            self.render_pool.enqueue(url)
+        else:
+            self.result_ready.emit(url, data, 'http')
+
+    def _on_http_finished(self):
+        self._http_running -= 1
+        self.router.memory.save()
+        self._check_finished()
+
+    def _check_finished(self):
+        if self._http_running == 0 and (self._render_pool is None or self._render_pool.pending() == 0):
+            self.finished.emit()
+
+    def stats(self):
+        stats = {'router': self.router.stats()}
+        if self._render_pool is not None:
+            stats['render_pool'] = self._render_pool.stats()
+        return stats
+
+    def shutdown(self):
+        self.thread_pool.waitForDone()
+        self.router.memory.save()
+        if self._render_pool is not None:
+            self._render_pool.shutdown()
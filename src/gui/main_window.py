@@ -1,26 +1,22 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from .widgets.sidebar import Sidebar
 from .widgets.header import Header
 from .widgets.content_area import ContentArea
 from .widgets.status_bar import StatusBar
-from .widgets.settings_dialog import SettingsDialog  # Add this import
 from src.utils.settings_manager import SettingsManager  # Add this import
-from .widgets.results_dialog import ResultsDialog  # Add this import
-from src.utils.scrape_storage import ScrapeStorage  # Add this import
+from src.utils.startup_profiler import profiler
+from src.scraping.parsers import detect_fastest_backend
 
 class MainWindow(QMainWindow):
     def __init__(self, theme_manager):
         super().__init__()
         self.theme_manager = theme_manager
         self.settings_manager = SettingsManager()  # Add settings manager
-        self.scrape_storage = ScrapeStorage()  # Add this line
+        self._scrape_storage = None  # Created on first use, see scrape_storage
         self.setWindowTitle("WebScrape")
         self.setMinimumSize(1200, 800)
         
-        # Add this line to make the window fullscreen by default
-        self.showMaximized()
-        
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         self.layout = QVBoxLayout(self.central_widget)
@@ -29,20 +25,42 @@ class MainWindow(QMainWindow):
         
         self.setup_ui()
         self.theme_manager.apply_theme(self)
+        profiler.mark("theme")
+        
+        # Add this line to make the window fullscreen by default
+        # (after setup_ui, so the window is laid out once instead of per added widget)
+        self.showMaximized()
+    
+    @property
+    def scrape_storage(self):
+        if self._scrape_storage is None:
+            from src.utils.scrape_database import SQLiteScrapeStorage
+            from src.utils.tracing import tracer_from_env
+            # Set WEBSCRAPE_TRACE=path to trace saves as JSONL spans
+            self._scrape_storage = SQLiteScrapeStorage(tracer=tracer_from_env())
+        return self._scrape_storage
     
     def setup_ui(self):
         # Add header
         self.header = Header(self.theme_manager)
         self.layout.addWidget(self.header)
+        profiler.mark("header")
         
         # Main content area with sidebar
         content_layout = QHBoxLayout()
         
         self.sidebar = Sidebar()
         content_layout.addWidget(self.sidebar)
+        profiler.mark("sidebar")
         
         self.content_area = ContentArea()
         content_layout.addWidget(self.content_area)
+        profiler.mark("content area")
+        
+        # Benchmarks parser backends on first run, then reuses the recorded choice;
+        # deferred so a first-run benchmark doesn't hold up the first paint
+        QTimer.singleShot(0, lambda: detect_fastest_backend(self.settings_manager))
+        self.content_area.update_settings(self.settings_manager.get_settings())
         
         # Connect header buttons and share references
         self.header.start_button.clicked.connect(self.content_area.start_scraping)
@@ -58,14 +76,19 @@ class MainWindow(QMainWindow):
         # Add status bar
         self.status_bar = StatusBar()
         self.layout.addWidget(self.status_bar)
+        self.content_area.status_message.connect(self.status_bar.show_message)
+        self.content_area.timings_updated.connect(self.status_bar.show_timings)
         
         # Connect signals
         self.sidebar.record_clicked.connect(self.content_area.toggle_recording)
         self.sidebar.settings_clicked.connect(self.show_settings)  # Add this line
         self.sidebar.results_clicked.connect(self.show_results)  # Add this line
         self.sidebar.unload_clicked.connect(self.content_area.unload_current_scrape)  # Add this line
+        profiler.mark("status bar and signals")
         
     def show_settings(self):
+        # Rarely opened, so imported on first use rather than at startup
+        from .widgets.settings_dialog import SettingsDialog
         settings_dialog = SettingsDialog(self.settings_manager, self)
         if settings_dialog.exec():
             # Settings were saved, update any necessary components
@@ -74,5 +97,6 @@ class MainWindow(QMainWindow):
             
     def show_results(self):
         """Show the results dialog"""
+        from .widgets.results_dialog import ResultsDialog
         results_dialog = ResultsDialog(self.scrape_storage, self.content_area, self)
         results_dialog.exec()
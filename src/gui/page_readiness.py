@@ -0,0 +1,97 @@
+import json
+import os
+import time
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtWebEngineCore import QWebEngineScript
+
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources")
+
+
+def resource_script(name, filename, world, injection_point, sub_frames=False):
+    """Build a QWebEngineScript from a file in src/resources"""
+    script = QWebEngineScript()
+    script.setName(name)
+    with open(os.path.join(RESOURCES_DIR, filename), encoding='utf-8') as f:
+        script.setSourceCode(f.read())
+    script.setWorldId(world)
+    script.setInjectionPoint(injection_point)
+    script.setRunsOnSubFrames(sub_frames)
+    return script
+
+
+def install_extraction_scripts(page):
+    """Inject the page extractor and the readiness probe into a page"""
+    # Page extractor, compiled once per document in an isolated world
+    page.scripts().insert(resource_script(
+        "webscrape-extractor", "extractor.js",
+        QWebEngineScript.ScriptWorldId.ApplicationWorld,
+        QWebEngineScript.InjectionPoint.DocumentReady))
+    # Readiness probe: must share the page's world to see its fetch/XHR calls
+    page.scripts().insert(resource_script(
+        "webscrape-readiness", "readiness.js",
+        QWebEngineScript.ScriptWorldId.MainWorld,
+        QWebEngineScript.InjectionPoint.DocumentCreation))
+
+
+class ReadinessWatcher(QObject):
+    """Emits ready once per load of a page when it has settled.
+
+    Ready = load finished, no fetch/XHR in flight and no network or DOM
+    activity for quiet_ms; ready_timeout_ms caps the wait for pages that
+    never settle. Needs the probe from install_extraction_scripts().
+    """
+    ready = pyqtSignal(bool)
+
+    def __init__(self, page, quiet_ms=500, ready_timeout_ms=15000, poll_ms=100):
+        super().__init__(page)
+        self.page = page
+        self.quiet_ms = quiet_ms
+        self.ready_timeout_ms = ready_timeout_ms
+        self._generation = 0
+        self._deadline = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(poll_ms)
+        self._timer.timeout.connect(self._poll)
+        page.loadStarted.connect(self.stop)
+        page.loadFinished.connect(self._start)
+
+    def stop(self):
+        self._generation += 1
+        self._timer.stop()
+
+    def _start(self, success):
+        self.stop()
+        if not success:
+            self.ready.emit(False)
+            return
+        self._deadline = time.monotonic() + self.ready_timeout_ms / 1000
+        self._timer.start()
+        self._poll()
+
+    def _poll(self):
+        generation = self._generation
+        self.page.runJavaScript(
+            "window.__webscrapeReady ? window.__webscrapeReady() : null",
+            QWebEngineScript.ScriptWorldId.MainWorld,
+            lambda state: self._on_state(generation, state)
+        )
+
+    def _on_state(self, generation, state):
+        # Answer for an earlier load, or readiness was already signalled
+        if generation != self._generation or not self._timer.isActive():
+            return
+        if state is None:
+            # No probe (e.g. a PDF or an image): loadFinished is all we get
+            ready = True
+        else:
+            try:
+                state = json.loads(state)
+                ready = (state['readyState'] == 'complete'
+                         and state['pending'] == 0
+                         and state['quietFor'] >= self.quiet_ms)
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"Error reading page readiness: {e}")
+                ready = True
+        if ready or time.monotonic() >= self._deadline:
+            self.stop()
+            self.ready.emit(True)
@@ -0,0 +1,232 @@
+import json
+from collections import deque
+from PyQt6.QtCore import QObject, QTimer, QUrl, pyqtSignal
+from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineScript, QWebEngineSettings
+
+from src.gui.background_parser import BackgroundParser
+from src.gui.page_readiness import ReadinessWatcher, install_extraction_scripts
+from src.gui.request_blocker import RequestBlocker
+from src.scraping.parsers import resolve_backend
+from src.scraping.process_pool import parse_document
+
+
+def renderer_rss_mb(pid):
+    """Resident memory of a renderer process in MB, or None where /proc isn't available"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class _RenderWorker(QObject):
+    """One offscreen page: load, wait until settled, extract, report back to the pool"""
+
+    def __init__(self, pool):
+        super().__init__(pool)
+        self.pool = pool
+        self.url = None
+        self.uses = 0
+        # Bumped per start(); async callbacks carry it so results of an earlier
+        # load (even of the same URL) are dropped
+        self.seq = 0
+        self.aborted = False
+        self.page = QWebEnginePage(pool.profile, self)
+        settings = self.page.settings()
+        settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, not pool.scrape_mode)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.WebGLEnabled, False)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, False)
+        install_extraction_scripts(self.page)
+        self.readiness = ReadinessWatcher(self.page, pool.quiet_ms, pool.ready_timeout_ms)
+        self.readiness.ready.connect(self._on_ready)
+        # Hard cap per URL on top of the readiness timeout, for loads that never finish
+        self.watchdog = QTimer(self)
+        self.watchdog.setSingleShot(True)
+        self.watchdog.timeout.connect(self._on_timeout)
+
+    @property
+    def busy(self):
+        return self.url is not None
+
+    def start(self, url):
+        self.url = url
+        self.seq += 1
+        self.uses += 1
+        self.watchdog.start(self.pool.load_timeout_ms)
+        self.page.setUrl(QUrl(url))
+
+    def _on_ready(self, success):
+        if not self.busy:
+            return
+        if not success:
+            # Failed or never settled: the page may still be loading, so don't reuse it
+            self.aborted = True
+            self._finish(error="Failed to load page")
+            return
+        seq = self.seq
+        self.page.runJavaScript(
+            "window.__webscrapeExtract ? window.__webscrapeExtract() : null",
+            QWebEngineScript.ScriptWorldId.ApplicationWorld,
+            lambda result: self._on_extracted(seq, result)
+        )
+
+    def _current(self, seq):
+        return self.busy and seq == self.seq
+
+    def _on_extracted(self, seq, result):
+        if not self._current(seq):
+            return
+        if result:
+            try:
+                self._finish(data=json.loads(result))
+            except ValueError as e:
+                self._finish(error=f"Invalid extractor output: {e}")
+            return
+        # Extractor didn't run (e.g. CSP or a non-HTML document): parse the DOM in Python
+        self.page.toHtml(lambda html: self._on_html(seq, html))
+
+    def _on_html(self, seq, html):
+        if not self._current(seq):
+            return
+        self.pool.background_parser.submit(
+            parse_document, html, None, self.pool.parser_backend,
+            on_done=lambda data: self._finish(data=data) if self._current(seq) else None,
+            # Report the parse error now instead of holding the page until the watchdog fires
+            on_error=lambda message: (self._finish(error=f"Parse failed: {message}")
+                                      if self._current(seq) else None))
+
+    def _on_timeout(self):
+        if self.busy:
+            self.readiness.stop()
+            self.page.triggerAction(QWebEnginePage.WebAction.Stop)
+            # The aborted load can still report loadFinished(False) later, which
+            # the readiness watcher can't tell apart from the next URL's; so the
+            # page is replaced instead of reused (see needs_recycle)
+            self.aborted = True
+            self._finish(error=f"Timed out after {self.pool.load_timeout_ms} ms")
+
+    def _finish(self, data=None, error=None):
+        url = self.url
+        self.url = None
+        self.watchdog.stop()
+        self.pool._on_worker_done(self, url, data, error)
+
+    def needs_recycle(self):
+        if self.aborted or self.uses >= self.pool.recycle_after:
+            return True
+        if self.pool.max_rss_mb:
+            rss = renderer_rss_mb(self.page.renderProcessPid())
+            return rss is not None and rss > self.pool.max_rss_mb
+        return False
+
+    def close(self):
+        self.readiness.stop()
+        self.watchdog.stop()
+        self.url = None
+        self.page.deleteLater()
+        self.deleteLater()
+
+
+class RenderPool(QObject):
+    """Renders and extracts JavaScript-dependent pages on a pool of offscreen pages.
+
+    The pages share one off-the-record profile (cache, cookies, request
+    blocker) and are reused across URLs. A page is replaced after
+    recycle_after loads, or once its renderer process grows past max_rss_mb
+    (Linux only; renderers can be shared between pages of one site, so the
+    figure is per process rather than strictly per page).
+    """
+    result_ready = pyqtSignal(str, object)  # url, extracted data
+    error_occurred = pyqtSignal(str, str)   # url, message
+    queue_empty = pyqtSignal()
+
+    def __init__(self, parent=None, size=4, recycle_after=50, max_rss_mb=None,
+                 scrape_mode=True, parser_backend=None, quiet_ms=500,
+                 ready_timeout_ms=15000, load_timeout_ms=30000):
+        super().__init__(parent)
+        self.size = max(1, size)
+        self.recycle_after = max(1, recycle_after)
+        self.max_rss_mb = max_rss_mb
+        self.scrape_mode = scrape_mode
+        self.parser_backend = resolve_backend(parser_backend)
+        self.quiet_ms = quiet_ms
+        self.ready_timeout_ms = ready_timeout_ms
+        self.load_timeout_ms = load_timeout_ms
+
+        self.profile = QWebEngineProfile(self)
+        self.request_blocker = RequestBlocker(self)
+        self.request_blocker.scrape_mode = scrape_mode
+        self.profile.setUrlRequestInterceptor(self.request_blocker)
+        self.background_parser = BackgroundParser(self)
+
+        self.queue = deque()
+        self.workers = []
+        self.completed = 0
+        self.failed = 0
+        self.recycled = 0
+
+    def enqueue(self, url):
+        self.queue.append(url)
+        self._dispatch()
+
+    def enqueue_many(self, urls):
+        self.queue.extend(urls)
+        self._dispatch()
+
+    def pending(self):
+        """URLs waiting for a free page plus URLs being rendered"""
+        return len(self.queue) + sum(1 for worker in self.workers if worker.busy)
+
+    def clear(self):
+        """Drop queued URLs; pages already rendering finish normally"""
+        self.queue.clear()
+
+    def _dispatch(self):
+        while self.queue:
+            worker = next((w for w in self.workers if not w.busy), None)
+            if worker is None:
+                if len(self.workers) >= self.size:
+                    return
+                # Pages are created on demand, up to size
+                worker = _RenderWorker(self)
+                self.workers.append(worker)
+            worker.start(self.queue.popleft())
+
+    def _on_worker_done(self, worker, url, data, error):
+        if error is None:
+            data['url'] = url
+            self.completed += 1
+        else:
+            self.failed += 1
+        if worker.needs_recycle():
+            self.workers.remove(worker)
+            worker.close()
+            self.recycled += 1
+        if error is None:
+            self.result_ready.emit(url, data)
+        else:
+            self.error_occurred.emit(url, error)
+        self._dispatch()
+        if self.pending() == 0:
+            self.queue_empty.emit()
+
+    def stats(self):
+        return {
+            'size': self.size,
+            'pages': len(self.workers),
+            'busy': sum(1 for worker in self.workers if worker.busy),
+            'queued': len(self.queue),
+            'completed': self.completed,
+            'failed': self.failed,
+            'recycled': self.recycled
+        }
+
+    def shutdown(self):
+        self.queue.clear()
+        self.background_parser.shutdown()
+        for worker in self.workers:
+            worker.close()
+        self.workers = []
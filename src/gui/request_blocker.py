@@ -0,0 +1,102 @@
+import threading
+from PyQt6.QtWebEngineCore import QWebEngineUrlRequestInterceptor, QWebEngineUrlRequestInfo
+
+ResourceType = QWebEngineUrlRequestInfo.ResourceType
+
+# Resource types by the names used in rules
+RESOURCE_TYPES = {
+    'image': ResourceType.ResourceTypeImage,
+    'font': ResourceType.ResourceTypeFontResource,
+    'media': ResourceType.ResourceTypeMedia,
+    'stylesheet': ResourceType.ResourceTypeStylesheet,
+    'object': ResourceType.ResourceTypeObject,
+    'plugin': ResourceType.ResourceTypePluginResource,
+    'ping': ResourceType.ResourceTypePing,
+    'favicon': ResourceType.ResourceTypeFavicon,
+    'prefetch': ResourceType.ResourceTypePrefetch,
+    'csp_report': ResourceType.ResourceTypeCspReport,
+    'script': ResourceType.ResourceTypeScript,
+    'xhr': ResourceType.ResourceTypeXhr,
+    'sub_frame': ResourceType.ResourceTypeSubFrame,
+}
+TYPE_NAMES = {value: name for name, value in RESOURCE_TYPES.items()}
+
+# Nothing we extract needs these; scripts, XHR and frames stay so dynamic pages still render
+DEFAULT_BLOCKED_TYPES = {'image', 'font', 'media', 'object', 'plugin', 'ping',
+                         'favicon', 'prefetch', 'csp_report'}
+
+DEFAULT_BLOCKED_HOSTS = {
+    'doubleclick.net', 'googlesyndication.com', 'google-analytics.com',
+    'googletagmanager.com', 'googleadservices.com', 'adservice.google.com',
+    'facebook.net', 'connect.facebook.net', 'scorecardresearch.com', 'hotjar.com',
+    'amazon-adsystem.com', 'taboola.com', 'outbrain.com', 'criteo.com', 'adnxs.com'
+}
+
+
+class RequestBlocker(QWebEngineUrlRequestInterceptor):
+    """Blocks heavy or tracking requests while scrape mode is on.
+
+    Rules are a set of resource type names (see RESOURCE_TYPES) and a host
+    blocklist that also matches subdomains. interceptRequest runs on the
+    network thread, so the counters are guarded by a lock.
+    """
+
+    def __init__(self, parent=None, blocked_types=None, blocked_hosts=None):
+        super().__init__(parent)
+        self.scrape_mode = False
+        self.blocked_types = set()
+        for name in (DEFAULT_BLOCKED_TYPES if blocked_types is None else blocked_types):
+            self.set_rule(name, True)
+        self.blocked_hosts = set(DEFAULT_BLOCKED_HOSTS if blocked_hosts is None else blocked_hosts)
+        self._lock = threading.Lock()
+        self.reset_counts()
+
+    def set_rule(self, type_name, blocked):
+        if type_name not in RESOURCE_TYPES:
+            raise ValueError(f"Unknown resource type: {type_name}")
+        if blocked:
+            self.blocked_types.add(type_name)
+        else:
+            self.blocked_types.discard(type_name)
+        self._blocked_values = {RESOURCE_TYPES[name] for name in self.blocked_types}
+
+    def _host_blocked(self, host):
+        host = host.lower()
+        while host:
+            if host in self.blocked_hosts:
+                return True
+            _, _, host = host.partition('.')
+        return False
+
+    def interceptRequest(self, info):
+        if not self.scrape_mode:
+            return
+        resource_type = info.resourceType()
+        blocked = False
+        if resource_type != ResourceType.ResourceTypeMainFrame:
+            blocked = (self._host_blocked(info.requestUrl().host())
+                       or resource_type in self._blocked_values)
+        if blocked:
+            info.block(True)
+        with self._lock:
+            if blocked:
+                self.blocked += 1
+                name = TYPE_NAMES.get(resource_type, 'other')
+                self.blocked_by_type[name] = self.blocked_by_type.get(name, 0) + 1
+            else:
+                self.allowed += 1
+
+    def reset_counts(self):
+        with self._lock:
+            self.blocked = 0
+            self.allowed = 0
+            self.blocked_by_type = {}
+
+    def stats(self):
+        with self._lock:
+            return {
+                'scrape_mode': self.scrape_mode,
+                'blocked': self.blocked,
+                'allowed': self.allowed,
+                'blocked_by_type': dict(self.blocked_by_type)
+            }
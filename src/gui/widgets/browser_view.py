@@ -5,6 +5,8 @@ from PyQt6.QtCore import pyqtSignal, QObject, Qt, QUrl
 from PyQt6.QtWebChannel import QWebChannel
 from PyQt6.QtGui import QPalette, QColor
 import os
+from src.gui.page_readiness import ReadinessWatcher, install_extraction_scripts
+from src.gui.request_blocker import RequestBlocker
 
 class InteractionRecorder(QObject):
     interaction_recorded = pyqtSignal(dict)
@@ -15,7 +17,10 @@ class InteractionRecorder(QObject):
         self.interactions = []
 
 class BrowserView(QWebEngineView):
-    def __init__(self):
+    # Emitted once per load when the page has settled (or the hard timeout hit)
+    page_ready = pyqtSignal(bool)
+
+    def __init__(self, quiet_ms=500, ready_timeout_ms=15000, poll_ms=100):
         super().__init__()
         self.recorder = InteractionRecorder()
         self.channel = QWebChannel()
@@ -32,6 +37,9 @@ class BrowserView(QWebEngineView):
         script.setRunsOnSubFrames(True)
         
         self.page().scripts().insert(script)
+        
+        install_extraction_scripts(self.page())
+        
         self.page().setWebChannel(self.channel)
         self.channel.registerObject("recorder", self.recorder)
         self.page().loadFinished.connect(self.inject_tracking_code)
@@ -53,9 +61,26 @@ class BrowserView(QWebEngineView):
         settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, True)
         settings.setAttribute(QWebEngineSettings.WebAttribute.FullScreenSupportEnabled, True)
         
+        # Blocks images, fonts, media and trackers while scrape mode is on
+        self.request_blocker = RequestBlocker(self)
+        self.page().profile().setUrlRequestInterceptor(self.request_blocker)
+        self.loadStarted.connect(self.request_blocker.reset_counts)
+        
+        # page_ready fires once the page has settled, not on loadFinished
+        self.readiness = ReadinessWatcher(self.page(), quiet_ms, ready_timeout_ms, poll_ms)
+        self.readiness.ready.connect(self.page_ready)
+        
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
 
+    def set_scrape_mode(self, enabled):
+        """Toggle extraction-only loading: heavy resources blocked, rendering extras off"""
+        self.request_blocker.scrape_mode = enabled
+        settings = self.page().settings()
+        settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, not enabled)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.WebGLEnabled, not enabled)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, not enabled)
+
     def show_context_menu(self, position):
         menu = self.page().createStandardContextMenu()
         menu.addSeparator()
@@ -67,6 +92,14 @@ class BrowserView(QWebEngineView):
         )
         menu.exec(self.mapToGlobal(position))
 
+    def extract_in_renderer(self, callback):
+        """Run the injected extractor in the page; callback gets a JSON string or None"""
+        self.page().runJavaScript(
+            "window.__webscrapeExtract ? window.__webscrapeExtract() : null",
+            QWebEngineScript.ScriptWorldId.ApplicationWorld,
+            callback
+        )
+
     def inject_tracking_code(self):
         js_code = """
         new QWebChannel(qt.webChannelTransport, function(channel) {
@@ -1,12 +1,17 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QStackedWidget, 
     QLineEdit, QPushButton, QTextEdit, QMessageBox, QTreeWidget, 
-    QTreeWidgetItem, QHBoxLayout, QFileDialog, QSplitter)
-from PyQt6.QtCore import Qt, QUrl
+    QTreeWidgetItem, QHBoxLayout, QFileDialog, QSplitter, QLabel)
+from PyQt6.QtCore import Qt, QUrl, pyqtSignal
 from PyQt6.QtGui import QTextCharFormat, QSyntaxHighlighter, QColor, QFont
 from src.gui.widgets.browser_view import BrowserView
+from src.scraping.extractor import extract_page
+from src.scraping.parsers import make_soup, resolve_backend, AUTO
+from src.scraping.result_cache import ResultCache
+from src.gui.background_parser import BackgroundParser
+from src.scraping.timing import StageTimer, TimingStats
+from src.utils.startup_profiler import profiler
 from datetime import datetime
 import json
-import re
 
 class HTMLHighlighter(QSyntaxHighlighter):
     def __init__(self, parent=None):
@@ -43,43 +48,40 @@ class HTMLHighlighter(QSyntaxHighlighter):
             self.setFormat(match.start() + 1, match.end() - match.start() - 2, self.text_format)
 
 class ContentArea(QWidget):
+    status_message = pyqtSignal(str)
+    timings_updated = pyqtSignal(dict)  # stage -> ms for the current page load
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        # Define categories and their patterns for HTML parsing
+        # Sections of the structure overview and their line prefixes
         self.categories = {
-            'Page Title': {
-                'pattern': r'<title[^>]*>(.*?)</title>',
-                'prefix': '📄 '
-            },
-            'Navigation Links': {
-                'pattern': r'<a[^>]*?href="([^"]*)"[^>]*>(.*?)</a>',
-                'prefix': '🔗 '
-            },
-            'Main Headings': {
-                'pattern': r'<h1[^>]*>(.*?)</h1>',
-                'prefix': '📌 '
-            },
-            'Sub Headings': {
-                'pattern': r'<h[2-6][^>]*>(.*?)</h[2-6]>',
-                'prefix': '📎 '
-            },
-            'Forms': {
-                'pattern': r'<form[^>]*?action="([^"]*)"[^>]*>.*?</form>',
-                'prefix': '📝 '
-            },
-            'Input Fields': {
-                'pattern': r'<input[^>]*?(?:type="([^"]*)")?[^>]*>',
-                'prefix': '⌨️ '
-            },
-            'Images': {
-                'pattern': r'<img[^>]*?src="([^"]*)"[^>]*?(?:alt="([^"]*)")?[^>]*>',
-                'prefix': '🖼️ '
-            },
-            'Lists': {
-                'pattern': r'<(?:ul|ol)[^>]*>.*?</(?:ul|ol)>',
-                'prefix': '📋 '
-            }
+            'Page Title': {'prefix': '📄 '},
+            'Navigation Links': {'prefix': '🔗 '},
+            'Main Headings': {'prefix': '📌 '},
+            'Sub Headings': {'prefix': '📎 '},
+            'Forms': {'prefix': '📝 '},
+            'Input Fields': {'prefix': '⌨️ '},
+            'Images': {'prefix': '🖼️ '}
         }
+        self.parser_backend = AUTO
+        # 'renderer' extracts inside the page via JavaScript; 'python' parses toHtml() output
+        self.extraction_mode = 'renderer'
+        self.result_cache = ResultCache()
+        # Parsing and formatting run here so heavy pages don't freeze the window
+        self.background_parser = BackgroundParser(self)
+        self.background_parser.error_occurred.connect(
+            lambda message: print(f"Error parsing page: {message}"))
+        self.scrape_requested = False
+        # Stages of the current page load: load, settle, extract, parse, render
+        self.page_timer = StageTimer()
+        self.current_timings = None
+        self.timing_stats = TimingStats()
+        self.current_results = None
+        self.last_parsed = None
+        # Starting Chromium is the slowest part of startup, so the web view
+        # is only built when something first needs it (see browser_view)
+        self._browser_view = None
+        self.scrape_mode = False
         self.setup_ui()
         self.recording = False  # Add recording state
         
@@ -93,11 +95,12 @@ class ContentArea(QWidget):
         content_layout.setSpacing(0)  # Remove spacing between browser and right panel
         content_layout.setContentsMargins(0, 0, 0, 0)  # Remove all content margins
         
-        # Browser view on the left with increased stretch
-        self.browser_view = BrowserView()
-        self.browser_view.recorder.interaction_recorded.connect(self.on_interaction)
-        self.browser_view.loadFinished.connect(self.update_html_view)
-        content_layout.addWidget(self.browser_view, stretch=4)
+        # Browser view on the left with increased stretch; a placeholder holds
+        # its place until the view is created
+        self.content_layout = content_layout
+        self.browser_placeholder = QLabel("Enter a URL and press Start to load a page")
+        self.browser_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        content_layout.addWidget(self.browser_placeholder, stretch=4)
         
         # Right side splitter
         right_splitter = QSplitter(Qt.Orientation.Vertical)
@@ -120,6 +123,24 @@ class ContentArea(QWidget):
         
         self.setLayout(layout)
 
+    @property
+    def browser_view(self):
+        if self._browser_view is None:
+            self._browser_view = BrowserView()
+            self._browser_view.recorder.interaction_recorded.connect(self.on_interaction)
+            self._browser_view.loadStarted.connect(self.background_parser.cancel_stale)
+            self._browser_view.loadStarted.connect(self._on_load_started)
+            self._browser_view.loadFinished.connect(self._on_load_finished)
+            # The only load handler: one extraction and one parse per load, run once
+            # the page has settled so content rendered by scripts is included
+            self._browser_view.page_ready.connect(self._on_page_load_finished)
+            self._browser_view.set_scrape_mode(self.scrape_mode)
+            self.content_layout.replaceWidget(self.browser_placeholder, self._browser_view)
+            self.content_layout.setStretchFactor(self._browser_view, 4)
+            self.browser_placeholder.deleteLater()
+            profiler.mark("web view (first use)")
+        return self._browser_view
+
     def toggle_recording(self):
         self._is_recording = not self._is_recording
         if self._is_recording:
@@ -147,7 +168,8 @@ class ContentArea(QWidget):
                     'url': self.url_input.text(),
                     'timestamp': datetime.now().isoformat(),
                     'total_elements': total_elements,
-                    'content': self.current_results
+                    'content': self.current_results,
+                    'timings': self.current_timings
                 }
             )
             
@@ -191,33 +213,100 @@ class ContentArea(QWidget):
             self.start_button.setEnabled(False)
             self.url_input.setEnabled(False)
             self.save_button.setEnabled(False)
+            # Results of the next load go to the results tree and save path
+            self.scrape_requested = True
             self.browser_view.setUrl(QUrl(url))
             
-            # Enable save button when page is loaded
-            self.browser_view.loadFinished.connect(self._on_page_load_finished)
-            
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to start scraping: {str(e)}")
             self.start_button.setEnabled(True)
             self.url_input.setEnabled(True)
 
+    def _on_load_started(self):
+        self.page_timer = StageTimer()
+        self.page_timer.start('load')
+
+    def _on_load_finished(self, success):
+        # Between loadFinished and page_ready the page is settling
+        self.page_timer.stop('load')
+        self.page_timer.start('settle')
+        self.timings_updated.emit(self.page_timer.as_dict())
+
     def _on_page_load_finished(self, success):
-        """Handle page load completion"""
-        if success:
-            self.browser_view.page().toHtml(self._process_html_content)
+        """Handle page load completion (emitted by BrowserView.page_ready)"""
+        self.page_timer.stop('settle')
+        self.page_timer.start('extract')
+        scrape_requested = self.scrape_requested
+        self.scrape_requested = False
+        if scrape_requested:
             self.start_button.setEnabled(True)
             self.url_input.setEnabled(True)
-            self.save_button.setEnabled(True)
-        else:
+        
+        if success and self.browser_view.request_blocker.scrape_mode:
+            stats = self.browser_view.request_blocker.stats()
+            self.status_message.emit(
+                f"Scrape mode: {stats['blocked']} requests blocked, {stats['allowed']} allowed")
+        
+        if success:
+            # Fetch the DOM once; the pipeline below fans the result out
+            if self.extraction_mode == 'renderer':
+                self.browser_view.extract_in_renderer(
+                    lambda result: self._process_renderer_result(result, scrape_requested))
+            else:
+                self.browser_view.page().toHtml(
+                    lambda html: self._process_html_content(html, scrape_requested))
+        elif scrape_requested:
             QMessageBox.critical(self, "Error", "Failed to load page")
-            self.start_button.setEnabled(True)
-            self.url_input.setEnabled(True)
 
-    def _process_html_content(self, html_content):
-        """Process the HTML content and store results"""
-        # Parse the HTML
+    def _process_html_content(self, html_content, show_results=True):
+        """Parse the HTML content once in the background, then fan the result out"""
+        self.page_timer.stop('extract')
+        self.page_timer.start('parse')
+        self.background_parser.submit(
+            self._analyze_page, html_content,
+            on_done=lambda result: self._on_page_analyzed(result, show_results))
+
+    def _process_renderer_result(self, result, show_results=True):
+        """Use the in-page extractor's JSON, falling back to toHtml() if it didn't run"""
+        if not result:
+            self.browser_view.page().toHtml(
+                lambda html: self._process_html_content(html, show_results))
+            return
+        self.page_timer.stop('extract')
+        self.page_timer.start('parse')
+        self.background_parser.submit(
+            self._analyze_extracted, result,
+            on_done=lambda analyzed: self._on_page_analyzed(analyzed, show_results))
+
+    def _analyze_extracted(self, result):
+        """Decode the renderer's JSON and build the structure overview (worker thread)"""
+        parsed_data = json.loads(result)
+        return parsed_data, self._format_structure(parsed_data)
+
+    def _analyze_page(self, html_content):
+        """Parse the page and build the structure overview from it (worker thread)"""
         parsed_data = self._parse_html_content(html_content)
+        return parsed_data, self._format_structure(parsed_data)
+
+    def _on_page_analyzed(self, result, show_results):
+        """Feed the single parse result to the structure viewer, results tree and save path"""
+        parsed_data, structure = result
+        self.page_timer.stop('parse')
+        self.page_timer.start('render')
+        self.last_parsed = parsed_data
+        self._set_formatted_html(structure)
+        if show_results:
+            self._show_parsed_results(parsed_data)
+        self.page_timer.stop('render')
+        self.current_timings = self.page_timer.as_dict()
+        self.timing_stats.add(self.current_timings)
+        self.timings_updated.emit(self.current_timings)
+
+    def _show_parsed_results(self, parsed_data):
+        """Store parsed results and fill the results tree (GUI thread)"""
         self.current_results = parsed_data
+        # Results exist now, so they can be saved
+        self.save_button.setEnabled(True)
         
         # Clear existing items
         self.results_tree.clear()
@@ -288,79 +377,14 @@ class ContentArea(QWidget):
         for i in range(self.results_tree.topLevelItemCount()):
             self.results_tree.topLevelItem(i).setExpanded(True)
 
-    def _parse_html_content(self, html_content):
+    def _parse_html_content(self, html_content, parser=None):
         """Parse HTML content and extract structured data"""
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Create a dictionary to store the parsed data
-        parsed_data = {
-            'title': soup.title.string if soup.title else 'No title',
-            'classes': {},
-            'headings': [],
-            'links': [],
-            'images': [],
-            'forms': []
-        }
-        
-        # Parse HTML classes and their elements
-        for element in soup.find_all(class_=True):
-            classes = element.get('class')
-            for class_name in classes:
-                if (class_name not in parsed_data['classes']):
-                    parsed_data['classes'][class_name] = {
-                        'count': 0,
-                        'tag_types': set(),
-                        'sample_content': []
-                    }
-                parsed_data['classes'][class_name]['count'] += 1
-                parsed_data['classes'][class_name]['tag_types'].add(element.name)
-                
-                # Store a sample of the content (up to 3 samples)
-                if len(parsed_data['classes'][class_name]['sample_content']) < 3:
-                    content = element.get_text().strip()
-                    if content:
-                        parsed_data['classes'][class_name]['sample_content'].append(content)
-        
-        # Convert sets to lists for JSON serialization
-        for class_info in parsed_data['classes'].values():
-            class_info['tag_types'] = list(class_info['tag_types'])
-        
-        # Extract headings
-        parsed_data['headings'] = [
-            {'level': int(h.name[1]), 'text': h.get_text().strip()}
-            for h in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        ]
-        
-        # Extract links
-        parsed_data['links'] = [
-            {'text': a.get_text().strip(), 'href': a.get('href')}
-            for a in soup.find_all('a', href=True)
-        ]
-        
-        # Extract images
-        parsed_data['images'] = [
-            {'src': img.get('src'), 'alt': img.get('alt', '')}
-            for img in soup.find_all('img', src=True)
-        ]
-        
-        # Extract forms
-        parsed_data['forms'] = [
-            {
-                'action': form.get('action', ''),
-                'method': form.get('method', 'get'),
-                'inputs': [
-                    {
-                        'type': input_tag.get('type', 'text'),
-                        'name': input_tag.get('name', ''),
-                        'id': input_tag.get('id', '')
-                    }
-                    for input_tag in form.find_all('input')
-                ]
-            }
-            for form in soup.find_all('form')
-        ]
-        
+        backend = resolve_backend(parser or self.parser_backend)
+        key = self.result_cache.key_for(html_content, backend)
+        parsed_data = self.result_cache.get(key)
+        if parsed_data is None:
+            parsed_data = extract_page(make_soup(html_content, backend))
+            self.result_cache.put(key, parsed_data)
         return parsed_data
 
     def on_interaction(self, data):
@@ -439,68 +463,67 @@ class ContentArea(QWidget):
         self.default_save_format = settings['save_format']
         self.highlight_elements = settings['highlight_elements']
         self.record_screenshots = settings['record_screenshots']
+        self.parser_backend = settings.get('parser_backend', AUTO)
+        self.extraction_mode = settings.get('extraction_mode', 'renderer')
+        self.scrape_mode = settings.get('scrape_mode', False)
+        if self._browser_view is not None:
+            self._browser_view.set_scrape_mode(self.scrape_mode)
 
-    def update_html_view(self):
-        """Update the HTML viewer with formatted content"""
-        self.browser_view.page().toHtml(self.format_and_set_html)
-
-    def format_and_set_html(self, html_content):
-        """Format HTML content into categorized sections"""
-        # Remove scripts and style tags
-        html_content = re.sub(r'<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>', '', html_content)
-        html_content = re.sub(r'<style\b[^<]*(?:(?!<\/style>)<[^<]*)*<\/style>', '', html_content)
+    def _format_structure(self, parsed_data):
+        """Build the structure overview text and its element positions from parsed data"""
+        title = parsed_data.get('title') or 'No title'
+        sections = {
+            'Page Title': [(title, "//title")],
+            'Navigation Links': [
+                (f"Link: {link['text']} -> {link['href']}", f"//a[@href='{link['href']}']")
+                for link in parsed_data.get('links', []) if link['text'] and link['href']
+            ],
+            'Main Headings': [
+                (h['text'], f"//h1[contains(text(), '{h['text']}')]")
+                for h in parsed_data.get('headings', []) if h['level'] == 1 and h['text']
+            ],
+            'Sub Headings': [
+                (h['text'], f"//h{h['level']}[contains(text(), '{h['text']}')]")
+                for h in parsed_data.get('headings', []) if h['level'] > 1 and h['text']
+            ],
+            'Forms': [
+                (f"Form: {form['action'] or '(no action)'} [{form['method']}]",
+                 f"//form[@action='{form['action']}']")
+                for form in parsed_data.get('forms', [])
+            ],
+            'Input Fields': [
+                (f"{field['type']}: {field['name'] or field['id'] or '(unnamed)'}",
+                 f"//input[@name='{field['name']}']" if field['name'] else f"//input[@id='{field['id']}']")
+                for form in parsed_data.get('forms', []) for field in form['inputs']
+                if field['name'] or field['id']
+            ],
+            'Images': [
+                (f"Image: {img['alt'] or 'No alt text'} ({img['src']})", f"//img[@src='{img['src']}']")
+                for img in parsed_data.get('images', []) if img['src']
+            ]
+        }
         
         # Store elements and their XPaths for highlighting
-        self.element_positions = {}
+        element_positions = {}
         current_position = 0
-        
-        formatted_output = "=== Page Structure Overview ===\n\n"
+        parts = ["=== Page Structure Overview ===\n\n"]
         
         for category, config in self.categories.items():
-            matches = re.finditer(config['pattern'], html_content, re.DOTALL)
-            items = list(matches)
-            
-            if items:
-                formatted_output += f"\n{'-' * 40}\n"
-                formatted_output += f"{category}\n"
-                formatted_output += f"{'-' * 40}\n"
-                
-                for item in items:
-                    line = ""
-                    try:
-                        if category == 'Navigation Links':
-                            url, text = item.groups()
-                            if url and text:  # Check if values exist
-                                line = f"{config['prefix']}Link: {text.strip()} -> {url}\n"
-                                xpath = f"//a[@href='{url}']"
-                        elif category == 'Images':
-                            src = item.group(1)
-                            alt = item.group(2) if item.group(2) else 'No alt text'
-                            if src:  # Check if src exists
-                                line = f"{config['prefix']}Image: {alt} ({src})\n"
-                                xpath = f"//img[@src='{src}']"
-                        else:
-                            content = item.group(1) if item.groups() else item.group(0)
-                            if content:  # Check if content exists
-                                line = f"{config['prefix']}{content.strip()}\n"
-                                # Create appropriate XPath based on category
-                                if category == 'Page Title':
-                                    xpath = "//title"
-                                elif category == 'Main Headings':
-                                    xpath = f"//h1[contains(text(), '{content.strip()}')]"
-                                elif category == 'Sub Headings':
-                                    xpath = f"//h2[contains(text(), '{content.strip()}')]|//h3[contains(text(), '{content.strip()}')]"
-                                else:
-                                    continue
-                        
-                        # Only store position and add line if we have content
-                        if line:
-                            self.element_positions[current_position] = xpath
-                            current_position += len(line)
-                            formatted_output += line
-                    except (AttributeError, IndexError) as e:
-                        print(f"Error processing {category} item: {e}")
-                        continue
+            entries = sections.get(category)
+            if not entries:
+                continue
+            parts.append(f"\n{'-' * 40}\n{category}\n{'-' * 40}\n")
+            for text, xpath in entries:
+                line = f"{config['prefix']}{text}\n"
+                element_positions[current_position] = xpath
+                current_position += len(line)
+                parts.append(line)
+        
+        return ''.join(parts), element_positions
+
+    def _set_formatted_html(self, result):
+        """Show the formatted structure overview (GUI thread)"""
+        formatted_output, self.element_positions = result
         
         # Set up HTML viewer with formatting
         self.html_viewer.setFont(QFont("Consolas", 10))
@@ -676,8 +699,9 @@ class ContentArea(QWidget):
         # Clear HTML viewer
         self.html_viewer.clear()
         
-        # Reset browser view
-        self.browser_view.setUrl(QUrl("about:blank"))
+        # Reset browser view (nothing to reset if it was never created)
+        if self._browser_view is not None:
+            self._browser_view.setUrl(QUrl("about:blank"))
         
         # Disable save button
         self.save_button.setEnabled(False)
\ No newline at end of file
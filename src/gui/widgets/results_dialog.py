@@ -81,18 +81,14 @@ class ResultsDialog(QDialog):
         if confirm == QMessageBox.StandardButton.Yes:
             deleted_count = 0
             for item in selected_items:
-                date_str = item.text(1)
-                try:
-                    dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                    timestamp = dt.strftime("%Y%m%d_%H%M%S")
-                    
-                    if self.scrape_storage.delete_scrape(timestamp):
-                        root = self.results_tree.invisibleRootItem()
-                        root.removeChild(item)
-                        deleted_count += 1
-                except ValueError as e:
-                    print(f"Error processing date: {e}")
-                    
+                # The save timestamp stored by load_scrapes
+                timestamp = item.data(0, Qt.ItemDataRole.UserRole)
+
+                if self.scrape_storage.delete_scrape(timestamp):
+                    root = self.results_tree.invisibleRootItem()
+                    root.removeChild(item)
+                    deleted_count += 1
+
             if deleted_count > 0:
                 QMessageBox.information(self, "Success", 
                     f"Successfully deleted {deleted_count} scrape{'s' if deleted_count != 1 else ''}.")
@@ -102,49 +98,22 @@ class ResultsDialog(QDialog):
             self.update_selection_count()
     
     def load_scrapes(self):
-        """Load and display all saved scrapes"""
+        """List all saved scrapes from their summaries; full content loads on demand"""
         self.results_tree.clear()
-        scrapes = self.scrape_storage.load_scrapes()
+        scrapes = self.scrape_storage.list_scrapes()
         
         for scrape in scrapes:
-            url = scrape.get('url', 'No URL')
+            url = scrape.get('url') or 'No URL'
             date = datetime.fromisoformat(scrape['timestamp']).strftime("%Y-%m-%d %H:%M:%S")
             
-            # Get content from nested data structure
-            content = None
-            if 'data' in scrape and 'content' in scrape['data']:
-                content = scrape['data']['content']
-            elif 'content' in scrape:
-                content = scrape['content']
-            
-            # Calculate total elements
-            element_count = 0
-            if content:
-                # Count elements from all categories
-                if 'classes' in content:
-                    for class_info in content['classes'].values():
-                        element_count += class_info.get('count', 0)
-                if 'headings' in content:
-                    element_count += len(content['headings'])
-                if 'links' in content:
-                    element_count += len(content['links'])
-                if 'images' in content:
-                    element_count += len(content['images'])
-                if 'forms' in content:
-                    element_count += len(content['forms'])
-                    # Count form inputs
-                    for form in content['forms']:
-                        element_count += len(form.get('inputs', []))
-            
             item = QTreeWidgetItem(self.results_tree, [
                 url,
                 date,
-                f"{element_count} elements"
+                f"{scrape['element_count']} elements"
             ])
             
-            # Store timestamp for loading
-            save_timestamp = datetime.fromisoformat(scrape['timestamp']).strftime("%Y%m%d_%H%M%S")
-            item.setData(0, Qt.ItemDataRole.UserRole, save_timestamp)
+            # Store the save timestamp for loading
+            item.setData(0, Qt.ItemDataRole.UserRole, scrape['key'])
     
     def load_selected_scrape(self):
         """Load the selected scrape into the main window"""
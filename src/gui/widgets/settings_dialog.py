@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
                             QLabel, QCheckBox, QComboBox, QFormLayout)
 from PyQt6.QtCore import Qt
+from src.scraping.parsers import available_backends, AUTO
 
 class SettingsDialog(QDialog):
     def __init__(self, settings_manager, parent=None):
@@ -31,6 +32,17 @@ class SettingsDialog(QDialog):
         self.record_screenshots = QCheckBox()
         form_layout.addRow("Record screenshots:", self.record_screenshots)
         
+        self.parser_backend = QComboBox()
+        self.parser_backend.addItems([AUTO] + available_backends())
+        form_layout.addRow("HTML parser:", self.parser_backend)
+        
+        self.extraction_mode = QComboBox()
+        self.extraction_mode.addItems(["renderer", "python"])
+        form_layout.addRow("Extract page data in:", self.extraction_mode)
+        
+        self.scrape_mode = QCheckBox()
+        form_layout.addRow("Scrape mode (block images, fonts, media, trackers):", self.scrape_mode)
+        
         layout.addLayout(form_layout)
         
         # Buttons
@@ -53,13 +65,19 @@ class SettingsDialog(QDialog):
         self.save_format.setCurrentText(settings['save_format'])
         self.highlight_elements.setChecked(settings['highlight_elements'])
         self.record_screenshots.setChecked(settings['record_screenshots'])
+        self.parser_backend.setCurrentText(settings['parser_backend'])
+        self.extraction_mode.setCurrentText(settings['extraction_mode'])
+        self.scrape_mode.setChecked(settings['scrape_mode'])
     
     def save_settings(self):
         new_settings = {
             'auto_scroll': self.auto_scroll.isChecked(),
             'save_format': self.save_format.currentText(),
             'highlight_elements': self.highlight_elements.isChecked(),
-            'record_screenshots': self.record_screenshots.isChecked()
+            'record_screenshots': self.record_screenshots.isChecked(),
+            'parser_backend': self.parser_backend.currentText(),
+            'extraction_mode': self.extraction_mode.currentText(),
+            'scrape_mode': self.scrape_mode.isChecked()
         }
         self.settings_manager.save_settings(new_settings)
         self.accept()
\ No newline at end of file
@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QProgressBar
 from PyQt6.QtCore import Qt
+from src.scraping.timing import format_timings
 
 class StatusBar(QWidget):
     def __init__(self):
@@ -13,6 +14,9 @@ class StatusBar(QWidget):
         # Status message
         self.status_label = QLabel("Ready")
         
+        # Per-stage timings of the last page
+        self.timings_label = QLabel("")
+        
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setFixedWidth(200)
@@ -20,6 +24,14 @@ class StatusBar(QWidget):
         
         layout.addWidget(self.status_label)
         layout.addStretch()
+        layout.addWidget(self.timings_label)
         layout.addWidget(self.progress_bar)
         
         self.setLayout(layout)
+
+    def show_message(self, message):
+        self.status_label.setText(message)
+
+    def show_timings(self, timings):
+        """Show a stage -> milliseconds breakdown, updated as stages finish"""
+        self.timings_label.setText(format_timings(timings))
@@ -0,0 +1,47 @@
+"""Import saved JSON scrapes into the SQLite store: python -m src.migrate_scrapes [options]
+
+The GUI does this by itself the first time it creates the database; run it
+by hand to import files added later or to fill a database somewhere else.
+"""
+import argparse
+import os
+import sys
+import time
+
+from src.utils.scrape_database import (SQLiteScrapeStorage, import_json_scrapes,
+                                       default_database_path, DEFAULT_BATCH_SIZE)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m src.migrate_scrapes',
+                                     description='Import saved JSON scrapes into SQLite.')
+    parser.add_argument('--json-dir', default=None,
+                        help="directory of scrape_*.json files (default: the GUI's saved_scrapes)")
+    parser.add_argument('--db', default=default_database_path(), help="SQLite database to fill")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help="rows per transaction")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    storage = SQLiteScrapeStorage(args.db, import_json=False)
+    json_dir = args.json_dir or storage.storage_dir
+    if not os.path.isdir(json_dir):
+        print(f"No such directory: {json_dir}", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    try:
+        imported = import_json_scrapes(storage, json_dir, args.batch_size)
+        total = storage.count()
+    finally:
+        storage.close()
+    elapsed = time.perf_counter() - start
+    print(f"Imported {imported} scrapes from {json_dir} into {args.db} in {elapsed:.2f}s "
+          f"({total} stored)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+// In-page extractor for WebScrape. Builds the same structure as the Python
+// extract_page() straight from the live DOM, so only a compact JSON string
+// has to cross over to the application instead of the serialized page.
+(function () {
+    if (window.__webscrapeExtract) return;
+
+    var HEADINGS = {H1: 1, H2: 2, H3: 3, H4: 4, H5: 5, H6: 6};
+    var MAX_CLASS_SAMPLES = 3;
+
+    function text(el) {
+        return (el.textContent || '').trim();
+    }
+
+    window.__webscrapeExtract = function () {
+        // No prototype, so classes named 'constructor', 'toString' or '__proto__'
+        // are plain keys instead of inherited Object members
+        var classes = Object.create(null);
+        var headings = [];
+        var paragraphs = [];
+        var links = [];
+        var images = [];
+        var forms = [];
+        var title = null;
+
+        var all = document.getElementsByTagName('*');
+        for (var i = 0; i < all.length; i++) {
+            var el = all[i];
+            var tag = el.tagName.toLowerCase();
+
+            var classList = el.classList;
+            for (var c = 0; classList && c < classList.length; c++) {
+                var name = classList[c];
+                var info = classes[name];
+                if (!info) {
+                    info = classes[name] = {count: 0, tag_types: [], sample_content: []};
+                }
+                info.count++;
+                if (info.tag_types.indexOf(tag) === -1) info.tag_types.push(tag);
+                if (info.sample_content.length < MAX_CLASS_SAMPLES) {
+                    var sample = text(el);
+                    if (sample) info.sample_content.push(sample);
+                }
+            }
+
+            if (HEADINGS[el.tagName]) {
+                headings.push({level: HEADINGS[el.tagName], text: text(el)});
+            } else if (tag === 'p') {
+                paragraphs.push(text(el));
+            } else if (tag === 'a') {
+                if (el.hasAttribute('href')) {
+                    links.push({text: text(el), href: el.getAttribute('href')});
+                }
+            } else if (tag === 'img') {
+                if (el.hasAttribute('src')) {
+                    images.push({src: el.getAttribute('src'), alt: el.getAttribute('alt') || ''});
+                }
+            } else if (tag === 'form') {
+                var inputs = [];
+                var fields = el.querySelectorAll('input');
+                for (var f = 0; f < fields.length; f++) {
+                    inputs.push({
+                        type: fields[f].getAttribute('type') || 'text',
+                        name: fields[f].getAttribute('name') || '',
+                        id: fields[f].getAttribute('id') || ''
+                    });
+                }
+                forms.push({
+                    action: el.getAttribute('action') || '',
+                    method: el.getAttribute('method') || 'get',
+                    inputs: inputs
+                });
+            } else if (tag === 'title' && title === null) {
+                title = el.textContent;
+            }
+        }
+
+        return JSON.stringify({
+            title: title !== null ? title : 'No title',
+            classes: classes,
+            headings: headings,
+            paragraphs: paragraphs,
+            links: links,
+            images: images,
+            forms: forms
+        });
+    };
+})();
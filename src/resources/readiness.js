@@ -0,0 +1,67 @@
+// Readiness probe for WebScrape. Counts in-flight fetch/XHR requests and
+// records the time of the last network or DOM activity, so the application
+// can extract as soon as the page has settled instead of sleeping.
+(function () {
+    if (window.__webscrapeReady) return;
+
+    var pending = 0;
+    var lastActivity = Date.now();
+
+    function touch() {
+        lastActivity = Date.now();
+    }
+
+    function done() {
+        pending = Math.max(0, pending - 1);
+        touch();
+    }
+
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        pending++;
+        touch();
+        this.addEventListener('loadend', done);
+        return originalSend.apply(this, arguments);
+    };
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            pending++;
+            touch();
+            return originalFetch.apply(this, arguments).then(
+                function (response) { done(); return response; },
+                function (error) { done(); throw error; }
+            );
+        };
+    }
+
+    // Scripts, images and other subresources finishing also count as activity
+    if (window.PerformanceObserver) {
+        try {
+            new PerformanceObserver(touch).observe({type: 'resource', buffered: false});
+        } catch (e) {}
+    }
+
+    function observeDom() {
+        new MutationObserver(touch).observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true, characterData: true
+        });
+    }
+    if (document.documentElement) {
+        observeDom();
+    } else {
+        document.addEventListener('readystatechange', function once() {
+            document.removeEventListener('readystatechange', once);
+            observeDom();
+        });
+    }
+
+    window.__webscrapeReady = function () {
+        return JSON.stringify({
+            pending: pending,
+            quietFor: Date.now() - lastActivity,
+            readyState: document.readyState
+        });
+    };
+})();
@@ -0,0 +1,145 @@
+import heapq
+import time
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
+
+# URLs queued per host that count as ready work, per allowed concurrent request
+HOST_WINDOW_PER_SLOT = 4
+# Hard cap on URLs pulled ahead of dispatch, whatever their hosts
+DEFAULT_MAX_LOOKAHEAD = 50_000
+
+
+class BatchRunner:
+    """Run a per-URL job over many URLs with a global and a per-host cap.
+
+    URLs are queued per host and dispatched round-robin, so a host that is
+    already at its limit never ties up a worker thread while other hosts
+    still have work waiting. With a PolitenessScheduler, hosts are also paced
+    by their token buckets and failed URLs are re-queued after a backoff.
+
+    URLs are pulled from the input lazily until enough hosts have work to
+    keep every worker busy. Only a few URLs per host count towards that, so
+    a host-sorted list is read ahead until the next hosts show up (at most
+    max_lookahead URLs) instead of stalling on the first host's limit.
+    """
+
+    def __init__(self, max_workers=16, per_host=4, scheduler=None, queue_gauge=None,
+                 max_lookahead=DEFAULT_MAX_LOOKAHEAD):
+        self.max_workers = max(1, int(max_workers))
+        self.per_host = max(1, int(per_host))
+        self.max_lookahead = max(self.max_workers, int(max_lookahead))
+        self.scheduler = scheduler
+        # Optional metrics Gauge kept at the number of URLs not yet started
+        self.queue_gauge = queue_gauge
+
+    @staticmethod
+    def host_of(url):
+        return urlparse(url).netloc.lower()
+
+    def run(self, urls, job):
+        """Yield (url, result, error) tuples in completion order"""
+        pending = OrderedDict()  # host -> deque of urls, insertion order = round robin
+        in_flight = {}  # host -> number of running jobs
+        delayed = []  # heap of (not_before, seq, url) waiting out a retry backoff
+        attempts = {}  # url -> retries so far, only for urls that failed
+        url_iter = iter(urls)
+        total = len(urls) if hasattr(urls, '__len__') else None
+        taken = 0
+        exhausted = False
+        seq = 0
+
+        def queue(url):
+            pending.setdefault(self.host_of(url), deque()).append(url)
+
+        def refill(now):
+            # Pull URLs lazily: at most max_lookahead of a 40k list are held at once
+            nonlocal exhausted, taken
+            while delayed and delayed[0][0] <= now:
+                queue(heapq.heappop(delayed)[2])
+            window = self.per_host * HOST_WINDOW_PER_SLOT
+            queued = sum(len(q) for q in pending.values())
+            # Ready work: queued URLs, but no more than window per host
+            ready = sum(min(len(q), window) for q in pending.values())
+            while (not exhausted and ready < self.max_workers * HOST_WINDOW_PER_SLOT
+                   and queued < self.max_lookahead):
+                try:
+                    url = next(url_iter)
+                except StopIteration:
+                    exhausted = True
+                    break
+                host_queue = pending.setdefault(self.host_of(url), deque())
+                host_queue.append(url)
+                if len(host_queue) <= window:
+                    ready += 1
+                queued += 1
+                taken += 1
+            if self.queue_gauge is not None:
+                # Unsized iterables only count what has been pulled so far
+                not_pulled = total - taken if total is not None and not exhausted else 0
+                self.queue_gauge.set(queued + len(delayed) + not_pulled)
+
+        def next_url(now):
+            for host in list(pending):
+                if in_flight.get(host, 0) >= self.per_host:
+                    continue
+                if self.scheduler and not self.scheduler.try_acquire(host, now):
+                    continue
+                queue_ = pending.pop(host)
+                url = queue_.popleft()
+                if queue_:
+                    pending[host] = queue_  # re-append: move host to the back
+                return host, url
+            return None, None
+
+        def next_wake(now):
+            # Earliest moment a paced host or a delayed retry becomes runnable
+            times = [delayed[0][0]] if delayed else []
+            if self.scheduler:
+                times.extend(self.scheduler.ready_at(host, now) for host in pending
+                             if in_flight.get(host, 0) < self.per_host)
+            return max(0.0, min(times) - now) if times else None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            while True:
+                now = time.monotonic()
+                refill(now)
+                while len(futures) < self.max_workers:
+                    host, url = next_url(now)
+                    if url is None:
+                        break
+                    in_flight[host] = in_flight.get(host, 0) + 1
+                    futures[executor.submit(job, url)] = (host, url)
+
+                # With every worker busy only a completion can free a slot
+                timeout = None if len(futures) >= self.max_workers else next_wake(now)
+                if not futures:
+                    if exhausted and not pending and not delayed:
+                        return
+                    time.sleep(timeout if timeout is not None else 0.01)
+                    continue
+
+                done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    host, url = futures.pop(future)
+                    in_flight[host] -= 1
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        delay = None
+                        if self.scheduler:
+                            attempt = attempts.get(url, 0)
+                            delay = self.scheduler.on_failure(host, e, attempt)
+                        if delay is not None:
+                            attempts[url] = attempt + 1
+                            seq += 1
+                            heapq.heappush(delayed, (time.monotonic() + delay, seq, url))
+                            continue
+                        attempts.pop(url, None)
+                        yield url, None, e
+                    else:
+                        attempts.pop(url, None)
+                        if self.scheduler:
+                            self.scheduler.on_success(host)
+                        yield url, result, None
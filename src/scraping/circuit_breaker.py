@@ -0,0 +1,118 @@
+import threading
+import time
+
+import requests
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one host.
+
+    failure_threshold consecutive failures open the circuit. After
+    reset_timeout seconds a single probe request is let through (half-open);
+    its success closes the circuit, its failure opens it for another period.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    def allow(self, now):
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and now - self.opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+            self.probe_in_flight = False
+        if self.state == HALF_OPEN and not self.probe_in_flight:
+            self.probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def success(self):
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.probe_in_flight = False
+        self.state = CLOSED
+
+    def failure(self, now):
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.probe_in_flight = False
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.times_opened += 1
+            self.state = OPEN
+            self.opened_at = now
+
+    def release(self):
+        """Give back a probe slot whose request failed for reasons unrelated to the host"""
+        self.probe_in_flight = False
+
+
+class HostCircuitBreakers:
+    """One CircuitBreaker per host, safe to share between batch worker threads"""
+
+    def __init__(self, failure_threshold=5, reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers = {}
+        self._lock = threading.Lock()
+
+    def _breaker(self, host):
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            breaker = self.breakers[host] = CircuitBreaker(self.failure_threshold,
+                                                           self.reset_timeout)
+        return breaker
+
+    def before_request(self, host):
+        with self._lock:
+            if not self._breaker(host).allow(time.monotonic()):
+                raise CircuitOpenError(f"Circuit open for {host}, skipping request")
+
+    def record_success(self, host):
+        with self._lock:
+            self._breaker(host).success()
+
+    def record_failure(self, host):
+        with self._lock:
+            self._breaker(host).failure(time.monotonic())
+
+    def release(self, host):
+        with self._lock:
+            self._breaker(host).release()
+
+    def state(self, host):
+        with self._lock:
+            breaker = self.breakers.get(host)
+            return breaker.state if breaker else CLOSED
+
+    def stats(self):
+        with self._lock:
+            return {
+                host: {
+                    'state': breaker.state,
+                    'consecutive_failures': breaker.consecutive_failures,
+                    'successes': breaker.successes,
+                    'failures': breaker.failures,
+                    'rejected': breaker.rejected,
+                    'times_opened': breaker.times_opened
+                }
+                for host, breaker in self.breakers.items()
+            }
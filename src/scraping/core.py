@@ -0,0 +1,414 @@
+import socket
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from src.scraping.batch import BatchRunner
+from src.scraping.politeness import PolitenessScheduler
+from src.scraping.circuit_breaker import HostCircuitBreakers, CLOSED, HALF_OPEN, OPEN
+from src.scraping.parsers import resolve_backend, AUTO
+from src.scraping.process_pool import ParsePool, parse_document, effective_encoding, response_encoding
+from src.scraping.streaming import extract_stream, DEFAULT_CHUNK_SIZE
+from src.scraping.http_cache import HTTPCache, CachingAdapter
+from src.scraping.result_cache import ResultCache
+from src.scraping.crawler import Crawler
+from src.scraping.timing import StageTimer, TimingStats
+from src.utils.metrics import MetricsRegistry, Counter, Gauge
+from src.utils.tracing import NULL_TRACER
+
+
+def _ignore(*args):
+    pass
+
+
+# (connect, read) seconds; without a read timeout a black-holed host hangs a worker forever
+DEFAULT_TIMEOUT = (10, 30)
+
+# Circuit breaker states as gauge values
+BREAKER_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class ScrapeCore:
+    """Fetching, parsing and batching without any Qt dependency.
+
+    Results come back as return values and iterators; progress, status and
+    stage timings go to optional plain callbacks. WebScraper wraps this for
+    the GUI, the CLI (src/cli.py) uses it directly.
+
+    Every scraped page carries data['timings']: milliseconds spent in dns
+    (first lookup of a host only), wait (request sent until headers
+    received), download, decode, parse and extract. Streamed pages report a
+    single 'stream' stage, since download and parsing interleave there, and
+    pages parsed in the process pool report decode + parse + extract as
+    'parse'. timing_stats aggregates them into histograms.
+
+    metrics (a MetricsRegistry) counts requests, bytes and errors per host,
+    stage durations and queue depth, and reports the caches, breakers and
+    scheduler through their stats(); see src/utils/metrics.py for exporters.
+
+    tracer (a src.utils.tracing.Tracer) writes one span per scrape with
+    child spans for the fetch, each redirect hop and the decode, parse and
+    extract stages. Tracing is off unless a tracer is passed.
+
+    timeout (seconds, or a (connect, read) pair) applies to every request,
+    so an unresponsive host raises requests.Timeout and trips its breaker.
+    """
+    
+    def __init__(self, max_workers=16, per_host=4, parser_backend=AUTO, http_cache=True,
+                 result_cache=True, politeness=True, circuit_breakers=True, parse_workers=0,
+                 metrics=True, tracer=None, timeout=DEFAULT_TIMEOUT):
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.parser_backend = parser_backend
+        self.timeout = timeout
+        self.session = requests.Session()
+        
+        # http_cache: True for the default on-disk cache, an HTTPCache, or False/None to disable
+        if http_cache is True:
+            http_cache = HTTPCache()
+        self.http_cache = http_cache or None
+        # Same for result_cache: skips re-parsing pages whose body hasn't changed
+        if result_cache is True:
+            result_cache = ResultCache()
+        self.result_cache = result_cache or None
+        # And politeness: per-host pacing, backoff and retries for batch runs
+        if politeness is True:
+            politeness = PolitenessScheduler()
+        self.scheduler = politeness or None
+        # And circuit_breakers: stop hitting hosts that keep failing
+        if circuit_breakers is True:
+            circuit_breakers = HostCircuitBreakers()
+        self.breakers = circuit_breakers or None
+        # parse_workers > 0 moves parsing into that many processes to use every core
+        self.parse_pool = ParsePool(parse_workers) if parse_workers else None
+        self.timing_stats = TimingStats()
+        self._resolved_hosts = set()
+        # metrics: True for a new MetricsRegistry, a registry to share (e.g. with
+        # ScrapeStorage), or False/None to disable
+        if metrics is True:
+            metrics = MetricsRegistry()
+        self.metrics = metrics or None
+        if self.metrics is not None:
+            self._register_metrics()
+        self.tracer = tracer or NULL_TRACER
+        
+        # Size the connection pool so concurrent batch workers don't queue on it
+        if self.http_cache:
+            adapter = CachingAdapter(self.http_cache, pool_connections=max_workers,
+                                     pool_maxsize=max_workers)
+        else:
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
+    def _register_metrics(self):
+        m = self.metrics
+        self._requests_metric = m.counter(
+            'webscrape_requests', 'HTTP requests by host and status code', ['host', 'code'])
+        self._bytes_metric = m.counter(
+            'webscrape_response_bytes', 'Response body bytes received', ['host'])
+        self._errors_metric = m.counter(
+            'webscrape_errors', 'Failed scrapes by host and error type', ['host', 'error'])
+        self._pages_metric = m.counter('webscrape_pages', 'Pages scraped successfully')
+        self._in_flight_metric = m.gauge(
+            'webscrape_requests_in_flight', 'Requests currently in progress')
+        self._queue_metric = m.gauge(
+            'webscrape_queue_depth', 'URLs of the running batch not started yet')
+        self._stage_metric = m.histogram(
+            'webscrape_stage_seconds', 'Time spent per scrape stage', ['stage'])
+        m.register_collector(self._collect_metrics)
+
+    def _collect_metrics(self):
+        """Metrics read from the caches, breakers and scheduler at render time"""
+        metrics = []
+        if self.http_cache is not None:
+            stats = self.http_cache.stats()
+            for key in ('hits', 'misses', 'stores', 'evictions'):
+                counter = Counter(f'webscrape_http_cache_{key}', f'HTTP cache {key}')
+                counter.inc(stats[key])
+                metrics.append(counter)
+            for key in ('entries', 'bytes'):
+                gauge = Gauge(f'webscrape_http_cache_{key}', f'HTTP cache {key}')
+                gauge.set(stats[key])
+                metrics.append(gauge)
+        if self.result_cache is not None:
+            stats = self.result_cache.stats()
+            lookups = Counter('webscrape_result_cache_lookups', 'Result cache lookups', ['result'])
+            lookups.inc(stats['hits'], result='hit')
+            lookups.inc(stats['disk_hits'], result='disk_hit')
+            lookups.inc(stats['misses'], result='miss')
+            ratio = Gauge('webscrape_result_cache_hit_ratio', 'Result cache hit ratio')
+            ratio.set(stats['hit_ratio'])
+            metrics.extend([lookups, ratio])
+        if self.breakers is not None:
+            state = Gauge('webscrape_circuit_state',
+                          'Circuit breaker state per host (0 closed, 1 half-open, 2 open)', ['host'])
+            rejected = Counter('webscrape_circuit_rejected', 'Requests refused by an open circuit', ['host'])
+            for host, stats in self.breakers.stats().items():
+                state.set(BREAKER_STATE_VALUES.get(stats['state'], 0), host=host)
+                rejected.inc(stats['rejected'], host=host)
+            metrics.extend([state, rejected])
+        if self.scheduler is not None:
+            rate = Gauge('webscrape_host_rate', 'Current politeness rate per host (requests/s)', ['host'])
+            for host, stats in self.scheduler.stats().items():
+                rate.set(stats['rate'], host=host)
+            metrics.append(rate)
+        return metrics
+
+    def _count_error(self, url, error):
+        if self.metrics is None:
+            return
+        response = getattr(error, 'response', None)
+        kind = f"http_{response.status_code}" if response is not None else type(error).__name__
+        self._errors_metric.inc(host=urlparse(url).netloc.lower(), error=kind)
+
+    def validate_url(self, url):
+        try:
+            result = urlparse(url)
+            return all([result.scheme, result.netloc])
+        except:
+            return False
+    
+    def scrape(self, url, parser=None, stream=False, max_bytes=None,
+               on_progress=_ignore, on_status=_ignore, on_timings=_ignore):
+        """Scrape one URL and return its data; raises on failure.
+
+        on_timings gets the stage durations so far after each step.
+        """
+        if not self.validate_url(url):
+            raise ValueError("Invalid URL format")
+            
+        on_status("Starting scraping...")
+        on_progress(10)
+        timer = StageTimer(self.tracer)
+        
+        with self.tracer.span('scrape', url=url):
+            try:
+                if stream:
+                    on_status("Streaming and parsing content...")
+                    data = self._scrape_streaming(url, max_bytes, timer)
+                    if data['truncated']:
+                        on_status(f"Stopped after {data['bytes_read']} bytes (max_bytes reached)")
+                else:
+                    content, encoding = self._fetch(url, timer)
+                    
+                    on_progress(30)
+                    on_timings(timer.as_dict())
+                    on_status("Parsing content...")
+                    
+                    data = self._extract(content, encoding, parser, timer)
+            except Exception as e:
+                self._count_error(url, e)
+                raise
+        
+        on_progress(90)
+        on_status("Finalizing results...")
+        self._record_timings(data, timer)
+        on_timings(data['timings'])
+        return data
+
+    def iter_scrape(self, urls, max_workers=None, per_host=None, parser=None,
+                    stream=False, max_bytes=None):
+        """Scrape many URLs concurrently, yielding (url, data, error) as each finishes"""
+        runner = BatchRunner(max_workers or self.max_workers, per_host or self.per_host,
+                             self.scheduler, self._queue_metric if self.metrics else None)
+        return runner.run(urls, lambda url: self._scrape_one(url, parser, stream, max_bytes))
+
+    def iter_crawl(self, seeds, state_path, on_progress=_ignore, on_status=_ignore, **options):
+        """Breadth-first crawl from seeds, yielding (url, data, error) per page.
+
+        Resumes from state_path if it already exists; options are passed to
+        Crawler (max_depth, max_pages, allowed_domains, ...).
+        """
+        crawler = Crawler(self, state_path, **options)
+        try:
+            crawler.add_seeds(seeds)
+            on_status("Crawling...")
+            for fetched, result in enumerate(crawler.crawl(), 1):
+                yield result
+                # Counting the frontier is a table scan, so only refresh progress now and then
+                if fetched % 100 == 0:
+                    counts = crawler.state.counts()
+                    finished = counts['done'] + counts['failed']
+                    total = finished + counts['queued'] + counts['in_flight']
+                    on_progress(int(finished * 100 / total) if total else 100)
+            counts = crawler.state.counts()
+            on_status(f"Crawl finished: {counts['done']} pages, {counts['failed']} failed")
+        finally:
+            crawler.close()
+
+    def _scrape_one(self, url, parser=None, stream=False, max_bytes=None):
+        """Fetch and extract a single URL, raising on failure (used by batch workers)"""
+        if not self.validate_url(url):
+            raise ValueError("Invalid URL format")
+        try:
+            with self.tracer.span('scrape', url=url):
+                if stream:
+                    timer = StageTimer(self.tracer)
+                    data = self._scrape_streaming(url, max_bytes, timer)
+                    self._record_timings(data, timer)
+                else:
+                    _, data = self._fetch_and_extract(url, parser)
+        except Exception as e:
+            self._count_error(url, e)
+            raise
+        data['url'] = url
+        return data
+
+    def fetch_and_extract(self, url, parser=None):
+        """Fetch and extract a URL, returning (raw bytes, data); raises on failure"""
+        try:
+            with self.tracer.span('scrape', url=url):
+                return self._fetch_and_extract(url, parser)
+        except Exception as e:
+            self._count_error(url, e)
+            raise
+
+    def _fetch_and_extract(self, url, parser=None):
+        timer = StageTimer(self.tracer)
+        content, encoding = self._fetch(url, timer)
+        data = self._extract(content, encoding, parser, timer)
+        self._record_timings(data, timer)
+        return content, data
+
+    def _record_timings(self, data, timer):
+        data['timings'] = timer.as_dict()
+        self.timing_stats.add(data['timings'])
+        if self.metrics is not None:
+            self._pages_metric.inc()
+            for stage, ms in data['timings'].items():
+                self._stage_metric.observe(ms / 1000, stage=stage)
+
+    def _resolve(self, url, timer):
+        """Time the DNS lookup the first time a host is seen (the OS caches it afterwards)"""
+        host = urlparse(url).hostname
+        if not host or host in self._resolved_hosts:
+            return
+        with timer.stage('dns'):
+            try:
+                socket.getaddrinfo(host, None)
+            except OSError:
+                pass  # The request itself reports the failure
+        self._resolved_hosts.add(host)
+
+    def _get(self, url, **kwargs):
+        """session.get guarded by the host's circuit breaker, counted in the metrics"""
+        if self.metrics is None:
+            return self._guarded_get(url, **kwargs)
+        
+        host = urlparse(url).netloc.lower()
+        self._in_flight_metric.inc()
+        try:
+            response = self._guarded_get(url, **kwargs)
+        except Exception:
+            self._requests_metric.inc(host=host, code='error')
+            raise
+        finally:
+            self._in_flight_metric.dec()
+        self._requests_metric.inc(host=host, code=str(response.status_code))
+        return response
+
+    def _guarded_get(self, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        if self.breakers is None:
+            return self.session.get(url, **kwargs)
+        
+        host = urlparse(url).netloc.lower()
+        self.breakers.before_request(host)
+        try:
+            response = self.session.get(url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            self.breakers.record_failure(host)
+            raise
+        except Exception:
+            self.breakers.release(host)
+            raise
+        
+        if response.status_code >= 500:
+            self.breakers.record_failure(host)
+        else:
+            self.breakers.record_success(host)
+        return response
+
+    def _fetch(self, url, timer=None):
+        timer = timer or StageTimer()
+        self._resolve(url, timer)
+        with self.tracer.span('fetch', url=url) as span:
+            started = time.time()
+            start = time.perf_counter()
+            response = self._get(url)
+            elapsed = time.perf_counter() - start
+            # requests stops response.elapsed once the headers are in; the rest is the body
+            wait = min(response.elapsed.total_seconds(), elapsed)
+            timer.add('wait', wait)
+            timer.add('download', elapsed - wait)
+            if self.metrics is not None:
+                self._bytes_metric.inc(len(response.content), host=urlparse(url).netloc.lower())
+            span.set(status=response.status_code, bytes=len(response.content),
+                     final_url=response.url, redirects=len(response.history),
+                     from_cache=getattr(response, 'from_cache', False))
+            self._trace_redirects(response, started)
+            response.raise_for_status()
+        return response.content, response_encoding(response)
+
+    def _scrape_streaming(self, url, max_bytes=None, timer=None):
+        """Download in chunks and extract incrementally, never holding the whole body"""
+        timer = timer or StageTimer()
+        self._resolve(url, timer)
+        with self.tracer.span('fetch', url=url, stream=True) as span:
+            started = time.time()
+            with timer.stage('wait'):
+                response = self._get(url, stream=True)
+            span.set(status=response.status_code, final_url=response.url,
+                     redirects=len(response.history))
+            self._trace_redirects(response, started)
+            with response:
+                response.raise_for_status()
+                with timer.stage('stream'):
+                    data, bytes_read, truncated = extract_stream(
+                        response.iter_content(DEFAULT_CHUNK_SIZE), response_encoding(response),
+                        max_bytes)
+            span.set(bytes=bytes_read, truncated=truncated)
+        if self.metrics is not None:
+            self._bytes_metric.inc(bytes_read, host=urlparse(url).netloc.lower())
+        data['bytes_read'] = bytes_read
+        data['truncated'] = truncated
+        return data
+
+    def _trace_redirects(self, response, started):
+        """One span per redirect hop, laid end to end from when the request started"""
+        if not self.tracer.enabled:
+            return
+        for hop in response.history:
+            ended = started + hop.elapsed.total_seconds()
+            self.tracer.record('redirect', started, ended, url=hop.url, status=hop.status_code,
+                               location=hop.headers.get('location'))
+            started = ended
+
+    def _extract(self, content, encoding=None, parser=None, timer=None):
+        backend = resolve_backend(parser or self.parser_backend)
+        if self.result_cache is None:
+            return self._parse(content, encoding, backend, timer)
+        
+        # The same bytes decode differently per charset, so it is part of the variant
+        variant = backend
+        if isinstance(content, bytes):
+            variant = f"{backend}:{effective_encoding(encoding)}"
+        key = self.result_cache.key_for(content, variant)
+        data = self.result_cache.get(key)
+        if data is None:
+            data = self._parse(content, encoding, backend, timer)
+            self.result_cache.put(key, data)
+        return data
+
+    def _parse(self, content, encoding, backend, timer=None):
+        timer = timer or StageTimer()
+        if self.parse_pool is not None:
+            with timer.stage('parse', bytes=len(content), backend=backend, pool=True):
+                return self.parse_pool.parse(content, encoding, backend)
+        return parse_document(content, encoding, backend, timer)
+
+    def close(self):
+        """Shut down the parse worker processes, if any"""
+        if self.parse_pool is not None:
+            self.parse_pool.close()
@@ -0,0 +1,230 @@
+import hashlib
+import math
+import os
+import sqlite3
+from urllib.parse import urljoin, urldefrag, urlparse, urlunparse
+from urllib.robotparser import RobotFileParser
+
+QUEUED, IN_FLIGHT, DONE, FAILED = 0, 1, 2, 3
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter; answers "definitely new" without touching disk"""
+
+    def __init__(self, capacity=10_000_000, error_rate=0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        # Double hashing: k positions derived from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class CrawlState:
+    """SQLite file holding every URL ever seen and the frontier of queued ones.
+
+    Each row is one URL with its depth, priority and state, so the exact seen
+    set, the frontier and the finished pages survive a restart together, as
+    does the number of pages fetched so far (see fetched).
+    """
+
+    def __init__(self, path, bloom_capacity=10_000_000):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                depth INTEGER NOT NULL,
+                priority REAL NOT NULL,
+                state INTEGER NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_frontier ON urls (state, priority)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)")
+        # State files without the counter start from the pages they already finished
+        self.conn.execute("INSERT OR IGNORE INTO meta SELECT 'fetched', COUNT(*) FROM urls "
+                          "WHERE state IN (?, ?)", (DONE, FAILED))
+        # Work that was in flight when the last run stopped goes back on the frontier
+        self.conn.execute("UPDATE urls SET state = ? WHERE state = ?", (QUEUED, IN_FLIGHT))
+        self.conn.commit()
+
+        self.fetched = self.conn.execute("SELECT value FROM meta WHERE key = 'fetched'").fetchone()[0]
+        self.bloom = BloomFilter(bloom_capacity)
+        for (url,) in self.conn.execute("SELECT url FROM urls"):
+            self.bloom.add(url)
+
+    def seen(self, url):
+        if url not in self.bloom:
+            return False
+        # Possible false positive: confirm against the exact set on disk
+        row = self.conn.execute("SELECT 1 FROM urls WHERE url = ?", (url,)).fetchone()
+        return row is not None
+
+    def enqueue(self, url, depth, priority):
+        if self.seen(url):
+            return False
+        self.add(url, depth, priority)
+        return True
+
+    def add(self, url, depth, priority):
+        """Queue a URL the caller has already checked with seen()"""
+        self.conn.execute("INSERT OR IGNORE INTO urls VALUES (?, ?, ?, ?)",
+                          (url, depth, priority, QUEUED))
+        self.bloom.add(url)
+
+    def seed_urls(self):
+        return [url for (url,) in self.conn.execute("SELECT url FROM urls WHERE depth = 0")]
+
+    def claim(self, limit):
+        """Take up to limit queued URLs in priority order and mark them in flight"""
+        rows = self.conn.execute(
+            "SELECT url, depth FROM urls WHERE state = ? ORDER BY priority, rowid LIMIT ?",
+            (QUEUED, limit)).fetchall()
+        self.conn.executemany("UPDATE urls SET state = ? WHERE url = ?",
+                              [(IN_FLIGHT, url) for url, _ in rows])
+        return rows
+
+    def finish(self, url, ok=True):
+        self.conn.execute("UPDATE urls SET state = ? WHERE url = ?", (DONE if ok else FAILED, url))
+        # Same transaction as the state change, so the count never drifts from the pages
+        self.conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'fetched'")
+        self.fetched += 1
+
+    def counts(self):
+        names = {QUEUED: 'queued', IN_FLIGHT: 'in_flight', DONE: 'done', FAILED: 'failed'}
+        result = {name: 0 for name in names.values()}
+        for state, count in self.conn.execute("SELECT state, COUNT(*) FROM urls GROUP BY state"):
+            result[names[state]] = count
+        return result
+
+    def checkpoint(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+def normalize_url(url):
+    """Drop the fragment and lowercase scheme/host so trivial variants dedupe"""
+    url, _ = urldefrag(url)
+    parts = urlparse(url)
+    return urlunparse((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/',
+                       parts.params, parts.query, ''))
+
+
+class Crawler:
+    """Breadth-first crawl on top of ScrapeCore.iter_scrape.
+
+    URLs are claimed from the frontier in batches. Links found on each page
+    are queued at depth + 1. The state file is committed after every page, so
+    a restarted crawl resumes without re-fetching finished pages. max_pages
+    caps the whole crawl, counting pages fetched by earlier runs too.
+    """
+
+    def __init__(self, scraper, state_path, max_depth=2, max_pages=None,
+                 allowed_domains=None, respect_robots=True, user_agent='*',
+                 priority=None, batch_size=None):
+        self.scraper = scraper
+        self.state = CrawlState(state_path)
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        # Without explicit domains the crawl stays on the seed hosts (restored on resume)
+        self._seed_hosts_only = not allowed_domains
+        if allowed_domains:
+            self.allowed_domains = {d.lower() for d in allowed_domains}
+        else:
+            self.allowed_domains = {urlparse(url).netloc for url in self.state.seed_urls()}
+        self.respect_robots = respect_robots
+        self.user_agent = user_agent
+        # priority(url, depth) -> number, lower first; default is plain breadth-first
+        self.priority = priority or (lambda url, depth: depth)
+        self.batch_size = batch_size or scraper.max_workers * 4
+        self._robots = {}
+
+    def add_seeds(self, urls):
+        for url in urls:
+            url = normalize_url(url)
+            if self._seed_hosts_only:
+                self.allowed_domains.add(urlparse(url).netloc)
+            if self._allowed(url):
+                self.state.enqueue(url, 0, self.priority(url, 0))
+        self.state.checkpoint()
+
+    def _domain_allowed(self, host):
+        if not self.allowed_domains:
+            return True
+        return any(host == d or host.endswith('.' + d) for d in self.allowed_domains)
+
+    def _allowed(self, url):
+        parts = urlparse(url)
+        if parts.scheme not in ('http', 'https') or not self._domain_allowed(parts.netloc):
+            return False
+        return not self.respect_robots or self._robots_for(parts).can_fetch(self.user_agent, url)
+
+    def _robots_for(self, parts):
+        base = f"{parts.scheme}://{parts.netloc}"
+        parser = self._robots.get(base)
+        if parser is None:
+            parser = RobotFileParser(base + '/robots.txt')
+            try:
+                response = self.scraper.session.get(base + '/robots.txt', timeout=self.scraper.timeout)
+                if response.status_code in (401, 403):
+                    parser.disallow_all = True
+                elif response.status_code >= 400:
+                    parser.allow_all = True
+                else:
+                    parser.parse(response.text.splitlines())
+            except Exception:
+                parser.allow_all = True  # unreachable robots.txt doesn't block the crawl
+            self._robots[base] = parser
+        return parser
+
+    def crawl(self):
+        """Yield (url, data, error) for every page fetched until the frontier is empty"""
+        while self.max_pages is None or self.state.fetched < self.max_pages:
+            limit = self.batch_size
+            if self.max_pages is not None:
+                limit = min(limit, self.max_pages - self.state.fetched)
+            batch = self.state.claim(limit)
+            if not batch:
+                break
+            depths = dict(batch)
+
+            for url, data, error in self.scraper.iter_scrape(depths):
+                if error is None:
+                    depth = depths[url]
+                    data['depth'] = depth
+                    if depth < self.max_depth:
+                        self._enqueue_links(url, data.get('links', []), depth + 1)
+                self.state.finish(url, error is None)
+                self.state.checkpoint()
+                yield url, data, error
+
+    def _enqueue_links(self, page_url, links, depth):
+        for link in links:
+            href = link.get('href')
+            if not href:
+                continue
+            url = normalize_url(urljoin(page_url, href))
+            # Seen first: it is cheaper than the robots check and rules out most links
+            if not self.state.seen(url) and self._allowed(url):
+                self.state.add(url, depth, self.priority(url, depth))
+
+    def close(self):
+        self.state.close()
@@ -0,0 +1,94 @@
+from bs4 import Tag
+
+HEADING_TAGS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+MAX_CLASS_SAMPLES = 3
+
+
+def extract_page(soup):
+    """Extract title, classes, headings, paragraphs, links, images and forms in one walk.
+
+    Every element is visited exactly once; the per-category find_all() sweeps
+    this replaces each re-walked the whole tree.
+    """
+    title = None
+    class_data = {}
+    headings = []
+    paragraphs = []
+    links = []
+    images = []
+    forms = []
+    form_by_tag = {}
+
+    for element in soup.descendants:
+        if not isinstance(element, Tag):
+            continue
+        name = element.name
+        attrs = element.attrs
+
+        classes = attrs.get('class')
+        if classes:
+            for class_name in classes:
+                info = class_data.get(class_name)
+                if info is None:
+                    info = class_data[class_name] = {
+                        'count': 0,
+                        'tag_types': set(),
+                        'sample_content': []
+                    }
+                info['count'] += 1
+                info['tag_types'].add(name)
+                # Store a sample of the content (up to 3 samples)
+                if len(info['sample_content']) < MAX_CLASS_SAMPLES:
+                    sample = element.get_text().strip()
+                    if sample:
+                        info['sample_content'].append(sample)
+
+        if name in HEADING_TAGS:
+            headings.append({'level': HEADING_TAGS[name], 'text': element.get_text().strip()})
+        elif name == 'p':
+            paragraphs.append(element.get_text().strip())
+        elif name == 'a':
+            if 'href' in attrs:
+                links.append({'text': element.get_text().strip(), 'href': attrs['href']})
+        elif name == 'img':
+            if 'src' in attrs:
+                images.append({'src': attrs['src'], 'alt': attrs.get('alt', '')})
+        elif name == 'form':
+            form = {
+                'action': attrs.get('action', ''),
+                'method': attrs.get('method', 'get'),
+                'inputs': []
+            }
+            forms.append(form)
+            form_by_tag[id(element)] = form
+        elif name == 'input' and form_by_tag:
+            # Attach the input to its closest enclosing form
+            for parent in element.parents:
+                form = form_by_tag.get(id(parent))
+                if form is not None:
+                    form['inputs'].append({
+                        'type': attrs.get('type', 'text'),
+                        'name': attrs.get('name', ''),
+                        'id': attrs.get('id', '')
+                    })
+                    break
+        elif name == 'title' and title is None and element.string is not None:
+            # Plain str: a NavigableString would drag the whole tree along when pickled
+            title = str(element.string)
+
+    return {
+        'title': title if title is not None else 'No title',
+        'classes': {
+            class_name: {
+                'count': info['count'],
+                'tag_types': list(info['tag_types']),
+                'sample_content': info['sample_content']
+            }
+            for class_name, info in class_data.items()
+        },
+        'headings': headings,
+        'paragraphs': paragraphs,
+        'links': links,
+        'images': images,
+        'forms': forms
+    }
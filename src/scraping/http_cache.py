@@ -0,0 +1,237 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+# Headers describing the wire encoding; stored bodies are already decoded
+_DROP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+def default_cache_dir():
+    return os.path.join(str(Path.home()), "Documents", "WebScrape", "http_cache")
+
+
+class HTTPCache:
+    """On-disk store of GET bodies with their validators, evicted LRU by size.
+
+    Each entry is a <key>.body file plus a <key>.json metadata file. The LRU
+    order lives in memory and is rebuilt from file mtimes on start-up.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> body size, least recently used first
+        self._total = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        found = []
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith('.body'):
+                path = os.path.join(self.cache_dir, filename)
+                stat = os.stat(path)
+                found.append((stat.st_mtime, filename[:-5], stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total += size
+
+    @staticmethod
+    def key_for(url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, key)
+        return base + '.body', base + '.json'
+
+    def lookup(self, url):
+        """Return the stored metadata for url, or None"""
+        key = self.key_for(url)
+        with self._lock:
+            if key not in self._entries:
+                return None
+        _, meta_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            self._remove(key)
+            return None
+
+    def read_body(self, url):
+        key = self.key_for(url)
+        body_path, _ = self._paths(key)
+        with open(body_path, 'rb') as f:
+            body = f.read()
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+        os.utime(body_path)  # keep the on-disk LRU order in step across restarts
+        return body
+
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def store(self, url, response):
+        """Persist a 200 response that carries an ETag or Last-Modified validator"""
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+        key = self.key_for(url)
+        body_path, meta_path = self._paths(key)
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'headers': {k: v for k, v in response.headers.items()
+                        if k.lower() not in _DROP_HEADERS},
+            'size': len(body)
+        }
+        # Write to temp files first so readers never see half an entry
+        with open(body_path + '.tmp', 'wb') as f:
+            f.write(body)
+        with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(body_path + '.tmp', body_path)
+        os.replace(meta_path + '.tmp', meta_path)
+
+        with self._lock:
+            self._total -= self._entries.pop(key, 0)
+            self._entries[key] = len(body)
+            self._total += len(body)
+            self.stores += 1
+            evicted = []
+            while self._total > self.max_bytes and len(self._entries) > 1:
+                old_key, size = self._entries.popitem(last=False)
+                self._total -= size
+                self.evictions += 1
+                evicted.append(old_key)
+        for old_key in evicted:
+            self._delete_files(old_key)
+
+    def forget(self, url):
+        """Drop url's entry, e.g. when its body file went missing"""
+        self._remove(self.key_for(url))
+
+    def _remove(self, key):
+        with self._lock:
+            self._total -= self._entries.pop(key, 0)
+        self._delete_files(key)
+
+    def _delete_files(self, key):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        with self._lock:
+            keys = list(self._entries)
+        for key in keys:
+            self._remove(key)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._total,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'stores': self.stores,
+                'evictions': self.evictions
+            }
+
+
+def is_cacheable(response):
+    if response.status_code != 200:
+        return False
+    if 'no-store' in response.headers.get('Cache-Control', '').lower():
+        return False
+    return bool(response.headers.get('ETag') or response.headers.get('Last-Modified'))
+
+
+class CachingAdapter(HTTPAdapter):
+    """HTTPAdapter that revalidates GETs against an HTTPCache.
+
+    Repeat fetches send If-None-Match / If-Modified-Since; a 304 is answered
+    with the stored body, marked with response.from_cache = True.
+    """
+
+    def __init__(self, cache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+
+        entry = self.cache.lookup(request.url)
+        added = []  # conditional headers we added, as opposed to the caller's own
+        if entry:
+            if entry.get('etag') and 'If-None-Match' not in request.headers:
+                request.headers['If-None-Match'] = entry['etag']
+                added.append('If-None-Match')
+            if entry.get('last_modified') and 'If-Modified-Since' not in request.headers:
+                request.headers['If-Modified-Since'] = entry['last_modified']
+                added.append('If-Modified-Since')
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and entry:
+            try:
+                return self._from_cache(entry, request, response)
+            except OSError:
+                # The body went missing: a bare 304 would pass raise_for_status as an
+                # empty page, so drop the entry and ask for the full page instead
+                self.cache.forget(request.url)
+                if added:
+                    response.close()
+                    for name in added:
+                        del request.headers[name]
+                    response = super().send(request, **kwargs)
+
+        self.cache.record_miss()
+        # A streamed body is left for the caller; reading it here would defeat streaming
+        if not kwargs.get('stream') and is_cacheable(response):
+            self.cache.store(request.url, response)
+        response.from_cache = False
+        return response
+
+    def _from_cache(self, entry, request, not_modified):
+        body = self.cache.read_body(request.url)
+        not_modified.content  # drain so the connection goes back to the pool
+
+        response = Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        for name in ('Date', 'Expires', 'Cache-Control', 'ETag', 'Last-Modified'):
+            if name in not_modified.headers:
+                response.headers[name] = not_modified.headers[name]
+        response._content = body
+        response._content_consumed = True
+        response.raw = not_modified.raw
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
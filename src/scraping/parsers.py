@@ -0,0 +1,83 @@
+import time
+from bs4 import BeautifulSoup, FeatureNotFound
+
+# Tree builders we know how to use, fastest first when nothing has been measured
+BACKENDS = ['lxml', 'html.parser']
+DEFAULT_BACKEND = 'html.parser'
+AUTO = 'auto'
+
+_available = None
+_auto_choice = None
+
+
+def available_backends():
+    """Return the installed parser backends, checked once per process"""
+    global _available
+    if _available is None:
+        _available = []
+        for name in BACKENDS:
+            try:
+                BeautifulSoup('', name)
+                _available.append(name)
+            except FeatureNotFound:
+                pass
+    return list(_available)
+
+
+def _sample_document(blocks=400):
+    block = ('<div class="row item"><h2 class="title">Heading</h2>'
+             '<p class="text">Some paragraph text with <b>markup</b> inside.</p>'
+             '<a class="link" href="/next">Next</a><img src="/a.png" alt="a"></div>')
+    return '<html><head><title>Sample</title></head><body>' + block * blocks + '</body></html>'
+
+
+def benchmark_backends(sample=None, repeat=3):
+    """Time each available backend on sample and return {name: best seconds}"""
+    sample = sample or _sample_document()
+    timings = {}
+    for name in available_backends():
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            BeautifulSoup(sample, name)
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+    return timings
+
+
+def detect_fastest_backend(settings_manager=None):
+    """Return the fastest backend, benchmarking on first use and recording the result.
+
+    The choice is stored as 'detected_parser_backend' in the settings so later
+    runs skip the benchmark; it is re-measured if that backend disappears.
+    """
+    global _auto_choice
+    if _auto_choice in available_backends():
+        return _auto_choice
+
+    if settings_manager is not None:
+        recorded = settings_manager.get_settings().get('detected_parser_backend')
+        if recorded in available_backends():
+            _auto_choice = recorded
+            return recorded
+
+    timings = benchmark_backends()
+    _auto_choice = min(timings, key=timings.get) if timings else DEFAULT_BACKEND
+    if settings_manager is not None:
+        settings_manager.save_settings({'detected_parser_backend': _auto_choice})
+    return _auto_choice
+
+
+def resolve_backend(name=None, settings_manager=None):
+    """Map a requested backend name (or 'auto'/None) to an installed one"""
+    if not name or name == AUTO:
+        return detect_fastest_backend(settings_manager)
+    if name in available_backends():
+        return name
+    print(f"Parser backend '{name}' is not installed, falling back to {DEFAULT_BACKEND}")
+    return DEFAULT_BACKEND
+
+
+def make_soup(markup, backend=None):
+    """Build a BeautifulSoup tree with the requested (or auto-detected) backend"""
+    return BeautifulSoup(markup, resolve_backend(backend))
@@ -0,0 +1,132 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+# Statuses that mean "slow down" rather than "this page is broken"
+THROTTLE_STATUSES = {429, 503}
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Classic token bucket refilled at rate tokens per second"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def ready_at(self, now=None):
+        """Earliest monotonic time at which a token can be taken"""
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+        return max(now + wait, self.blocked_until)
+
+    def try_acquire(self, now=None):
+        now = time.monotonic() if now is None else now
+        if self.ready_at(now) > now:
+            return False
+        self.tokens -= 1
+        return True
+
+
+def parse_retry_after(value):
+    """Return Retry-After as seconds from now, accepting delta-seconds or an HTTP date"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class PolitenessScheduler:
+    """Per-host pacing for batch runs.
+
+    Every host gets its own token bucket. A 429/503 halves that host's rate
+    and honours Retry-After; each success adds a little rate back, up to
+    max_rate. Failed requests are retried with jittered exponential backoff.
+    Thread-safe: concurrent batches (e.g. HybridScraper's) share one
+    scheduler, and metrics exporters read stats() from their own threads.
+    """
+
+    def __init__(self, rate=2.0, burst=2, min_rate=0.05, max_rate=10.0,
+                 increase=0.05, decrease=0.5, max_retries=3,
+                 backoff_base=1.0, backoff_max=60.0):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.buckets = {}
+        self._lock = threading.RLock()
+
+    def bucket(self, host):
+        with self._lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = self.buckets[host] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def ready_at(self, host, now=None):
+        with self._lock:
+            return self.bucket(host).ready_at(now)
+
+    def try_acquire(self, host, now=None):
+        with self._lock:
+            return self.bucket(host).try_acquire(now)
+
+    def on_success(self, host):
+        with self._lock:
+            bucket = self.bucket(host)
+            bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+
+    def on_failure(self, host, error, attempt):
+        """Adjust the host's pace after error and return a retry delay, or None to give up"""
+        response = getattr(error, 'response', None)
+        status = getattr(response, 'status_code', None)
+        retry_after = None
+
+        if status in THROTTLE_STATUSES:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            with self._lock:
+                bucket = self.bucket(host)
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+                if retry_after is not None:
+                    bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + retry_after)
+
+        retryable = status in RETRY_STATUSES if status is not None else self._is_transient(error)
+        if not retryable or attempt >= self.max_retries:
+            return None
+        return max(retry_after or 0.0, self.backoff(attempt))
+
+    def backoff(self, attempt):
+        """Full-jitter exponential backoff for the given (0-based) retry attempt"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    @staticmethod
+    def _is_transient(error):
+        # Connection resets and timeouts are worth another try; bad URLs are not
+        return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+    def stats(self):
+        with self._lock:
+            return {host: {'rate': bucket.rate, 'tokens': bucket.tokens}
+                    for host, bucket in self.buckets.items()}
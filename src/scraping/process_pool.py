@@ -0,0 +1,79 @@
+import codecs
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from src.scraping.extractor import extract_page
+from src.scraping.parsers import make_soup, resolve_backend
+from src.scraping.timing import StageTimer
+
+
+def effective_encoding(encoding):
+    """The codec bytes are really decoded with: encoding's canonical name, or utf-8 if unknown"""
+    try:
+        return codecs.lookup(encoding or 'utf-8').name
+    except LookupError:
+        # Unknown charset in the headers (e.g. 'utf8mb4'); fall back like streaming does
+        return 'utf-8'
+
+
+def response_encoding(response):
+    """The codec for a response body: its declared charset, else UTF-8.
+
+    requests falls back to ISO-8859-1 for text/* without a charset, which
+    mangles most of today's pages; buffered and streamed fetches both use this.
+    """
+    content_type = response.headers.get('content-type', '')
+    declared = response.encoding if 'charset' in content_type.lower() else None
+    return effective_encoding(declared)
+
+
+def parse_document(content, encoding=None, backend=None, timer=None):
+    """Decode, parse and extract one page; runs inside a pool worker process.
+
+    Only the raw bytes travel to the worker and only the compact result dict
+    travels back, so the soup itself never crosses the process boundary.
+    A StageTimer, if given, gets the decode, parse and extract durations.
+    """
+    timer = timer or StageTimer()
+    with timer.stage('decode', bytes=len(content)):
+        if isinstance(content, bytes):
+            content = content.decode(effective_encoding(encoding), errors='replace')
+    with timer.stage('parse', backend=backend):
+        soup = make_soup(content, backend)
+    with timer.stage('extract'):
+        return extract_page(soup)
+
+
+class ParsePool:
+    """ProcessPoolExecutor for the CPU-bound parse + extract step.
+
+    The executor starts lazily on first use. The parser backend is resolved in
+    the parent so worker processes don't each run the 'auto' benchmark.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = None
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def submit(self, content, encoding=None, backend=None):
+        return self._pool().submit(parse_document, content, encoding, resolve_backend(backend))
+
+    def parse(self, content, encoding=None, backend=None):
+        return self.submit(content, encoding, backend).result()
+
+    def map(self, documents, backend=None, chunksize=1):
+        """Parse (content, encoding) pairs in order, spread across the workers"""
+        backend = resolve_backend(backend)
+        contents, encodings = zip(*documents) if documents else ((), ())
+        return self._pool().map(parse_document, contents, encodings,
+                                [backend] * len(contents), chunksize=chunksize)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
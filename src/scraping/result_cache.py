@@ -0,0 +1,110 @@
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+class ResultCache:
+    """Extraction results keyed by a hash of the page content.
+
+    A bounded in-memory LRU sits in front of an optional on-disk tier
+    (one JSON file per hash in disk_dir). Callers get deep copies, so they
+    may add keys such as 'url' without touching the cached dict.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, disk_dir=None):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    @staticmethod
+    def key_for(content, variant=''):
+        """Hash page content together with anything that changes the result (e.g. parser)"""
+        if isinstance(content, str):
+            content = content.encode('utf-8', errors='surrogatepass')
+        digest = hashlib.sha256(content)
+        digest.update(b'\0' + variant.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(data)
+
+        data = self._read_disk(key)
+        if data is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.disk_hits += 1
+        self._remember(key, data)
+        return copy.deepcopy(data)
+
+    def put(self, key, data):
+        data = copy.deepcopy(data)
+        self._remember(key, data)
+        self._write_disk(key, data)
+
+    def _remember(self, key, data):
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key, data):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        try:
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            print(f"Error writing result cache entry: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': (self.hits + self.disk_hits) / lookups if lookups else 0.0
+            }
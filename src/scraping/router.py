@@ -0,0 +1,190 @@
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+from src.scraping.parsers import make_soup
+
+HTTP = 'http'
+BROWSER = 'browser'
+
+# Markup left behind by client-side frameworks when the server sends an empty shell
+FRAMEWORK_MARKERS = [
+    (name, re.compile(pattern, re.IGNORECASE)) for name, pattern in [
+        ('react', rb'<div[^>]+id=["\'](?:root|app|__next)["\'][^>]*>\s*</div>|data-reactroot'),
+        ('angular', rb'\bng-app\b|\bng-version=|<app-root'),
+        ('vue', rb'data-v-app|window\.__NUXT__|<div[^>]+id=["\']__nuxt["\']'),
+        ('ember', rb'\bember-application\b'),
+        ('noscript', rb'<noscript>[^<]*(?:enable|requires?)\s+javascript'),
+    ]
+]
+# Pages with less visible text than this are treated as not rendered yet
+MIN_TEXT_CHARS = 200
+# A framework marker only counts when the page is also this short on text
+SHELL_TEXT_CHARS = 1000
+# How long a per-host decision is trusted before the host is checked again
+DEFAULT_TTL = 7 * 24 * 3600
+# Escalated pages needed before a whole host is sent to the browser
+DEFAULT_ESCALATE_AFTER = 3
+# Elements whose text is never shown
+INVISIBLE_TAGS = ['script', 'style', 'noscript', 'template']
+
+
+def default_routes_path():
+    return os.path.join(str(Path.home()), "Documents", "WebScrape", "routes.json")
+
+
+def text_chars(soup):
+    """Visible body text, wherever it sits (div, td, li, ...), ignoring whitespace"""
+    body = soup.body or soup
+    for element in body.find_all(INVISIBLE_TAGS):
+        element.decompose()
+    return sum(len(part) for part in body.get_text(' ').split())
+
+
+def extracted_text_chars(data):
+    """Text in the extracted headings and paragraphs: a cheap lower bound for text_chars"""
+    texts = [heading.get('text', '') for heading in data.get('headings', [])]
+    texts.extend(data.get('paragraphs', []))
+    return sum(len(part) for text in texts for part in (text or '').split())
+
+
+def browser_reasons(content, data, expected_selectors=None, backend=None,
+                    min_text_chars=MIN_TEXT_CHARS, shell_text_chars=SHELL_TEXT_CHARS):
+    """Why a page fetched over plain HTTP looks like it needs JavaScript; empty if it doesn't"""
+    # Pages whose extracted headings and paragraphs already hold more text than
+    # a shell would can't be one, so most pages skip the second parse below
+    if not expected_selectors and data and extracted_text_chars(data) >= shell_text_chars:
+        return []
+    reasons = []
+    # A second parse, since the extracted data doesn't cover text in divs, cells, ...
+    soup = make_soup(content, backend)
+    if expected_selectors:
+        missing = [selector for selector in expected_selectors if soup.select_one(selector) is None]
+        if missing:
+            reasons.append('missing:' + ','.join(missing))
+    chars = text_chars(soup)
+    if chars < min_text_chars:
+        reasons.append('empty_body')
+    if chars < shell_text_chars:
+        head = content[:200000]
+        if isinstance(head, str):
+            head = head.encode('utf-8', errors='replace')
+        reasons.extend(f'framework:{name}' for name, pattern in FRAMEWORK_MARKERS
+                       if pattern.search(head))
+    return reasons
+
+
+class RouteMemory:
+    """Per-host fetch decisions (HTTP or browser), kept in a small JSON file"""
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL):
+        self.path = path if path is not None else default_routes_path()
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._routes = {}
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    self._routes = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error loading routes: {e}")
+
+    def get(self, host):
+        """The remembered route, or None for unknown (or not yet decided) hosts"""
+        with self._lock:
+            entry = self._routes.get(host)
+        if entry is None or time.time() - entry['checked'] > self.ttl:
+            return None
+        return entry['route']
+
+    def set(self, host, route, reasons=()):
+        with self._lock:
+            self._routes[host] = {'route': route, 'reasons': list(reasons), 'checked': time.time(),
+                                  'strikes': 0}
+
+    def strike(self, host, reasons=()):
+        """Count one more escalated page for an undecided host; returns the count so far"""
+        with self._lock:
+            entry = self._routes.get(host)
+            if entry is None or time.time() - entry['checked'] > self.ttl:
+                entry = {'route': None, 'strikes': 0}
+            entry = self._routes[host] = {
+                'route': entry['route'], 'reasons': list(reasons), 'checked': time.time(),
+                'strikes': entry.get('strikes', 0) + 1
+            }
+            return entry['strikes']
+
+    def forget(self, host):
+        with self._lock:
+            self._routes.pop(host, None)
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            routes = dict(self._routes)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump(routes, f, indent=2)
+        except OSError as e:
+            print(f"Error saving routes: {e}")
+
+    def stats(self):
+        with self._lock:
+            routes = [entry['route'] for entry in self._routes.values()]
+        return {'hosts': len(routes), 'browser_hosts': routes.count(BROWSER)}
+
+
+class FetchRouter:
+    """Chooses between the plain HTTP path and the browser renderer per host.
+
+    Unknown hosts go over HTTP first; if the page looks unrendered (see
+    browser_reasons) that page is escalated. Once escalate_after pages of a
+    host have been in a row, the host is remembered as a browser host, so
+    its later pages skip the wasted HTTP fetch. Every page fetched over
+    HTTP is still checked, even on hosts remembered as HTTP hosts, since a
+    mostly static site can have JavaScript-only pages. Thread-safe: batch
+    workers call check() concurrently.
+    """
+
+    def __init__(self, memory=None, expected_selectors=None, min_text_chars=MIN_TEXT_CHARS,
+                 escalate_after=DEFAULT_ESCALATE_AFTER):
+        self.memory = memory if memory is not None else RouteMemory()
+        self.expected_selectors = expected_selectors or []
+        self.min_text_chars = min_text_chars
+        self.escalate_after = max(1, int(escalate_after))
+        self.escalations = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url):
+        return urlparse(url).netloc.lower()
+
+    def route_for(self, url):
+        return self.memory.get(self.host_of(url)) or HTTP
+
+    def check(self, url, content, data, backend=None):
+        """Inspect an HTTP result; returns the reasons to escalate it (empty to keep it)"""
+        host = self.host_of(url)
+        reasons = browser_reasons(content, data, self.expected_selectors, backend,
+                                  self.min_text_chars)
+        if not reasons:
+            # Also restarts the count towards escalate_after
+            self.memory.set(host, HTTP)
+            return reasons
+        with self._lock:
+            self.escalations += 1
+        # One short page (a login wall, a redirect stub) shouldn't send a whole host to the browser
+        if self.memory.strike(host, reasons) >= self.escalate_after:
+            self.memory.set(host, BROWSER, reasons)
+        return reasons
+
+    def stats(self):
+        with self._lock:
+            escalations = self.escalations
+        return {'escalations': escalations, **self.memory.stats()}
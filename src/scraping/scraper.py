@@ -1,78 +1,36 @@
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse
 from PyQt6.QtCore import QObject, pyqtSignal
+from src.scraping.core import ScrapeCore, DEFAULT_TIMEOUT
+from src.scraping.parsers import AUTO
 
 class WebScraper(QObject):
+    """Qt front end for ScrapeCore: the same operations, reported through signals"""
     progress_updated = pyqtSignal(int)
     status_updated = pyqtSignal(str)
     scraping_completed = pyqtSignal(dict)
     error_occurred = pyqtSignal(str)
+    timings_updated = pyqtSignal(dict)  # stage -> ms so far, see ScrapeCore
     
-    def __init__(self):
+    def __init__(self, max_workers=16, per_host=4, parser_backend=AUTO, http_cache=True,
+                 result_cache=True, politeness=True, circuit_breakers=True, parse_workers=0,
+                 metrics=True, tracer=None, timeout=DEFAULT_TIMEOUT):
         super().__init__()
-        self.session = requests.Session()
+        self.core = ScrapeCore(max_workers, per_host, parser_backend, http_cache,
+                               result_cache, politeness, circuit_breakers, parse_workers,
+                               metrics, tracer, timeout)
     
     def validate_url(self, url):
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except:
-            return False
+        return self.core.validate_url(url)
     
-    def scrape(self, url):
+    def scrape(self, url, parser=None, stream=False, max_bytes=None):
+        if not self.validate_url(url):
+            self.error_occurred.emit("Invalid URL format")
+            return
         try:
-            if not self.validate_url(url):
-                self.error_occurred.emit("Invalid URL format")
-                return
-                
-            self.status_updated.emit("Starting scraping...")
-            self.progress_updated.emit(10)
-            
-            response = self.session.get(url)
-            response.raise_for_status()
-            
-            self.progress_updated.emit(30)
-            self.status_updated.emit("Parsing content...")
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Get all unique classes and their elements
-            class_data = {}
-            for element in soup.find_all(class_=True):
-                classes = element.get('class')
-                for class_name in classes:
-                    if class_name not in class_data:
-                        class_data[class_name] = {
-                            'count': 0,
-                            'tag_types': set(),
-                            'sample_content': []
-                        }
-                    class_data[class_name]['count'] += 1
-                    class_data[class_name]['tag_types'].add(element.name)
-                    if len(class_data[class_name]['sample_content']) < 3:
-                        sample = element.get_text().strip()
-                        if sample:
-                            class_data[class_name]['sample_content'].append(sample)
-            
-            data = {
-                'title': soup.title.string if soup.title else 'No title',
-                'links': [{'text': a.text, 'href': a.get('href')} 
-                          for a in soup.find_all('a', href=True)],
-                'headings': [h.text for h in soup.find_all(['h1', 'h2', 'h3'])],
-                'paragraphs': [p.text for p in soup.find_all('p')],
-                'classes': {
-                    class_name: {
-                        'count': info['count'],
-                        'tag_types': list(info['tag_types']),
-                        'sample_content': info['sample_content']
-                    }
-                    for class_name, info in class_data.items()
-                }
-            }
-            
-            self.progress_updated.emit(90)
-            self.status_updated.emit("Finalizing results...")
+            data = self.core.scrape(url, parser, stream, max_bytes,
+                                    on_progress=self.progress_updated.emit,
+                                    on_status=self.status_updated.emit,
+                                    on_timings=self.timings_updated.emit)
             self.scraping_completed.emit(data)
             self.progress_updated.emit(100)
             self.status_updated.emit("Scraping completed!")
@@ -81,3 +39,56 @@ class WebScraper(QObject):
             self.error_occurred.emit(f"Network error: {str(e)}")
         except Exception as e:
             self.error_occurred.emit(f"Scraping error: {str(e)}")
+
+    def iter_scrape(self, urls, max_workers=None, per_host=None, parser=None,
+                    stream=False, max_bytes=None):
+        """Scrape many URLs concurrently, yielding (url, data, error) as each finishes"""
+        return self.core.iter_scrape(urls, max_workers, per_host, parser, stream, max_bytes)
+
+    def scrape_many(self, urls, max_workers=None, per_host=None, parser=None,
+                    stream=False, max_bytes=None):
+        """Scrape many URLs concurrently and emit results through the usual signals"""
+        urls = list(urls)
+        total = len(urls)
+        done = 0
+        self.status_updated.emit(f"Scraping {total} URLs...")
+        self.progress_updated.emit(0)
+        
+        for url, data, error in self.iter_scrape(urls, max_workers, per_host, parser,
+                                                   stream, max_bytes):
+            done += 1
+            if error is None:
+                self.scraping_completed.emit(data)
+            elif isinstance(error, requests.RequestException):
+                self.error_occurred.emit(f"Network error ({url}): {str(error)}")
+            else:
+                self.error_occurred.emit(f"Scraping error ({url}): {str(error)}")
+            self.progress_updated.emit(int(done * 100 / total) if total else 100)
+        
+        self.status_updated.emit(f"Scraping completed! {done} URLs processed")
+
+    def crawl(self, seeds, state_path, **options):
+        """Breadth-first crawl from seeds; resumes from state_path if it already exists.
+
+        options are passed to Crawler (max_depth, max_pages, allowed_domains, ...).
+        """
+        for url, data, error in self.core.iter_crawl(seeds, state_path,
+                                                     on_progress=self.progress_updated.emit,
+                                                     on_status=self.status_updated.emit,
+                                                     **options):
+            if error is None:
+                self.scraping_completed.emit(data)
+            else:
+                self.error_occurred.emit(f"Crawl error ({url}): {str(error)}")
+
+    def fetch_and_extract(self, url, parser=None):
+        """Fetch and extract a URL, returning (raw bytes, data); raises on failure"""
+        return self.core.fetch_and_extract(url, parser)
+
+    def export_timings(self, path):
+        """Write the per-stage timing histograms of every scrape so far (CSV or JSON)"""
+        self.core.timing_stats.export(path)
+
+    def close(self):
+        """Shut down the parse worker processes, if any"""
+        self.core.close()
@@ -0,0 +1,276 @@
+import codecs
+from html.parser import HTMLParser
+
+from src.scraping.extractor import HEADING_TAGS, MAX_CLASS_SAMPLES
+
+# Elements that never have a closing tag and must not be pushed on the stack
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+             'meta', 'param', 'source', 'track', 'wbr'}
+# Starting one of these closes an open <p> (HTML's implied end tags)
+CLOSES_P = {'address', 'article', 'aside', 'blockquote', 'center', 'details', 'dialog', 'dd',
+            'dir', 'div', 'dl', 'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form',
+            'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hgroup', 'hr', 'li', 'listing',
+            'main', 'menu', 'nav', 'ol', 'p', 'pre', 'section', 'summary', 'table', 'ul'}
+# A <p> is only closed up to the nearest of these
+P_SCOPE = {'applet', 'button', 'caption', 'html', 'marquee', 'object', 'table', 'td', 'th',
+           'template'}
+# Start tag -> (open tags it closes, tags that bound the search for them)
+IMPLIED_END = {
+    'li': ({'li'}, {'ul', 'ol', 'menu'}),
+    'dt': ({'dt', 'dd'}, {'dl'}),
+    'dd': ({'dt', 'dd'}, {'dl'}),
+    'option': ({'option'}, {'select', 'datalist', 'optgroup'}),
+    'optgroup': ({'optgroup', 'option'}, {'select'}),
+    'tr': ({'tr'}, {'table', 'thead', 'tbody', 'tfoot'}),
+    'td': ({'td', 'th'}, {'tr', 'table'}),
+    'th': ({'td', 'th'}, {'tr', 'table'}),
+    'thead': ({'thead', 'tbody', 'tfoot'}, {'table'}),
+    'tbody': ({'thead', 'tbody', 'tfoot'}, {'table'}),
+    'tfoot': ({'thead', 'tbody', 'tfoot'}, {'table'}),
+}
+# Text captured per element is capped so a huge container can't grow memory
+MAX_CAPTURE_CHARS = 2000
+# Open elements tracked at once; deeper ones (only unclosed garbage gets
+# here) are treated as empty so per-chunk work stays bounded
+MAX_OPEN_ELEMENTS = 512
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _Capture:
+    """Text buffer for one open element whose text we need"""
+    __slots__ = ('parts', 'length', 'on_close')
+
+    def __init__(self, on_close):
+        self.parts = []
+        self.length = 0
+        self.on_close = on_close
+
+    def add(self, text):
+        if self.length < MAX_CAPTURE_CHARS:
+            text = text[:MAX_CAPTURE_CHARS - self.length]
+            self.parts.append(text)
+            self.length += len(text)
+
+    def text(self):
+        return ''.join(self.parts).strip()
+
+
+class StreamingExtractor(HTMLParser):
+    """Incremental extractor fed with decoded chunks as they arrive.
+
+    Produces the same result shape as extract_page(), but only keeps the
+    stack of currently open elements plus the results, so memory does not
+    grow with the size of the document itself. Missing end tags are implied
+    the way HTML does (a new <p> or block closes an open <p>, a <li> closes
+    the previous <li>, ...), and results are listed in document order: each
+    element takes its slot when it opens and fills it in when it closes.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = None
+        self.class_data = {}
+        self.headings = []
+        self.paragraphs = []
+        self.links = []
+        self.images = []
+        self.forms = []
+        self._stack = []  # (tag, [captures]) per open element
+        self._open = {}  # tag -> how many are on the stack, to skip hopeless scans
+        self._active = []  # captures receiving text right now
+        self._form = None
+
+    def handle_starttag(self, tag, attrs):
+        self._imply_end_tags(tag)
+        attrs = dict(attrs)
+        captures = []
+
+        classes = (attrs.get('class') or '').split()
+        for class_name in dict.fromkeys(classes):
+            info = self.class_data.get(class_name)
+            if info is None:
+                info = self.class_data[class_name] = {
+                    'count': 0,
+                    'tag_types': set(),
+                    'sample_slots': [],
+                    'samples': 0
+                }
+            info['count'] += 1
+            info['tag_types'].add(tag)
+            if info['samples'] < MAX_CLASS_SAMPLES:
+                captures.append(_Capture(self._sample_sink(info)))
+
+        if tag in HEADING_TAGS:
+            level = HEADING_TAGS[tag]
+            captures.append(_Capture(
+                self._slot(self.headings, lambda text: {'level': level, 'text': text})))
+        elif tag == 'p':
+            captures.append(_Capture(self._slot(self.paragraphs)))
+        elif tag == 'a':
+            if attrs.get('href') is not None:
+                href = attrs['href']
+                captures.append(_Capture(
+                    self._slot(self.links, lambda text: {'text': text, 'href': href})))
+        elif tag == 'img':
+            if attrs.get('src') is not None:
+                self.images.append({'src': attrs['src'], 'alt': attrs.get('alt') or ''})
+        elif tag == 'form':
+            self._form = {
+                'action': attrs.get('action') or '',
+                'method': attrs.get('method') or 'get',
+                'inputs': []
+            }
+            self.forms.append(self._form)
+        elif tag == 'input':
+            if self._form is not None:
+                self._form['inputs'].append({
+                    'type': attrs.get('type') or 'text',
+                    'name': attrs.get('name') or '',
+                    'id': attrs.get('id') or ''
+                })
+        elif tag == 'title' and self.title is None:
+            captures.append(_Capture(self._set_title))
+
+        if tag in VOID_TAGS or len(self._stack) >= MAX_OPEN_ELEMENTS:
+            for capture in captures:
+                capture.on_close(capture.text())
+            return
+
+        self._stack.append((tag, captures))
+        self._open[tag] = self._open.get(tag, 0) + 1
+        self._active.extend(captures)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        # Close up to the matching open tag; stray end tags are ignored
+        if not self._open.get(tag):
+            return
+        while self._stack:
+            open_tag, captures = self._stack.pop()
+            self._close(open_tag, captures)
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        for capture in self._active:
+            capture.add(data)
+
+    def close(self):
+        super().close()
+        while self._stack:
+            self._close(*self._stack.pop())
+
+    def result(self):
+        return {
+            'title': self.title if self.title is not None else 'No title',
+            'classes': {
+                class_name: {
+                    'count': info['count'],
+                    'tag_types': list(info['tag_types']),
+                    'sample_content': [slot[0] for slot in info['sample_slots']
+                                       if slot[0]][:MAX_CLASS_SAMPLES]
+                }
+                for class_name, info in self.class_data.items()
+            },
+            'headings': self.headings,
+            'paragraphs': self.paragraphs,
+            'links': self.links,
+            'images': self.images,
+            'forms': self.forms
+        }
+
+    def _imply_end_tags(self, tag):
+        """Close the open elements a new tag implicitly ends, e.g. <p>one<p>two"""
+        if tag in CLOSES_P:
+            self._close_open(('p',), P_SCOPE)
+        rule = IMPLIED_END.get(tag)
+        if rule is not None:
+            self._close_open(*rule)
+
+    def _close_open(self, tags, boundaries):
+        """Close up to the innermost open element in tags, unless a boundary comes first"""
+        if not any(self._open.get(tag) for tag in tags):
+            return
+        for i in range(len(self._stack) - 1, -1, -1):
+            open_tag = self._stack[i][0]
+            if open_tag in tags:
+                while len(self._stack) > i:
+                    self._close(*self._stack.pop())
+                return
+            if open_tag in boundaries:
+                return
+
+    def _close(self, tag, captures):
+        self._open[tag] -= 1
+        if captures:
+            del self._active[len(self._active) - len(captures):]
+            for capture in captures:
+                capture.on_close(capture.text())
+        if tag == 'form':
+            self._form = None
+
+    def _set_title(self, text):
+        self.title = text
+
+    @staticmethod
+    def _slot(target, make=None):
+        """Reserve target's next entry now and fill it in once the text is known"""
+        index = len(target)
+        target.append(None)
+
+        def fill(text):
+            target[index] = make(text) if make is not None else text
+        return fill
+
+    @staticmethod
+    def _sample_sink(info):
+        """Like _slot for class samples, but an element that closes empty gives its slot back.
+
+        So only open elements and filled samples hold slots, and thousands of
+        empty classed elements (icons, spacers) don't grow the list.
+        """
+        slots = info['sample_slots']
+        slot = [None]
+        slots.append(slot)
+
+        def sink(text):
+            if text:
+                slot[0] = text
+                info['samples'] += 1
+                return
+            # Usually the last slot; compared by identity since empty slots are all equal
+            for i in range(len(slots) - 1, -1, -1):
+                if slots[i] is slot:
+                    del slots[i]
+                    break
+        return sink
+
+
+def extract_stream(chunks, encoding=None, max_bytes=None):
+    """Feed byte chunks through StreamingExtractor and return (data, bytes_read, truncated)"""
+    try:
+        decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+    except LookupError:
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    extractor = StreamingExtractor()
+    bytes_read = 0
+    truncated = False
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if max_bytes is not None and bytes_read + len(chunk) > max_bytes:
+            chunk = chunk[:max_bytes - bytes_read]
+            truncated = True
+        bytes_read += len(chunk)
+        extractor.feed(decoder.decode(chunk))
+        if truncated:
+            break
+
+    extractor.feed(decoder.decode(b'', final=True))
+    extractor.close()
+    return extractor.result(), bytes_read, truncated
@@ -0,0 +1,121 @@
+import csv
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# Upper bounds (ms) of the histogram buckets; the last one catches everything
+BUCKET_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, math.inf]
+
+
+class StageTimer:
+    """Wall-clock durations of the named stages of one scrape, in milliseconds.
+
+    Stages are recorded in the order they first run; running a stage again
+    adds to its total. With a tracer (src/utils/tracing.py), every stage()
+    block is also written as a trace span.
+    """
+
+    def __init__(self, tracer=None):
+        self.durations = {}
+        self._started = {}
+        self.tracer = tracer
+
+    def start(self, stage):
+        self._started[stage] = time.perf_counter()
+
+    def stop(self, stage):
+        started = self._started.pop(stage, None)
+        if started is not None:
+            self.add(stage, time.perf_counter() - started)
+
+    def add(self, stage, seconds):
+        self.durations[stage] = self.durations.get(stage, 0.0) + seconds * 1000
+
+    @contextmanager
+    def stage(self, stage, **attrs):
+        """Time a block; attrs only go to the trace span"""
+        span = self.tracer.span(stage, **attrs) if self.tracer is not None else nullcontext()
+        with span:
+            self.start(stage)
+            try:
+                yield
+            finally:
+                self.stop(stage)
+
+    def as_dict(self):
+        timings = {stage: round(ms, 2) for stage, ms in self.durations.items()}
+        timings['total'] = round(sum(self.durations.values()), 2)
+        return timings
+
+
+def format_timings(timings):
+    """One line breakdown for status displays, e.g. 'dns 3 ms · wait 80 ms · ... (total 210 ms)'"""
+    stages = [f"{stage} {ms:.0f} ms" for stage, ms in timings.items() if stage != 'total']
+    line = ' · '.join(stages)
+    if 'total' in timings:
+        line += f" (total {timings['total']:.0f} ms)"
+    return line
+
+
+class TimingStats:
+    """Per-stage histograms aggregated over many scrapes (thread-safe)"""
+
+    def __init__(self, bounds_ms=BUCKET_BOUNDS_MS):
+        self.bounds_ms = list(bounds_ms)
+        self._lock = threading.Lock()
+        self._stages = {}
+
+    def add(self, timings):
+        with self._lock:
+            for stage, ms in timings.items():
+                stats = self._stages.get(stage)
+                if stats is None:
+                    stats = self._stages[stage] = {
+                        'count': 0, 'sum_ms': 0.0, 'min_ms': math.inf, 'max_ms': 0.0,
+                        'buckets': [0] * len(self.bounds_ms)
+                    }
+                stats['count'] += 1
+                stats['sum_ms'] += ms
+                stats['min_ms'] = min(stats['min_ms'], ms)
+                stats['max_ms'] = max(stats['max_ms'], ms)
+                for i, bound in enumerate(self.bounds_ms):
+                    if ms <= bound:
+                        stats['buckets'][i] += 1
+                        break
+
+    def histograms(self):
+        """{stage: {count, sum_ms, mean_ms, min_ms, max_ms, buckets: [[le_ms, count], ...]}}"""
+        with self._lock:
+            result = {}
+            for stage, stats in self._stages.items():
+                result[stage] = {
+                    'count': stats['count'],
+                    'sum_ms': round(stats['sum_ms'], 2),
+                    'mean_ms': round(stats['sum_ms'] / stats['count'], 2),
+                    'min_ms': round(stats['min_ms'], 2),
+                    'max_ms': round(stats['max_ms'], 2),
+                    # Non-cumulative counts; the last bound is 'inf'
+                    'buckets': [[bound if bound != math.inf else 'inf', count]
+                                for bound, count in zip(self.bounds_ms, stats['buckets'])]
+                }
+            return result
+
+    def export(self, path):
+        """Write the histograms as CSV (by .csv extension) or JSON"""
+        histograms = self.histograms()
+        if path.lower().endswith('.csv'):
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['stage', 'le_ms', 'count'])
+                for stage, stats in histograms.items():
+                    for bound, count in stats['buckets']:
+                        writer.writerow([stage, bound, count])
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(histograms, f, indent=2)
+
+    def clear(self):
+        with self._lock:
+            self._stages = {}
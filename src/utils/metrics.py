@@ -0,0 +1,237 @@
+import math
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+# Seconds; suits both network stages and parsing
+DEFAULT_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """A metric family: one value (or histogram) per combination of label values"""
+    type = None
+
+    def __init__(self, name, help='', labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _labels(self, key, **extra):
+        labels = dict(zip(self.labelnames, key))
+        labels.update(extra)
+        return labels
+
+    def samples(self):
+        """Yield (name suffix, labels, value) for rendering"""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            for key, value in self._values.items():
+                yield '_total', self._labels(key), value
+
+
+class Gauge(_Metric):
+    type = 'gauge'
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def samples(self):
+        with self._lock:
+            for key, value in self._values.items():
+                yield '', self._labels(key), value
+
+
+class Histogram(_Metric):
+    type = 'histogram'
+
+    def __init__(self, name, help='', labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = sorted(buckets) + [math.inf]
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state['counts'][i] += 1
+                    break
+            state['sum'] += value
+            state['count'] += 1
+
+    def samples(self):
+        with self._lock:
+            for key, state in self._values.items():
+                cumulative = 0
+                for bound, count in zip(self.buckets, state['counts']):
+                    cumulative += count
+                    yield '_bucket', self._labels(key, le=_format_value(float(bound))), cumulative
+                yield '_sum', self._labels(key), state['sum']
+                yield '_count', self._labels(key), state['count']
+
+
+class MetricsRegistry:
+    """Named metrics plus collectors that report other objects' stats() at render time.
+
+    counter()/gauge()/histogram() return the existing metric of that name, so
+    any layer can ask for the metric it updates without passing objects around.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, labelnames, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.type}")
+            return metric
+
+    def counter(self, name, help='', labelnames=()):
+        return self._get(Counter, name, help, labelnames)
+
+    def gauge(self, name, help='', labelnames=()):
+        return self._get(Gauge, name, help, labelnames)
+
+    def histogram(self, name, help='', labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._get(Histogram, name, help, labelnames, buckets=buckets)
+
+    def register_collector(self, collector):
+        """collector() returns fresh metrics (e.g. gauges filled from a stats() dict)"""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def collect(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        for collector in collectors:
+            try:
+                metrics.extend(collector())
+            except Exception as e:
+                print(f"Error collecting metrics: {e}")
+        return metrics
+
+    def render(self):
+        """The whole registry in OpenMetrics text format"""
+        lines = []
+        for metric in self.collect():
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            if metric.help:
+                lines.append(f"# HELP {metric.name} {_escape(metric.help)}")
+            for suffix, labels, value in metric.samples():
+                label_text = ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+                label_text = '{' + label_text + '}' if label_text else ''
+                lines.append(f"{metric.name}{suffix}{label_text} {_format_value(value)}")
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsServer:
+    """Serves the registry at http://host:port/metrics from a daemon thread"""
+
+    def __init__(self, registry, port=9464, host='127.0.0.1'):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def port(self):
+        return self.server.server_address[1]
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class MetricsFileWriter:
+    """Rewrites the registry to a text file every interval seconds (atomically, via rename).
+
+    For node_exporter's textfile collector or anything else that tails a file.
+    """
+
+    def __init__(self, registry, path, interval=15):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def write(self):
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.registry.render())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error writing metrics file: {e}")
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def close(self):
+        """Stop the writer and write a final snapshot"""
+        self._stop.set()
+        self.thread.join()
+        self.write()
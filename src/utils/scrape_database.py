@@ -0,0 +1,204 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.utils.scrape_storage import ScrapeStorage, count_elements
+
+# Rows per transaction for save_many and the JSON import
+DEFAULT_BATCH_SIZE = 500
+
+
+def default_database_path():
+    return os.path.join(str(Path.home()), "Documents", "WebScrape", "scrapes.db")
+
+
+class SQLiteScrapeStorage(ScrapeStorage):
+    """ScrapeStorage kept in one SQLite file instead of a JSON file per scrape.
+
+    Same interface: scrapes are still addressed by their save timestamp
+    (YYYYmmdd_HHMMSS_ffffff, unique per row) and load_scrapes returns the
+    same dicts, newest first.
+    The url and timestamp columns are indexed, so listing, lookups and
+    deletes no longer touch every saved scrape, and save_many writes whole
+    batches per transaction. The element count is kept in its own column so
+    list_scrapes never reads the data. A new database imports the JSON
+    scrapes already in storage_dir (see import_json_scrapes).
+    """
+
+    def __init__(self, path=None, metrics=None, tracer=None, import_json=True):
+        super().__init__(metrics, tracer)
+        self.path = path or default_database_path()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        is_new = not os.path.exists(self.path)
+
+        # The GUI saves from the main thread, batch jobs may save from workers
+        self._lock = threading.Lock()
+        # Guards the last save time, which keeps save keys unique (see _save_time)
+        self._clock_lock = threading.Lock()
+        self._last_save = None
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS scrapes (
+                id INTEGER PRIMARY KEY,
+                save_key TEXT NOT NULL,
+                url TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                element_count INTEGER,
+                data TEXT NOT NULL
+            )
+        """)
+        # Save keys address single rows; the old idx_scrapes_key allowed duplicates
+        self.conn.execute("DROP INDEX IF EXISTS idx_scrapes_key")
+        self.conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_scrapes_save_key ON scrapes (save_key)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_scrapes_url ON scrapes (url)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_scrapes_timestamp ON scrapes (timestamp)")
+        self.conn.commit()
+
+        if is_new and import_json:
+            imported = import_json_scrapes(self, self.storage_dir)
+            if imported:
+                print(f"Imported {imported} saved scrapes into {self.path}")
+
+    def _insert(self, rows, skip_existing=False):
+        """Insert (save_key, url, timestamp, element_count, data) rows in one transaction.
+
+        skip_existing leaves keys that are already stored alone.
+        """
+        verb = "INSERT OR IGNORE" if skip_existing else "INSERT"
+        sql = f"{verb} INTO scrapes (save_key, url, timestamp, element_count, data) VALUES (?, ?, ?, ?, ?)"
+        with self._lock, self.conn:
+            return self.conn.executemany(sql, rows).rowcount
+
+    def _save_time(self):
+        """Now, but always at least a microsecond after the previous save, so keys never repeat"""
+        now = datetime.now()
+        with self._clock_lock:
+            if self._last_save is not None and now <= self._last_save:
+                now = self._last_save + timedelta(microseconds=1)
+            self._last_save = now
+        return now
+
+    def _row(self, url, data, now):
+        return (now.strftime("%Y%m%d_%H%M%S_%f"), url, now.isoformat(), count_elements(data),
+                json.dumps(data))
+
+    def save_scrape(self, url, data):
+        """Save a scrape result with timestamp; returns its save timestamp"""
+        started = time.perf_counter()
+        row = self._row(url, data, self._save_time())
+        with self.tracer.span('store', url=url, path=self.path, bytes=len(row[4])):
+            self._insert([row])
+        if self.metrics is not None:
+            self._bytes_metric.inc(len(row[4]))
+        self._observe('save', started)
+        return row[0]
+
+    def save_many(self, scrapes, batch_size=DEFAULT_BATCH_SIZE):
+        """Save (url, data) pairs, batch_size rows per transaction"""
+        started = time.perf_counter()
+        rows = []
+        saved = 0
+        for url, data in scrapes:
+            rows.append(self._row(url, data, self._save_time()))
+            if len(rows) >= batch_size:
+                saved += self._insert(rows)
+                rows = []
+        if rows:
+            saved += self._insert(rows)
+        self._observe('save_many', started)
+        return saved
+
+    def _scrape(self, url, timestamp, data):
+        return {'url': url, 'timestamp': timestamp, 'data': json.loads(data)}
+
+    def list_scrapes(self):
+        """Summaries of all saved scrapes, newest first, without loading their data"""
+        started = time.perf_counter()
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT save_key, url, timestamp, element_count FROM scrapes "
+                "ORDER BY timestamp DESC, id DESC").fetchall()
+        summaries = [{'key': key, 'url': url, 'timestamp': timestamp, 'element_count': element_count}
+                     for key, url, timestamp, element_count in rows]
+        self._observe('list', started)
+        return summaries
+
+    def load_scrapes(self):
+        """Load all saved scrapes, newest first"""
+        started = time.perf_counter()
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT url, timestamp, data FROM scrapes ORDER BY timestamp DESC, id DESC").fetchall()
+        scrapes = [self._scrape(*row) for row in rows]
+        self._observe('load_all', started)
+        return scrapes
+
+    def load_scrape(self, timestamp):
+        """Load a specific scrape by timestamp"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT url, timestamp, data FROM scrapes WHERE save_key = ?", (timestamp,)).fetchone()
+        return self._scrape(*row) if row else None
+
+    def load_scrapes_for_url(self, url):
+        """Every saved scrape of url, newest first"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT url, timestamp, data FROM scrapes WHERE url = ? ORDER BY timestamp DESC, id DESC",
+                (url,)).fetchall()
+        return [self._scrape(*row) for row in rows]
+
+    def delete_scrape(self, timestamp):
+        """Delete a specific scrape by timestamp"""
+        try:
+            with self._lock, self.conn:
+                cursor = self.conn.execute("DELETE FROM scrapes WHERE save_key = ?", (timestamp,))
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            print(f"Error deleting scrape: {e}")
+            return False
+
+    def count(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM scrapes").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+def import_json_scrapes(storage, json_dir, batch_size=DEFAULT_BATCH_SIZE):
+    """Copy every scrape_*.json file in json_dir into storage; returns how many.
+
+    The files keep their save timestamps and keys already in storage are
+    skipped, so importing twice is harmless. The files are left in place;
+    unreadable ones are reported and skipped.
+    """
+    if not os.path.isdir(json_dir):
+        return 0
+    rows = []
+    imported = 0
+    for filename in sorted(os.listdir(json_dir)):
+        if not (filename.startswith('scrape_') and filename.endswith('.json')):
+            continue
+        try:
+            with open(os.path.join(json_dir, filename), 'r', encoding='utf-8') as f:
+                scrape = json.load(f)
+            data = scrape.get('data', {})
+            rows.append((filename[len('scrape_'):-len('.json')], scrape.get('url', ''),
+                         scrape['timestamp'], count_elements(data), json.dumps(data)))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error importing {filename}: {e}")
+            continue
+        if len(rows) >= batch_size:
+            imported += storage._insert(rows, skip_existing=True)
+            rows = []
+    if rows:
+        imported += storage._insert(rows, skip_existing=True)
+    return imported
@@ -1,10 +1,38 @@
 import json
 import os
+import time
 from datetime import datetime
 from pathlib import Path
+from src.utils.tracing import NULL_TRACER
+
+MANIFEST_NAME = "manifest.jsonl"
+# The manifest journal is compacted once it holds this many more lines than live entries
+MANIFEST_SLACK = 1000
+
+
+def scrape_content(data):
+    """The extracted page inside saved data (GUI saves nest it under 'content')"""
+    if isinstance(data, dict) and isinstance(data.get('content'), dict):
+        return data['content']
+    return data or {}
+
+
+def count_elements(data):
+    """Elements found in a saved scrape: class matches, headings, links, images, forms and inputs"""
+    content = scrape_content(data)
+    element_count = 0
+    for class_info in content.get('classes', {}).values():
+        element_count += class_info.get('count', 0)
+    element_count += len(content.get('headings', []))
+    element_count += len(content.get('links', []))
+    element_count += len(content.get('images', []))
+    for form in content.get('forms', []):
+        element_count += 1 + len(form.get('inputs', []))
+    return element_count
+
 
 class ScrapeStorage:
-    def __init__(self):
+    def __init__(self, metrics=None, tracer=None):
         # Get user's documents folder
         self.storage_dir = os.path.join(
             str(Path.home()), 
@@ -18,32 +46,156 @@ class ScrapeStorage:
         if not os.path.exists(self.storage_dir):
             print(f"Creating directory: {self.storage_dir}")  # Debug print
             os.makedirs(self.storage_dir, exist_ok=True)  # Added exist_ok=True for safety
+        
+        # Optional MetricsRegistry (e.g. ScrapeCore.metrics) to count storage work
+        self.metrics = metrics
+        if metrics is not None:
+            self._ops_metric = metrics.counter(
+                'webscrape_storage_operations', 'Storage operations by type', ['op'])
+            self._bytes_metric = metrics.counter(
+                'webscrape_storage_bytes_written', 'Bytes written to saved scrapes')
+            self._seconds_metric = metrics.histogram(
+                'webscrape_storage_seconds', 'Time per storage operation', ['op'])
+        # Optional Tracer; each save becomes a 'store' span
+        self.tracer = tracer or NULL_TRACER
+        # Journal of saved files (url, timestamp, element count), see list_scrapes
+        self.manifest_path = os.path.join(self.storage_dir, MANIFEST_NAME)
+        self._manifest = None
+        self._manifest_lines = 0
+        # Set when the journal ends mid-line, so the next append starts a fresh one
+        self._manifest_torn = False
+    
+    def _observe(self, op, started):
+        if self.metrics is not None:
+            self._ops_metric.inc(op=op)
+            self._seconds_metric.observe(time.perf_counter() - started, op=op)
             
     def save_scrape(self, url, data):
         """Save a scrape result with timestamp to user's documents"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        started = time.perf_counter()
+        now = datetime.now()
+        # Down to the microsecond, so saves within one second don't overwrite each other
+        timestamp = now.strftime("%Y%m%d_%H%M%S_%f")
         filename = f"scrape_{timestamp}.json"
         filepath = os.path.join(self.storage_dir, filename)
         
         scrape_data = {
             'url': url,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'data': data
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(scrape_data, f, indent=4)
+        with self.tracer.span('store', url=url, path=filepath) as span:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(scrape_data, f, indent=4)
+            size = os.path.getsize(filepath)
+            span.set(bytes=size)
             
+        if self.metrics is not None:
+            self._bytes_metric.inc(size)
+        summary = self._summary(url, scrape_data['timestamp'], data)
+        self._load_manifest()[timestamp] = summary
+        self._append_manifest(dict(summary, key=timestamp))
+        self._observe('save', started)
         return filepath
         
+    def _summary(self, url, timestamp, data):
+        return {'url': url, 'timestamp': timestamp, 'element_count': count_elements(data)}
+
+    def _load_manifest(self):
+        """Replay the manifest journal once, then keep it in memory"""
+        if self._manifest is not None:
+            return self._manifest
+        if not os.path.exists(self.manifest_path):
+            return self.rebuild_manifest()
+        self._manifest = {}
+        self._manifest_lines = 0
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    self._manifest_torn = not line.endswith('\n')
+                    try:
+                        entry = json.loads(line)
+                        key = entry.pop('key')
+                    except (ValueError, KeyError, AttributeError):
+                        # A line torn by a crash mid-append; the file itself is still listed
+                        continue
+                    self._manifest_lines += 1
+                    if entry.get('deleted'):
+                        self._manifest.pop(key, None)
+                    else:
+                        self._manifest[key] = entry
+        except OSError as e:
+            print(f"Error reading scrape manifest, rebuilding it: {e}")
+            return self.rebuild_manifest()
+        return self._manifest
+
+    def rebuild_manifest(self):
+        """Re-read every saved file into a fresh manifest.
+
+        Runs by itself when there is no manifest yet (e.g. scrapes saved by
+        older versions); call it after copying scrape files in by hand.
+        """
+        self._manifest = {}
+        for filename in os.listdir(self.storage_dir):
+            if not (filename.startswith('scrape_') and filename.endswith('.json')):
+                continue
+            key = filename[len('scrape_'):-len('.json')]
+            try:
+                scrape = self.load_scrape(key)
+                self._manifest[key] = self._summary(scrape.get('url', ''), scrape['timestamp'],
+                                                    scrape.get('data'))
+            except (OSError, ValueError, KeyError, AttributeError) as e:
+                print(f"Error reading {filename}: {e}")
+        self._compact_manifest()
+        return self._manifest
+
+    def _append_manifest(self, entry):
+        try:
+            with open(self.manifest_path, 'a', encoding='utf-8') as f:
+                f.write(('\n' if self._manifest_torn else '') + json.dumps(entry) + '\n')
+        except OSError as e:
+            print(f"Error writing scrape manifest: {e}")
+            return
+        self._manifest_torn = False
+        self._manifest_lines += 1
+        # Re-saved and deleted keys leave stale lines behind; drop them now and then
+        if self._manifest_lines > 2 * len(self._manifest) + MANIFEST_SLACK:
+            self._compact_manifest()
+
+    def _compact_manifest(self):
+        tmp_path = self.manifest_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for key, summary in self._manifest.items():
+                    f.write(json.dumps(dict(summary, key=key)) + '\n')
+            os.replace(tmp_path, self.manifest_path)
+            self._manifest_lines = len(self._manifest)
+            self._manifest_torn = False
+        except OSError as e:
+            print(f"Error writing scrape manifest: {e}")
+
+    def list_scrapes(self):
+        """Summaries of all saved scrapes, newest first, without loading their data.
+
+        Each is {'key', 'url', 'timestamp', 'element_count'}; pass key to
+        load_scrape/delete_scrape. Only the manifest is read, see rebuild_manifest.
+        """
+        started = time.perf_counter()
+        summaries = [dict(summary, key=key) for key, summary in self._load_manifest().items()]
+        self._observe('list', started)
+        return sorted(summaries, key=lambda x: x['timestamp'], reverse=True)
+
     def load_scrapes(self):
         """Load all saved scrapes"""
+        started = time.perf_counter()
         scrapes = []
         for filename in os.listdir(self.storage_dir):
-            if filename.endswith('.json'):
+            if filename.startswith('scrape_') and filename.endswith('.json'):
                 filepath = os.path.join(self.storage_dir, filename)
                 with open(filepath, 'r', encoding='utf-8') as f:
                     scrapes.append(json.load(f))
+        self._observe('load_all', started)
         return sorted(scrapes, key=lambda x: x['timestamp'], reverse=True)
         
     def load_scrape(self, timestamp):
@@ -57,14 +209,18 @@ class ScrapeStorage:
 
     def delete_scrape(self, timestamp):
         """Delete a specific scrape by timestamp"""
+        # The exact file: an older key is a prefix of every newer key saved in its second
+        filepath = os.path.join(self.storage_dir, f"scrape_{timestamp}.json")
         try:
-            # List all files in the directory
-            for filename in os.listdir(self.storage_dir):
-                if filename.endswith('.json') and timestamp in filename:
-                    filepath = os.path.join(self.storage_dir, filename)
-                    os.remove(filepath)
-                    return True
-            return False
+            try:
+                os.remove(filepath)
+                removed = True
+            except FileNotFoundError:
+                removed = False
+            # A file deleted by hand still leaves its manifest entry to drop
+            if self._load_manifest().pop(timestamp, None) is not None:
+                self._append_manifest({'key': timestamp, 'deleted': True})
+            return removed
         except Exception as e:
             print(f"Error deleting scrape: {e}")
             return False
\ No newline at end of file
@@ -8,7 +8,10 @@ class SettingsManager:
             'auto_scroll': True,
             'save_format': 'CSV',
             'highlight_elements': True,
-            'record_screenshots': False
+            'record_screenshots': False,
+            'parser_backend': 'auto',
+            'extraction_mode': 'renderer',
+            'scrape_mode': False
         }
         self.settings = self.load_settings()
     
@@ -23,6 +26,7 @@ class SettingsManager:
     def load_settings(self):
         if os.path.exists(self.settings_file):
             with open(self.settings_file, 'r') as file:
-                return json.load(file)
+                # Fill in keys added since the file was written
+                return {**self.default_settings, **json.load(file)}
         else:
             return self.default_settings.copy()
\ No newline at end of file
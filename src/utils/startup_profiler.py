@@ -0,0 +1,39 @@
+import os
+import sys
+import time
+
+ENV_FLAG = 'WEBSCRAPE_PROFILE_STARTUP'
+ARG_FLAG = '--profile-startup'
+
+
+class StartupProfiler:
+    """Records named startup phases and how long each took.
+
+    Phases are always recorded (a perf_counter call each); the report is only
+    printed when WEBSCRAPE_PROFILE_STARTUP=1 or --profile-startup is given.
+    """
+
+    def __init__(self, enabled=None):
+        if enabled is None:
+            enabled = os.environ.get(ENV_FLAG, '') not in ('', '0') or ARG_FLAG in sys.argv
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = []  # (name, seconds since previous mark, seconds since start)
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last, now - self.start))
+        self.last = now
+
+    def report(self, file=None):
+        if not self.enabled:
+            return
+        file = file or sys.stderr
+        print("Startup phases:", file=file)
+        for name, took, total in self.phases:
+            print(f"  {name:<32} {took * 1000:8.1f} ms  (at {total * 1000:8.1f} ms)", file=file)
+
+
+# Created by main.py's first import, so the clock starts before the Qt imports
+profiler = StartupProfiler()
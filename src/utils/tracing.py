@@ -0,0 +1,156 @@
+import atexit
+import json
+import os
+import random
+import threading
+import time
+
+ENV_TRACE = 'WEBSCRAPE_TRACE'
+DEFAULT_BUFFER_SPANS = 512
+
+
+class Span:
+    """One traced operation; attributes can be added while it runs"""
+    __slots__ = ('tracer', 'name', 'trace_id', 'span_id', 'parent_id', 'start', 'attrs', '_t0')
+
+    def __init__(self, tracer, name, parent, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent.span_id if parent is not None else None
+        self.trace_id = parent.trace_id if parent is not None else self.span_id
+        self.attrs = attrs
+        self.start = time.time()
+        self._t0 = time.perf_counter()
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        self.tracer._push(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer._pop(self)
+        if exc is not None:
+            self.attrs['error'] = f"{exc_type.__name__}: {exc}"
+        self.tracer._finish(self, self.start + (time.perf_counter() - self._t0))
+        return False
+
+
+class _NullSpan:
+    """Stands in for Span when tracing is off, so call sites need no checks"""
+    span_id = None
+    trace_id = None
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Writes one JSON line per finished span to path; does nothing without a path.
+
+    Spans nest per thread: a span opened inside another becomes its child.
+    Finished spans are buffered and written buffer_spans at a time (and on
+    flush/close/exit), so tracing stays cheap on the hot path. One flush at
+    a time appends to the file, so lines from concurrent workers never mix.
+    """
+
+    def __init__(self, path=None, buffer_spans=DEFAULT_BUFFER_SPANS):
+        self.path = path
+        self.enabled = bool(path)
+        self.buffer_spans = buffer_spans
+        self._buffer = []
+        self._lock = threading.Lock()
+        # Held from taking a batch until it is on disk, so batches never interleave or reorder
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        if self.enabled:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            atexit.register(self.flush)
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _push(self, span):
+        self._stack().append(span)
+
+    def _pop(self, span):
+        stack = self._stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+
+    def current(self):
+        stack = self._stack() if self.enabled else None
+        return stack[-1] if stack else None
+
+    def span(self, name, parent=None, **attrs):
+        """Context manager for a span; the parent defaults to this thread's open span"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, parent or self.current(), attrs)
+
+    def record(self, name, start, end, parent=None, **attrs):
+        """Add an already finished span (e.g. a redirect hop reconstructed afterwards)"""
+        if not self.enabled:
+            return
+        span = Span(self, name, parent or self.current(), attrs)
+        span.start = start
+        self._finish(span, end)
+
+    def _finish(self, span, end):
+        record = {
+            'trace_id': span.trace_id,
+            'span_id': span.span_id,
+            'parent_id': span.parent_id,
+            'name': span.name,
+            'start': round(span.start, 6),
+            'end': round(end, 6),
+            'duration_ms': round((end - span.start) * 1000, 3),
+        }
+        record.update(span.attrs)
+        with self._lock:
+            self._buffer.append(record)
+            if len(self._buffer) < self.buffer_spans:
+                return
+        self.flush()
+
+    def _write(self, records):
+        lines = ''.join(json.dumps(record, default=str) + '\n' for record in records)
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+        except OSError as e:
+            print(f"Error writing trace: {e}")
+
+    def flush(self):
+        with self._write_lock:
+            with self._lock:
+                records, self._buffer = self._buffer, []
+            if records:
+                self._write(records)
+
+    def close(self):
+        self.flush()
+
+
+NULL_TRACER = Tracer()
+
+
+def tracer_from_env():
+    """A Tracer writing to $WEBSCRAPE_TRACE, or the disabled NULL_TRACER"""
+    path = os.environ.get(ENV_TRACE)
+    return Tracer(path) if path else NULL_TRACER
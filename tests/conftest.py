@@ -0,0 +1,57 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class PageServer:
+    """Serves canned responses on a local port and records the requests it gets.
+
+    pages maps a path to (status, headers, body), or to a function of the request
+    headers returning one; tests may change it between requests.
+    """
+
+    def __init__(self):
+        self.pages = {}
+        self.requests = []  # (path, request headers)
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers)))
+                page = server.pages.get(self.path, (404, {}, b''))
+                status, headers, body = page(self.headers) if callable(page) else page
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}{path}"
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def page_server():
+    server = PageServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """A scratch home directory, so default caches and storage stay out of the real one"""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    return tmp_path
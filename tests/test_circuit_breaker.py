@@ -0,0 +1,57 @@
+import pytest
+
+from src.scraping.circuit_breaker import (CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError,
+                                          HostCircuitBreakers)
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+    for now in range(2):
+        breaker.failure(now)
+    breaker.success()
+    for now in range(3):
+        assert breaker.allow(now)
+        breaker.failure(now)
+    assert breaker.state == OPEN
+    assert not breaker.allow(5)
+    assert breaker.rejected == 1
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.failure(0)
+    assert breaker.allow(10)
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow(10)
+    breaker.success()
+    assert breaker.state == CLOSED and breaker.allow(11)
+
+
+def test_failed_probe_reopens_for_another_period():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.failure(0)
+    assert breaker.allow(10)
+    breaker.failure(10)
+    assert breaker.state == OPEN
+    assert not breaker.allow(19)
+    assert breaker.allow(20)
+    assert breaker.times_opened == 2
+
+
+def test_released_probe_slot_can_be_taken_again():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.failure(0)
+    assert breaker.allow(1)
+    breaker.release()
+    assert breaker.allow(1)
+
+
+def test_hosts_are_independent():
+    breakers = HostCircuitBreakers(failure_threshold=1, reset_timeout=60)
+    breakers.record_failure('down.test')
+    with pytest.raises(CircuitOpenError):
+        breakers.before_request('down.test')
+    breakers.before_request('up.test')
+    assert breakers.state('down.test') == OPEN
+    assert breakers.state('up.test') == CLOSED
+    assert breakers.stats()['down.test']['rejected'] == 1
@@ -0,0 +1,38 @@
+import pytest
+import requests
+
+from src.scraping.core import ScrapeCore
+
+
+@pytest.fixture
+def core(home):
+    core = ScrapeCore(parser_backend='html.parser', http_cache=False, result_cache=False,
+                      politeness=False, circuit_breakers=False, metrics=False)
+    yield core
+    core.close()
+
+
+PAGE = '<html><head><title>Café</title></head><body><p>naïve – déjà vu</p></body></html>'
+
+
+@pytest.mark.parametrize('content_type, body, title', [
+    # requests would guess ISO-8859-1 here; the page is UTF-8 like nearly every page today
+    ('text/html', PAGE.encode('utf-8'), 'Café'),
+    ('text/html; charset=utf-8', PAGE.encode('utf-8'), 'Café'),
+    ('text/html; charset=iso-8859-1', PAGE.replace('–', '-').encode('iso-8859-1'), 'Café'),
+    ('text/html; charset=utf8mb4', PAGE.encode('utf-8'), 'Café'),
+], ids=['no charset', 'utf-8', 'latin-1', 'unknown charset'])
+def test_buffered_and_streamed_fetches_decode_alike(core, page_server, content_type, body, title):
+    page_server.pages['/'] = (200, {'Content-Type': content_type}, body)
+    url = page_server.url('/')
+    buffered = core.scrape(url)
+    streamed = core.scrape(url, stream=True)
+    assert buffered['title'] == streamed['title'] == title
+    assert buffered['paragraphs'] == streamed['paragraphs']
+    assert 'naïve' in buffered['paragraphs'][0]
+
+
+def test_http_errors_raise(core, page_server):
+    page_server.pages['/missing'] = (404, {'Content-Type': 'text/html'}, b'gone')
+    with pytest.raises(requests.HTTPError):
+        core.scrape(page_server.url('/missing'))
@@ -0,0 +1,87 @@
+import pytest
+
+from src.scraping.core import ScrapeCore
+from src.scraping.crawler import BloomFilter, CrawlState, Crawler, normalize_url
+
+
+@pytest.fixture
+def core(home):
+    core = ScrapeCore(parser_backend='html.parser', http_cache=False, result_cache=False,
+                      politeness=False, circuit_breakers=False, metrics=False)
+    yield core
+    core.close()
+
+
+@pytest.fixture
+def site(page_server):
+    # A chain of pages: /0 links to /1, /1 to /2, ...
+    for i in range(10):
+        body = f'<html><body><p>page {i}</p><a href="/{i + 1}">next</a></body></html>'
+        page_server.pages[f'/{i}'] = (200, {'Content-Type': 'text/html'}, body.encode())
+    return page_server
+
+
+def crawl(core, site, state_path, **options):
+    crawler = Crawler(core, str(state_path), max_depth=20, **options)
+    try:
+        crawler.add_seeds([site.url('/0')])
+        return [url for url, data, error in crawler.crawl()]
+    finally:
+        crawler.close()
+
+
+def page_requests(site):
+    return [path for path, _ in site.requests if path != '/robots.txt']
+
+
+def test_crawl_follows_links_breadth_first(core, site, tmp_path):
+    urls = crawl(core, site, tmp_path / 'crawl.db', max_pages=3)
+    assert urls == [site.url(f'/{i}') for i in range(3)]
+
+
+def test_max_pages_counts_pages_of_earlier_runs(core, site, tmp_path):
+    state_path = tmp_path / 'crawl.db'
+    assert len(crawl(core, site, state_path, max_pages=3)) == 3
+    # Resuming with the same limit fetches nothing more
+    assert crawl(core, site, state_path, max_pages=3) == []
+    # A higher limit picks up where the first run stopped
+    assert crawl(core, site, state_path, max_pages=5) == [site.url('/3'), site.url('/4')]
+    assert page_requests(site) == [f'/{i}' for i in range(5)]
+
+
+def test_state_counts_fetched_pages_from_older_files(tmp_path):
+    state = CrawlState(str(tmp_path / 'crawl.db'), bloom_capacity=1000)
+    for url in ('http://a/1', 'http://a/2', 'http://a/3'):
+        state.enqueue(url, 0, 0)
+    state.claim(2)
+    state.finish('http://a/1')
+    state.finish('http://a/2', ok=False)
+    # As written before the counter existed
+    state.conn.execute("DROP TABLE meta")
+    state.close()
+
+    state = CrawlState(str(tmp_path / 'crawl.db'), bloom_capacity=1000)
+    assert state.fetched == 2
+    assert state.counts() == {'queued': 1, 'in_flight': 0, 'done': 1, 'failed': 1}
+    state.close()
+
+
+def test_seen_and_enqueue(tmp_path):
+    state = CrawlState(str(tmp_path / 'crawl.db'), bloom_capacity=1000)
+    assert state.enqueue('http://a/', 0, 0)
+    assert not state.enqueue('http://a/', 1, 1)
+    assert state.seen('http://a/') and not state.seen('http://b/')
+    state.close()
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000)
+    items = [f'http://host/{i}' for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+    assert all(item in bloom for item in items)
+
+
+def test_normalize_url():
+    assert normalize_url('HTTP://Example.COM#top') == 'http://example.com/'
+    assert normalize_url('http://a.test/p?q=1#x') == 'http://a.test/p?q=1'
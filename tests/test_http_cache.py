@@ -0,0 +1,72 @@
+import os
+
+import pytest
+import requests
+
+from src.scraping.http_cache import CachingAdapter, HTTPCache
+
+BODY = b'<html><body><p>cached page</p></body></html>'
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HTTPCache(str(tmp_path / 'cache'))
+
+
+@pytest.fixture
+def session(cache):
+    session = requests.Session()
+    session.mount('http://', CachingAdapter(cache))
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def url(page_server):
+    def page(headers):
+        if headers.get('If-None-Match') == '"v1"':
+            return 304, {'ETag': '"v1"'}, b''
+        return 200, {'Content-Type': 'text/html', 'ETag': '"v1"'}, BODY
+    page_server.pages['/page'] = page
+    return page_server.url('/page')
+
+
+def test_revalidated_page_is_served_from_cache(session, cache, page_server, url):
+    first = session.get(url)
+    assert (first.status_code, first.from_cache) == (200, False)
+    second = session.get(url)
+    assert (second.status_code, second.from_cache, second.content) == (200, True, BODY)
+    assert page_server.requests[-1][1].get('If-None-Match') == '"v1"'
+    assert cache.stats()['hits'] == 1
+
+
+def test_missing_body_refetches_the_full_page(session, cache, page_server, url):
+    session.get(url)
+    body_path, _ = cache._paths(cache.key_for(url))
+    os.remove(body_path)
+    response = session.get(url)
+    assert (response.status_code, response.content, response.from_cache) == (200, BODY, False)
+    # The retry went out without the validator and stored the page again
+    assert 'If-None-Match' not in page_server.requests[-1][1]
+    assert os.path.exists(body_path)
+
+
+def test_pages_without_validators_are_not_stored(session, cache, page_server):
+    page_server.pages['/plain'] = (200, {'Content-Type': 'text/html'}, BODY)
+    session.get(page_server.url('/plain'))
+    assert cache.stats()['entries'] == 0
+
+
+def test_lru_eviction_and_clear(tmp_path):
+    cache = HTTPCache(str(tmp_path / 'cache'), max_bytes=len(BODY) * 2)
+    response = requests.Response()
+    response.status_code = 200
+    response._content = BODY
+    response.headers['ETag'] = '"v1"'
+    for i in range(3):
+        cache.store(f'http://a/{i}', response)
+    assert cache.lookup('http://a/0') is None
+    assert cache.stats()['evictions'] == 1
+    assert HTTPCache(str(tmp_path / 'cache')).stats()['entries'] == 2
+    cache.clear()
+    assert cache.stats()['entries'] == 0 and os.listdir(tmp_path / 'cache') == []
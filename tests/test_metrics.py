@@ -0,0 +1,93 @@
+import threading
+import urllib.request
+
+from src.scraping.politeness import PolitenessScheduler
+from src.utils.metrics import MetricsFileWriter, MetricsRegistry, MetricsServer
+
+
+def test_render_counter_gauge_and_histogram():
+    registry = MetricsRegistry()
+    registry.counter('pages', 'Pages fetched', ['host']).inc(host='a.test')
+    registry.gauge('queue').set(3)
+    histogram = registry.histogram('seconds', buckets=[0.1, 1])
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    text = registry.render()
+    assert 'pages_total{host="a.test"} 1' in text
+    assert 'queue 3' in text
+    assert 'seconds_bucket{le="0.1"} 1' in text
+    assert 'seconds_bucket{le="1"} 2' in text
+    assert 'seconds_bucket{le="+Inf"} 2' in text
+    assert 'seconds_count 2' in text
+    assert text.endswith('# EOF\n')
+
+
+def test_same_name_returns_the_same_metric():
+    registry = MetricsRegistry()
+    assert registry.counter('pages') is registry.counter('pages')
+
+
+def test_failing_collector_does_not_break_rendering():
+    registry = MetricsRegistry()
+    registry.counter('pages').inc()
+
+    def broken():
+        raise RuntimeError('gone')
+    registry.register_collector(broken)
+    assert 'pages_total 1' in registry.render()
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.counter('errors', labelnames=['error']).inc(error='say "hi"\n')
+    assert 'errors_total{error="say \\"hi\\"\\n"} 1' in registry.render()
+
+
+def test_concurrent_increments_are_not_lost():
+    counter = MetricsRegistry().counter('pages')
+
+    def work():
+        for _ in range(10000):
+            counter.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert list(counter.samples()) == [('_total', {}, 40000)]
+
+
+def test_exporters(tmp_path):
+    registry = MetricsRegistry()
+    registry.counter('pages').inc()
+    server = MetricsServer(registry, port=0)
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{server.port}/metrics') as response:
+            assert 'pages_total 1' in response.read().decode('utf-8')
+    finally:
+        server.close()
+    path = str(tmp_path / 'metrics.prom')
+    MetricsFileWriter(registry, path, interval=3600).close()
+    with open(path, encoding='utf-8') as f:
+        assert 'pages_total 1' in f.read()
+
+
+def test_scheduler_stats_while_workers_update_it():
+    scheduler = PolitenessScheduler(rate=1000, burst=1000)
+
+    def work(worker):
+        for i in range(5000):
+            host = f'host{worker}-{i % 50}.test'
+            scheduler.try_acquire(host)
+            scheduler.on_success(host)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    # stats() iterates the buckets while workers add hosts; it must never raise
+    while any(thread.is_alive() for thread in threads):
+        scheduler.stats()
+    for thread in threads:
+        thread.join()
+    assert len(scheduler.stats()) == 200
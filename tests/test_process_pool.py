@@ -0,0 +1,29 @@
+import pytest
+
+from src.scraping.process_pool import ParsePool, effective_encoding, parse_document
+
+PAGE = '<html><head><title>Café</title></head><body><h1>Head</h1><p>text</p></body></html>'
+
+
+@pytest.mark.parametrize('declared, codec', [
+    (None, 'utf-8'), ('UTF8', 'utf-8'), ('latin-1', 'iso8859-1'), ('utf8mb4', 'utf-8'),
+])
+def test_effective_encoding(declared, codec):
+    assert effective_encoding(declared) == codec
+
+
+def test_unknown_charset_falls_back_to_utf8():
+    data = parse_document(PAGE.encode('utf-8'), 'utf8mb4', 'html.parser')
+    assert data['title'] == 'Café'
+
+
+def test_pool_matches_in_process_parsing():
+    documents = [(PAGE.encode('utf-8'), 'utf-8'), (PAGE, None)]
+    pool = ParsePool(workers=1)
+    try:
+        results = list(pool.map(documents, backend='html.parser'))
+    finally:
+        pool.close()
+    expected = parse_document(PAGE, None, 'html.parser')
+    assert results == [expected, expected]
+    assert expected['headings'] == [{'level': 1, 'text': 'Head'}]
@@ -0,0 +1,44 @@
+from src.scraping.core import ScrapeCore
+from src.scraping.result_cache import ResultCache
+
+PAGE = '<html><head><title>Café</title></head><body><p>x</p></body></html>'
+
+
+def test_results_are_copies():
+    cache = ResultCache()
+    key = cache.key_for(b'<p>x</p>', 'lxml')
+    cache.put(key, {'paragraphs': ['x']})
+    cache.get(key)['paragraphs'].append('changed')
+    assert cache.get(key) == {'paragraphs': ['x']}
+
+
+def test_variant_is_part_of_the_key():
+    assert ResultCache.key_for(b'<p>x</p>', 'lxml') != ResultCache.key_for(b'<p>x</p>', 'html.parser')
+    assert ResultCache.key_for('<p>x</p>', 'lxml') == ResultCache.key_for(b'<p>x</p>', 'lxml')
+
+
+def test_lru_eviction():
+    cache = ResultCache(max_entries=2)
+    for key in 'abc':
+        cache.put(key, {'key': key})
+    assert cache.get('a') is None
+    assert cache.get('c') == {'key': 'c'}
+    assert cache.stats()['evictions'] == 1
+
+
+def test_disk_tier_survives_a_new_instance(tmp_path):
+    ResultCache(disk_dir=str(tmp_path)).put('k', {'title': 't'})
+    cache = ResultCache(disk_dir=str(tmp_path))
+    assert cache.get('k') == {'title': 't'}
+    assert cache.stats()['disk_hits'] == 1
+
+
+def test_same_bytes_in_another_charset_are_parsed_again(home):
+    core = ScrapeCore(parser_backend='html.parser', http_cache=False,
+                      result_cache=ResultCache(), politeness=False, metrics=False)
+    body = PAGE.encode('utf-8')
+    assert core._extract(body, 'utf-8')['title'] == 'Café'
+    assert core._extract(body, 'iso-8859-1')['title'] == 'CafÃ©'
+    # Aliases of one codec share an entry
+    assert core._extract(body, 'UTF8')['title'] == 'Café'
+    assert core.result_cache.stats()['hits'] == 1
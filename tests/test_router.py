@@ -0,0 +1,77 @@
+import threading
+
+from src.scraping.router import BROWSER, HTTP, FetchRouter, RouteMemory, browser_reasons, text_chars
+from src.scraping.parsers import make_soup
+
+STATIC = b'<html><body>' + b'<p>' + b'word ' * 300 + b'</p></body></html>'
+SHELL = b'<html><body><div id="root"></div><script>render()</script></body></html>'
+STATIC_DATA = {'headings': [], 'paragraphs': ['word ' * 300]}
+SHELL_DATA = {'headings': [], 'paragraphs': []}
+
+
+def make_router(tmp_path, **options):
+    return FetchRouter(RouteMemory(str(tmp_path / 'routes.json')), **options)
+
+
+def test_text_chars_ignores_scripts_and_counts_any_element():
+    soup = make_soup('<body><script>var x = "hidden";</script><td>ab</td><div>c d</div></body>')
+    assert text_chars(soup) == 4
+
+
+def test_browser_reasons():
+    assert browser_reasons(STATIC, STATIC_DATA) == []
+    assert browser_reasons(SHELL, SHELL_DATA) == ['empty_body', 'framework:react']
+    assert browser_reasons(STATIC, STATIC_DATA, ['#app']) == ['missing:#app']
+
+
+def test_text_outside_paragraphs_counts():
+    page = b'<html><body>' + b'<div>' + b'word ' * 300 + b'</div></body></html>'
+    assert browser_reasons(page, SHELL_DATA) == []
+
+
+def test_host_goes_to_browser_only_after_repeated_escalations(tmp_path):
+    router = make_router(tmp_path, escalate_after=3)
+    for _ in range(2):
+        assert router.check('http://spa.test/a', SHELL, SHELL_DATA)
+    assert router.route_for('http://spa.test/b') == HTTP
+    assert router.check('http://spa.test/c', SHELL, SHELL_DATA)
+    assert router.route_for('http://spa.test/d') == BROWSER
+    assert router.stats()['escalations'] == 3
+
+
+def test_passing_page_restarts_the_count(tmp_path):
+    router = make_router(tmp_path, escalate_after=2)
+    router.check('http://mixed.test/a', SHELL, SHELL_DATA)
+    router.check('http://mixed.test/b', STATIC, STATIC_DATA)
+    router.check('http://mixed.test/c', SHELL, SHELL_DATA)
+    assert router.route_for('http://mixed.test/d') == HTTP
+
+
+def test_pages_of_http_hosts_are_still_checked(tmp_path):
+    router = make_router(tmp_path)
+    assert router.check('http://site.test/', STATIC, STATIC_DATA) == []
+    assert router.memory.get('site.test') == HTTP
+    assert router.check('http://site.test/app', SHELL, SHELL_DATA)
+
+
+def test_escalations_are_counted_across_threads(tmp_path):
+    router = make_router(tmp_path, escalate_after=10 ** 6)
+
+    def check_many():
+        for i in range(200):
+            router.check(f'http://spa.test/{i}', SHELL, SHELL_DATA)
+
+    threads = [threading.Thread(target=check_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert router.stats()['escalations'] == 800
+
+
+def test_memory_round_trip(tmp_path):
+    memory = RouteMemory(str(tmp_path / 'routes.json'))
+    memory.set('spa.test', BROWSER, ['empty_body'])
+    memory.save()
+    assert RouteMemory(str(tmp_path / 'routes.json')).get('spa.test') == BROWSER
+    assert RouteMemory(str(tmp_path / 'routes.json'), ttl=-1).get('spa.test') is None
@@ -0,0 +1,50 @@
+import pytest
+
+from src.utils.scrape_database import SQLiteScrapeStorage, import_json_scrapes
+from src.utils.scrape_storage import ScrapeStorage
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    database = SQLiteScrapeStorage(str(tmp_path / 'scrapes.db'), import_json=False)
+    yield database
+    database.close()
+
+
+def test_save_many_gives_every_row_its_own_key(database):
+    assert database.save_many([('http://a/', {'title': 'a'}), ('http://b/', {'title': 'b'})]) == 2
+    summaries = database.list_scrapes()
+    assert len({summary['key'] for summary in summaries}) == 2
+    for summary in summaries:
+        assert database.load_scrape(summary['key'])['url'] == summary['url']
+
+
+def test_delete_removes_only_the_given_scrape(database):
+    database.save_many([('http://a/', {'title': 'a'}), ('http://b/', {'title': 'b'})])
+    older = database.list_scrapes()[-1]
+    assert database.delete_scrape(older['key'])
+    assert [summary['url'] for summary in database.list_scrapes()] == ['http://b/']
+    assert database.load_scrape(older['key']) is None
+    assert not database.delete_scrape(older['key'])
+
+
+def test_list_scrapes_counts_elements(database):
+    key = database.save_scrape('http://a/', {'headings': [{'level': 1, 'text': 'H'}],
+                                             'links': [{'href': '/', 'text': 'home'}]})
+    assert database.list_scrapes() == [
+        {'key': key, 'url': 'http://a/', 'timestamp': database.load_scrape(key)['timestamp'],
+         'element_count': 2}]
+
+
+def test_json_import_skips_keys_already_stored(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    json_store = ScrapeStorage()
+    json_store.save_scrape('http://a/', {'title': 'a'})
+    database = SQLiteScrapeStorage(str(tmp_path / 'scrapes.db'))
+    try:
+        assert database.count() == 1
+        assert import_json_scrapes(database, json_store.storage_dir) == 0
+        assert database.count() == 1
+    finally:
+        database.close()
@@ -0,0 +1,65 @@
+import json
+import os
+
+import pytest
+
+from src.utils.scrape_storage import ScrapeStorage, count_elements
+
+
+@pytest.fixture
+def storage(home):
+    return ScrapeStorage()
+
+
+def write_scrape(storage, key, url):
+    with open(os.path.join(storage.storage_dir, f"scrape_{key}.json"), 'w', encoding='utf-8') as f:
+        json.dump({'url': url, 'timestamp': '2020-01-01T00:00:00', 'data': {}}, f)
+
+
+def test_saves_in_the_same_second_get_their_own_files(storage):
+    for i in range(5):
+        storage.save_scrape(f'http://a/{i}', {'title': str(i)})
+    summaries = storage.list_scrapes()
+    assert len({summary['key'] for summary in summaries}) == 5
+    for summary in summaries:
+        assert storage.load_scrape(summary['key'])['url'] == summary['url']
+
+
+def test_deleting_an_old_key_leaves_newer_files_of_that_second(storage):
+    write_scrape(storage, '20200101_000000', 'http://old/')
+    write_scrape(storage, '20200101_000000_123456', 'http://new/')
+    storage.rebuild_manifest()
+    assert storage.delete_scrape('20200101_000000')
+    assert [summary['url'] for summary in storage.list_scrapes()] == ['http://new/']
+    assert storage.load_scrape('20200101_000000_123456') is not None
+    assert not storage.delete_scrape('20200101_000000')
+
+
+def test_manifest_is_replayed_by_a_new_instance(storage):
+    storage.save_scrape('http://a/', {'links': [{'href': '/', 'text': 'x'}]})
+    storage.save_scrape('http://b/', {})
+    storage.delete_scrape(storage.list_scrapes()[0]['key'])
+    summaries = ScrapeStorage().list_scrapes()
+    assert [(summary['url'], summary['element_count']) for summary in summaries] == [('http://a/', 1)]
+
+
+def test_torn_manifest_line_is_skipped(storage):
+    storage.save_scrape('http://a/', {})
+    with open(storage.manifest_path, 'a', encoding='utf-8') as f:
+        f.write('{"key": "torn')
+    reopened = ScrapeStorage()
+    reopened.save_scrape('http://b/', {})
+    urls = sorted(summary['url'] for summary in ScrapeStorage().list_scrapes())
+    assert urls == ['http://a/', 'http://b/']
+
+
+def test_existing_files_are_listed_without_a_manifest(storage):
+    write_scrape(storage, '20200101_000000', 'http://old/')
+    assert [summary['key'] for summary in storage.list_scrapes()] == ['20200101_000000']
+    assert os.path.exists(storage.manifest_path)
+
+
+def test_count_elements_reads_gui_saves_too():
+    content = {'classes': {'a': {'count': 2}}, 'headings': [{}], 'forms': [{'inputs': [{}, {}]}]}
+    assert count_elements(content) == 6
+    assert count_elements({'content': content}) == 6
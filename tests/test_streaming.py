@@ -0,0 +1,88 @@
+from src.scraping.streaming import MAX_OPEN_ELEMENTS, StreamingExtractor, extract_stream
+
+
+def extract(html, chunk_size=7):
+    # Small chunks so tags and text get split across feeds
+    body = html.encode('utf-8')
+    return extract_stream([body[i:i + chunk_size] for i in range(0, len(body), chunk_size)])[0]
+
+
+def test_unclosed_paragraphs_close_in_document_order():
+    data = extract('<p>one<p>two<p>three<div>ab</div><h1>H</h1>')
+    assert data['paragraphs'] == ['one', 'two', 'three']
+    assert data['headings'] == [{'level': 1, 'text': 'H'}]
+
+
+def test_block_start_closes_paragraph():
+    data = extract('<p>intro<ul><li>item</ul><p>after<table><tr><td>cell</table>')
+    assert data['paragraphs'] == ['intro', 'after']
+
+
+def test_unclosed_list_items_and_cells_close_on_sibling():
+    data = extract('<ul><li class="i">a<li class="i">b<li class="i">c</ul>'
+                   '<dl><dt class="d">term<dd class="d">def</dl>'
+                   '<table><tr><td class="c">1<td class="c">2<tr><td class="c">3</table>'
+                   '<select><option class="o">x<option class="o">y</select>')
+    assert data['classes']['i']['sample_content'] == ['a', 'b', 'c']
+    assert data['classes']['d']['sample_content'] == ['term', 'def']
+    assert data['classes']['c']['sample_content'] == ['1', '2', '3']
+    assert data['classes']['o']['sample_content'] == ['x', 'y']
+
+
+def test_nested_lists_keep_outer_item_open():
+    data = extract('<ul><li class="outer">a<ul><li>b<li>c</ul> d<li class="outer">e</ul>')
+    assert data['classes']['outer']['sample_content'] == ['abc d', 'e']
+
+
+def test_nested_results_in_document_order():
+    data = extract('<div class="c"><span class="c">inner</span> outer</div>'
+                   '<a href="/1">x<b class="c">y</b></a>')
+    assert data['classes']['c']['sample_content'] == ['inner outer', 'inner', 'y']
+    assert data['links'] == [{'text': 'xy', 'href': '/1'}]
+
+
+def test_empty_classed_elements_hold_no_sample_slots():
+    extractor = StreamingExtractor()
+    for _ in range(10000):
+        extractor.feed('<i class="icon"></i><span class="icon"/>')
+    extractor.feed('<div class="icon">text</div>')
+    assert len(extractor.class_data['icon']['sample_slots']) == 1
+    extractor.close()
+    info = extractor.result()['classes']['icon']
+    assert info['count'] == 20001
+    assert info['sample_content'] == ['text']
+
+
+def test_unclosed_siblings_do_not_pile_up_on_the_stack():
+    extractor = StreamingExtractor()
+    extractor.feed('<ul>')
+    for _ in range(16000):
+        extractor.feed('<li class="i">item text here')
+        # Each <li> closes the previous one, so only <ul> and the current item stay open
+        assert len(extractor._stack) == 2
+    extractor.close()
+    assert extractor.result()['classes']['i']['count'] == 16000
+
+
+def test_deep_nesting_is_capped():
+    extractor = StreamingExtractor()
+    extractor.feed('<div class="d">' * 50000 + 'text')
+    assert len(extractor._stack) == MAX_OPEN_ELEMENTS
+    assert len(extractor._active) <= MAX_OPEN_ELEMENTS
+    extractor.close()
+    assert extractor.result()['classes']['d']['count'] == 50000
+
+
+def test_max_bytes_stops_reading_early():
+    pulled = []
+
+    def chunks():
+        for i in range(100):
+            pulled.append(i)
+            yield b'<p>' + b'x' * 96 + b'</p>'
+
+    data, bytes_read, truncated = extract_stream(chunks(), max_bytes=250)
+    assert (bytes_read, truncated) == (250, True)
+    # The third chunk crosses the limit; nothing after it is pulled
+    assert pulled == [0, 1, 2]
+    assert data['paragraphs'][:2] == ['x' * 96, 'x' * 96]